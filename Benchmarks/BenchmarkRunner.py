@@ -0,0 +1,241 @@
+import getopt
+import gc
+import json
+import logging
+import platform
+import sys
+import tracemalloc
+from statistics import median
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy
+
+from Benchmarks.Cases import BENCHMARKS, GRID, QUICK_GRID, benchmark_options, grid_cases
+
+
+class BenchmarkRunner:
+    """
+    Runs the benchmarks over the cases of a grid and reports the time and the peak memory per case.
+    Every case is timed over several repetitions, and the peak memory is measured in a separate repetition,
+    since tracing the allocations slows the code down.
+    The results can be saved as JSON and compared to the results of a stored baseline.
+    """
+
+    def __init__(self, benchmarks: Optional[Iterable[str]] = None, grid: Optional[Dict[str, List[int]]] = None,
+                 repeat: int = 5, memory: bool = True):
+        """
+        Initialize a new benchmark runner
+        Args:
+            benchmarks: The names of the benchmarks to run. Defaults to all the benchmarks.
+            grid: A dictionary mapping the parameters to their values. Defaults to the full grid.
+            repeat: The amount of timed repetitions per case
+            memory: Whether to measure the peak memory of every case
+        """
+        self.benchmarks = list(BENCHMARKS) if benchmarks is None else list(benchmarks)
+        for name in self.benchmarks:
+            if name not in BENCHMARKS:
+                raise ValueError("Unknown benchmark {}, choose from {}".format(name, ', '.join(BENCHMARKS)))
+        self.grid = GRID if grid is None else grid
+        self.repeat = max(repeat, 1)
+        self.memory = memory
+        self.results: List[Dict] = []
+
+    def run(self) -> List[Dict]:
+        """
+        Run all the benchmarks over all the cases of the grid
+        Returns:
+            A list with the result of every case
+        """
+        self.results = [
+            self.run_case(name, case) for name in self.benchmarks for case in grid_cases(self.grid)
+        ]
+        return self.results
+
+    def run_case(self, name: str, case: Dict[str, int]) -> Dict:
+        """
+        Run a benchmark for a single case
+        Args:
+            name: The name of the benchmark
+            case: The parameters of the case
+        Returns:
+            A dictionary with the benchmark, the case, the minimum and median seconds and the peak memory in bytes
+        """
+        prepare = BENCHMARKS[name](benchmark_options(**case))
+        times = []
+        for _ in range(self.repeat):
+            function = prepare()
+            gc.collect()
+            start = perf_counter()
+            function()
+            times.append(perf_counter() - start)
+
+        peak = None
+        if self.memory:
+            function = prepare()
+            gc.collect()
+            tracemalloc.start()
+            try:
+                function()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return {
+            'benchmark': name,
+            'case': dict(case),
+            'seconds': min(times),
+            'median_seconds': median(times),
+            'peak_bytes': peak,
+        }
+
+    def to_dict(self) -> Dict:
+        """
+        Export the results together with the platform they were measured on
+        Returns:
+            A dictionary with the platform, the settings and the results
+        """
+        return {
+            'platform': {
+                'python': platform.python_version(),
+                'numpy': numpy.__version__,
+                'machine': platform.machine(),
+                'system': platform.system(),
+            },
+            'repeat': self.repeat,
+            'grid': self.grid,
+            'results': self.results,
+        }
+
+    def save(self, file_name: str) -> None:
+        """
+        Save the results as JSON
+        Args:
+            file_name: The name of the file
+        """
+        with open(file_name, 'wt') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @staticmethod
+    def load(file_name: str) -> List[Dict]:
+        """
+        Load the results saved with save
+        Args:
+            file_name: The name of the file
+        Returns:
+            The list with the result of every case
+        """
+        with open(file_name, 'rt') as f:
+            return json.load(f)['results']
+
+    @staticmethod
+    def compare(results: List[Dict], baseline: List[Dict], tolerance: float = 0.25) -> List[Dict]:
+        """
+        Compare the results to the results of a baseline.
+        Only the cases that are in both results are compared.
+        Args:
+            results: The new results
+            baseline: The results of the baseline
+            tolerance: The relative increase of the time or the memory that is still accepted
+        Returns:
+            A list with the comparison of every case, with the time and memory ratios to the baseline
+            and whether the case has regressed
+        """
+        def key(result: Dict):
+            return result['benchmark'], tuple(sorted(result['case'].items()))
+
+        baseline_results = {key(result): result for result in baseline}
+        comparisons = []
+        for result in results:
+            base = baseline_results.get(key(result))
+            if base is None:
+                continue
+            time_ratio = result['seconds'] / base['seconds'] if base['seconds'] > 0 else float('inf')
+            memory_ratio = None
+            if result['peak_bytes'] is not None and base['peak_bytes']:
+                memory_ratio = result['peak_bytes'] / base['peak_bytes']
+            comparisons.append({
+                'benchmark': result['benchmark'],
+                'case': result['case'],
+                'time_ratio': time_ratio,
+                'memory_ratio': memory_ratio,
+                'regressed': time_ratio > 1 + tolerance or (memory_ratio is not None and memory_ratio > 1 + tolerance),
+            })
+        return comparisons
+
+
+def usage():
+    print("""
+    Usage: python -m Benchmarks.BenchmarkRunner [options]
+             -q, --quick  Run the small grid instead of the full grid
+             -b, --benchmarks  Comma separated names of the benchmarks to run: {}
+             -r, --repeat  Amount of timed repetitions per case
+             -o, --output  Save the results to the JSON file
+             -B, --baseline  Compare the results to the results in the JSON file
+             -T, --tolerance  Accepted relative increase compared to the baseline
+             -m, --no-memory  Do not measure the peak memory
+    """.format(', '.join(BENCHMARKS)))
+
+
+def main():
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "hqb:r:o:B:T:m", [
+            "help", "quick", "benchmarks=", "repeat=", "output=", "baseline=", "tolerance=", "no-memory"])
+    except getopt.GetoptError as err:
+        print(err)
+        usage()
+        sys.exit(2)
+
+    grid = GRID
+    benchmarks = None
+    repeat = 5
+    output = None
+    baseline = None
+    tolerance = 0.25
+    memory = True
+    for o, a in opts:
+        if o in ("-q", "--quick"):
+            grid = QUICK_GRID
+        elif o in ("-b", "--benchmarks"):
+            benchmarks = a.split(',')
+        elif o in ("-r", "--repeat"):
+            repeat = int(a)
+        elif o in ("-o", "--output"):
+            output = a
+        elif o in ("-B", "--baseline"):
+            baseline = a
+        elif o in ("-T", "--tolerance"):
+            tolerance = float(a)
+        elif o in ("-m", "--no-memory"):
+            memory = False
+        elif o in ("-h", "--help"):
+            usage()
+            sys.exit()
+
+    # The simulation logs would dominate the measured times
+    logging.disable()
+    runner = BenchmarkRunner(benchmarks, grid, repeat, memory)
+    for name in runner.benchmarks:
+        for case in grid_cases(grid):
+            result = runner.run_case(name, case)
+            runner.results.append(result)
+            print("{:<20} {:<100} {:>10.4f} s {:>12}".format(
+                name, json.dumps(case), result['seconds'],
+                'n/a' if result['peak_bytes'] is None else '{} B'.format(result['peak_bytes'])))
+
+    if output is not None:
+        runner.save(output)
+        print("Saved the results to {}".format(output))
+
+    if baseline is not None:
+        comparisons = BenchmarkRunner.compare(runner.results, BenchmarkRunner.load(baseline), tolerance)
+        regressions = [c for c in comparisons if c['regressed']]
+        for comparison in regressions:
+            print("Regression in {} {}: time x{:.2f}, memory x{}".format(
+                comparison['benchmark'], json.dumps(comparison['case']), comparison['time_ratio'],
+                'n/a' if comparison['memory_ratio'] is None else '{:.2f}'.format(comparison['memory_ratio'])))
+        print("{} of {} cases regressed compared to {}".format(len(regressions), len(comparisons), baseline))
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+from itertools import product
+from typing import Callable, Dict, Iterator, List
+
+from numpy.random import default_rng
+
+from Components.Station import Station
+from Distributions.NormalDistribution import NormalDistribution
+from Events.PrepareTrainEvent import PrepareTrainEvent
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+from Runtimes.EventQueue import EventQueue
+from Runtimes.EventRunTime import EventRunTime
+from Runtimes.RandomStreams import RandomStreams
+
+# The grid the benchmarks are run over, the full grid is the product of the values
+GRID: Dict[str, List[int]] = {
+    'station_sector_count': [16, 32, 64],
+    'train_amount_of_sets': [2, 4, 8],
+    'station_sector_passenger_max_count': [50, 100, 200],
+}
+
+# A small grid that runs in seconds, e.g. to check a change before running the full grid
+QUICK_GRID: Dict[str, List[int]] = {
+    'station_sector_count': [16, 32],
+    'train_amount_of_sets': [2],
+    'station_sector_passenger_max_count': [50, 100],
+}
+
+# The car setup of the default options, repeated for longer trains
+TRAIN_FULLNESS = [30, 40, 25, 33, 52, 30, 25, 60]
+TRAIN_UNLOAD_PERCENT = [30, 30, 30, 30, 30, 30, 30, 30]
+TRAIN_SET_SETUP = 4
+
+
+def benchmark_options(station_sector_count: int, train_amount_of_sets: int,
+                      station_sector_passenger_max_count: int, seed: int = 30) -> Dict:
+    """
+    Create the simulation options of a benchmark case.
+    The options are those of Main, scaled to the amount of sectors and train sets:
+    the stairs are placed at a fifth from both ends of the station and the train parks in the middle.
+    The benchmarks always run with lights, so the passenger decisions are part of the event chain.
+    Args:
+        station_sector_count: The amount of station sectors
+        train_amount_of_sets: The amount of train sets, each with four cars
+        station_sector_passenger_max_count: The maximum amount of passengers per sector
+        seed: The environment random seed
+    Raises:
+        ValueError: Thrown if the train is longer than the station
+    Returns:
+        The simulation options
+    """
+    cars = train_amount_of_sets * TRAIN_SET_SETUP
+    if cars > station_sector_count:
+        raise ValueError("A train with {} cars does not fit in {} sectors".format(cars, station_sector_count))
+    return {
+        "passenger_weight_distribution": NormalDistribution(80, 10),
+        "passenger_mean_weight": 80,
+        "passenger_speed_range": range(5, 5),
+        "passenger_loading_time_range": range(4, 4),
+        "passenger_regular_size": 0.5,
+        "passenger_max_walk_range": range(16, 16),
+        "passenger_compliance": 1,
+        "passenger_store": "list",
+        "train_capacity": 100,
+        "train_fullness": [TRAIN_FULLNESS[i % len(TRAIN_FULLNESS)] for i in range(cars)],
+        "train_unload_percent": [TRAIN_UNLOAD_PERCENT[i % len(TRAIN_UNLOAD_PERCENT)] for i in range(cars)],
+        "train_set_setup": TRAIN_SET_SETUP,
+        "train_amount_of_sets": train_amount_of_sets,
+        "train_park_at_index": (station_sector_count - cars) // 2,
+        "station_sector_count": station_sector_count,
+        "station_distance": 3.0,
+        "station_stairs_placement": [station_sector_count // 5, station_sector_count - 1 - station_sector_count // 5],
+        "station_sector_passenger_max_count": station_sector_passenger_max_count,
+        "station_sector_fullness": range(20, 30),
+        "station_stair_factor": 1.5,
+        "station_light_thresholds": {"green": .5, "yellow": .75},
+        "station_have_lights": True,
+        "time_send_weight_event": 0,
+        "time_receive_weight_event": 0,
+        "time_door_action": 4,
+        "environment_random_seed": seed
+    }
+
+
+def grid_cases(grid: Dict[str, List[int]]) -> Iterator[Dict[str, int]]:
+    """
+    Get the cases of a grid, skipping the trains that do not fit in the station
+    Args:
+        grid: A dictionary mapping the parameter to its values
+    Returns:
+        An iterator of dictionaries mapping each parameter to its value in the case
+    """
+    keys = list(grid.keys())
+    for values in product(*(grid[key] for key in keys)):
+        case = dict(zip(keys, values))
+        if case['train_amount_of_sets'] * TRAIN_SET_SETUP <= case['station_sector_count']:
+            yield case
+
+
+def application(options: Dict) -> Callable[[], Callable[[], None]]:
+    """
+    The full pipeline: populating the environment and running the event chain
+    """
+    return lambda: ApplicationRunTime(options).run
+
+
+def populate_station(options: Dict) -> Callable[[], Callable[[], None]]:
+    """
+    Populating the station sectors with passengers
+    """
+    configuration = Configuration(options)
+    return lambda: Station(configuration, RandomStreams(configuration.environment_random_seed).station,
+                           populate=False).populate
+
+
+def passenger_decision(options: Dict) -> Callable[[], Callable[[], None]]:
+    """
+    The passengers on the whole station deciding where to go after the lights have changed
+    """
+    return _fire_at(options, 'PassengerDecisionEvent')
+
+
+def load_passengers(options: Dict) -> Callable[[], Callable[[], None]]:
+    """
+    Loading the passengers of the first sector into its train car
+    """
+    return _fire_at(options, 'LoadPassengerEvent')
+
+
+def event_queue(options: Dict) -> Callable[[], Callable[[], None]]:
+    """
+    Scheduling and popping an event per passenger the station can hold, in random order
+    """
+    configuration = Configuration(options)
+    amount = configuration.station_sector_count * configuration.station_sector_passenger_max_count
+    timestamps = default_rng(configuration.environment_random_seed).random(amount) * 1000
+    events = [PrepareTrainEvent(float(timestamp), configuration) for timestamp in timestamps]
+
+    def run() -> None:
+        queue = EventQueue()
+        queue.push_all(events)
+        while queue:
+            queue.get_next()
+    return lambda: run
+
+
+def _fire_at(options: Dict, event: str) -> Callable[[], Callable[[], None]]:
+    """
+    Run the event chain until the event, and fire the event on a fork of the environment in every repetition
+    """
+    configuration = Configuration(options)
+    checkpoint = EventRunTime(configuration, Environment(configuration)).run_until(event)
+
+    def prepare() -> Callable[[], None]:
+        environment, queue = checkpoint.fork()
+        next_event = queue.pop()
+        return lambda: next_event(environment)
+    return prepare
+
+
+# The benchmarks by name. A benchmark does the setup shared by the repetitions of a case
+# and returns a function that prepares a repetition. The prepared function is the part that is timed.
+BENCHMARKS: Dict[str, Callable[[Dict], Callable[[], Callable[[], None]]]] = {
+    'application': application,
+    'populate_station': populate_station,
+    'passenger_decision': passenger_decision,
+    'load_passengers': load_passengers,
+    'event_queue': event_queue,
+}
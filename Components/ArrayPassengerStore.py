@@ -0,0 +1,129 @@
+from typing import Dict, Iterable
+
+import numpy as np
+from numpy.random import Generator
+
+from Components.PassengerArray import PassengerArray, PASSENGER_COLUMNS
+from Components.PassengerStore import PassengerStore
+from Runtimes.Configuration import Configuration
+
+# Zero capacity columns shared by all empty stores. Never written to, since adding to a store
+# without room always moves the rows to a new buffer first.
+_EMPTY_COLUMNS: Dict[str, np.ndarray] = PassengerArray.empty(0).columns
+
+
+class ArrayPassengerStore(PassengerStore):
+    """
+    Passenger store that keeps the passengers as numpy columns (struct of arrays)
+    instead of individual passenger objects.
+    The columns live in a buffer that grows by doubling, and the live passengers
+    are the rows between the head and the tail of the buffer.
+    """
+    INITIAL_CAPACITY = 16
+
+    def __init__(self):
+        """
+        Initialize the array store. Defaults to an empty store.
+        The buffer is only allocated once the first passengers are added.
+        """
+        self.__columns: Dict[str, np.ndarray] = _EMPTY_COLUMNS
+        self.__head = 0
+        self.__tail = 0
+
+    @property
+    def amount(self) -> int:
+        return self.__tail - self.__head
+
+    @property
+    def weight(self) -> float:
+        """
+        Get the total weight of the passengers in the store, summed over the weight column of the live rows
+        Returns:
+            The summed weight of the passengers
+        """
+        return float(self.__columns['weight'][self.__head:self.__tail].sum())
+
+    @property
+    def passengers(self) -> PassengerArray:
+        """
+        Get a snapshot of the passengers in the store
+        Returns:
+            A PassengerArray with a copy of the passengers.
+            Changing the store afterwards does not change the snapshot.
+        """
+        return PassengerArray({n: c[self.__head:self.__tail].copy() for n, c in self.__columns.items()})
+
+    def populate(self, amount: int, configuration: Configuration, generator: Generator) -> None:
+        self.extend(PassengerArray.generate(configuration, amount, generator))
+
+    def append(self, passenger) -> None:
+        self.extend([passenger])
+
+    def extend(self, passengers: Iterable) -> None:
+        if not isinstance(passengers, PassengerArray):
+            passengers = PassengerArray.from_passengers(passengers)
+        amount = len(passengers)
+        self.__reserve(amount)
+        for name, column in passengers.columns.items():
+            self.__columns[name][self.__tail:self.__tail + amount] = column
+        self.__tail += amount
+
+    def remove(self, amount: int) -> PassengerArray:
+        """
+        Remove passengers from the front of the store
+        Args:
+            amount: The amount of passengers to remove
+        Returns:
+            A PassengerArray viewing the removed rows. The rows are never written to again,
+            so no copy is needed.
+        """
+        amount = max(0, min(int(amount), self.amount))
+        removed = PassengerArray({n: c[self.__head:self.__head + amount] for n, c in self.__columns.items()})
+        self.__head += amount
+        return removed
+
+    def copy(self) -> 'ArrayPassengerStore':
+        """
+        Create a copy of the store holding a compact copy of the live rows
+        Returns:
+            A new array store with the same passengers
+        """
+        store = ArrayPassengerStore()
+        store.__columns = {n: c[self.__head:self.__tail].copy() for n, c in self.__columns.items()}
+        store.__tail = self.amount
+        return store
+
+    def remove_passenger(self, passenger) -> None:
+        """
+        Remove the passenger with the same id as the provided passenger
+        Args:
+            passenger: The passenger to remove
+        """
+        positions = np.flatnonzero(self.__columns['id'][self.__head:self.__tail] == passenger.id)
+        if len(positions) == 0:
+            return
+        index = self.__head + positions[0]
+        # Shift the rows after the passenger one place towards the front
+        for column in self.__columns.values():
+            column[index:self.__tail - 1] = column[index + 1:self.__tail]
+        self.__tail -= 1
+
+    def __reserve(self, amount: int) -> None:
+        """
+        Make sure there is room for the provided amount of passengers after the tail.
+        If there is not enough room, the live rows are moved to a new buffer with double the size.
+        The old buffer is left untouched, so removed rows that are still being viewed stay valid.
+        Args:
+            amount: The amount of passengers that will be added
+        """
+        capacity = len(self.__columns['id'])
+        if self.__tail + amount <= capacity:
+            return
+        live = self.amount
+        new_capacity = max(ArrayPassengerStore.INITIAL_CAPACITY, 2 * (live + amount))
+        columns = {n: np.empty(new_capacity, dtype=dtype) for n, dtype in PASSENGER_COLUMNS.items()}
+        for name, column in columns.items():
+            column[:live] = self.__columns[name][self.__head:self.__tail]
+        self.__columns = columns
+        self.__head = 0
+        self.__tail = live
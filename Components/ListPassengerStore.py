@@ -0,0 +1,163 @@
+from typing import Dict, Iterable, List
+
+from numpy.random import Generator
+
+from Components.Passenger import Passenger
+from Components.PassengerArray import PassengerArray
+from Components.PassengerStore import PassengerStore
+from Runtimes.Configuration import Configuration
+
+# Placeholder left in the list where a passenger was removed from the middle
+_REMOVED = object()
+
+
+class ListPassengerStore(PassengerStore):
+    """
+    Passenger store that keeps the passenger objects in a Python list.
+    The list works as a queue: removing from the front moves a head offset instead of
+    shifting the list, and removing a specific passenger leaves a placeholder behind.
+    An index from the passenger identity to its position makes the specific removal O(1).
+    The list is compacted once more than half of it is removed space, so all operations are O(1) amortised.
+    The total weight of the passengers is kept up to date as passengers are added and removed.
+    """
+    # Do not bother compacting lists with fewer removed places than this
+    COMPACT_THRESHOLD = 32
+
+    def __init__(self):
+        """
+        Initialize the list store. Defaults to an empty store.
+        """
+        self.__passengers: List = []
+        # Position of the first passenger in the list
+        self.__head = 0
+        # Amount of placeholders after the head
+        self.__holes = 0
+        # Maps id(passenger) to the position in the list.
+        # Positions before the head are stale and are validated on lookup.
+        self.__index: Dict[int, int] = dict()
+        # Summed weight of the passengers in the store
+        self.__weight = 0.0
+
+    @property
+    def amount(self) -> int:
+        return len(self.__passengers) - self.__head - self.__holes
+
+    @property
+    def weight(self) -> float:
+        return self.__weight
+
+    @property
+    def passengers(self) -> List:
+        """
+        Get the passengers in the store
+        Returns:
+            The list of passengers. The list must not be modified.
+        """
+        if self.__head > 0 or self.__holes > 0:
+            self.__compact()
+        return self.__passengers
+
+    def populate(self, amount: int, configuration: Configuration, generator: Generator) -> None:
+        # Draw all the attributes at once, and only create the passenger objects from the drawn values
+        drawn = PassengerArray.generate(configuration, amount, generator)
+        self.extend([
+            Passenger(configuration, speed=speed, loading_time=loading_time, weight=weight, max_walk=max_walk, id=id)
+            for id, speed, loading_time, weight, max_walk in zip(
+                drawn.ids.tolist(), drawn.speeds.tolist(), drawn.loading_times.tolist(), drawn.weights.tolist(),
+                drawn.max_walks.tolist())
+        ])
+
+    def append(self, passenger) -> None:
+        self.__index[id(passenger)] = len(self.__passengers)
+        self.__passengers.append(passenger)
+        self.__weight += passenger.weight
+
+    def extend(self, passengers: Iterable) -> None:
+        start = len(self.__passengers)
+        self.__passengers.extend(passengers)
+        weight = 0
+        for position in range(start, len(self.__passengers)):
+            passenger = self.__passengers[position]
+            self.__index[id(passenger)] = position
+            weight += passenger.weight
+        self.__weight += weight
+
+    def remove(self, amount: int) -> List:
+        """
+        Remove passengers from the front of the store
+        Args:
+            amount: The amount of passengers to remove
+        Returns:
+            A list with the removed passengers. Is a single slice of the store
+            unless passengers have been removed from the middle of the store.
+        """
+        if amount <= 0 or self.amount == 0:
+            return []
+
+        if self.__holes == 0:
+            end = min(self.__head + amount, len(self.__passengers))
+            removed = self.__passengers[self.__head:end]
+            self.__head = end
+        else:
+            removed = []
+            while len(removed) < amount and self.__head < len(self.__passengers):
+                passenger = self.__passengers[self.__head]
+                self.__head += 1
+                if passenger is _REMOVED:
+                    self.__holes -= 1
+                else:
+                    removed.append(passenger)
+
+        self.__weight -= sum(passenger.weight for passenger in removed)
+        self.__compact_if_needed()
+        return removed
+
+    def copy(self) -> 'ListPassengerStore':
+        """
+        Create a copy of the store. Only the list is copied, the passenger objects are shared,
+        since the passengers themselves are never changed by the simulation.
+        Returns:
+            A new list store with the same passengers
+        """
+        store = ListPassengerStore()
+        store.extend(self.passengers)
+        return store
+
+    def remove_passenger(self, passenger) -> None:
+        position = self.__index.get(id(passenger))
+        # The position is stale if it is before the head or points to another object
+        if position is None or position < self.__head or self.__passengers[position] is not passenger:
+            return
+        self.__passengers[position] = _REMOVED
+        del self.__index[id(passenger)]
+        self.__holes += 1
+        self.__weight -= passenger.weight
+        self.__compact_if_needed()
+
+    def __compact_if_needed(self) -> None:
+        """
+        Compact the list if it is empty or more than half of it is removed space
+        """
+        removed_space = self.__head + self.__holes
+        if removed_space == 0:
+            return
+        if self.amount == 0:
+            # Do not let rounding errors of the removed weights build up in an empty store
+            self.__weight = 0.0
+        if self.amount == 0 or (removed_space >= ListPassengerStore.COMPACT_THRESHOLD
+                                and removed_space * 2 >= len(self.__passengers)):
+            self.__compact()
+
+    def __compact(self) -> None:
+        """
+        Move the passengers to a new list without the removed space and rebuild the index.
+        A new list is created, so lists returned earlier are not changed.
+        """
+        if self.__holes > 0:
+            passengers = [p for p in self.__passengers[self.__head:] if p is not _REMOVED]
+        else:
+            passengers = self.__passengers[self.__head:]
+        self.__passengers = passengers
+        self.__head = 0
+        self.__holes = 0
+        self.__index = {id(p): i for i, p in enumerate(passengers)}
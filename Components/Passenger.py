@@ -1,32 +1,65 @@
-import random
+from typing import Optional
 
-from Components.Component import Component
+from numpy.random import Generator
+
+from Components.PassengerArray import next_passenger_ids
 from Helpers.Ranges import random_between_range
 from Runtimes.Configuration import Configuration
-from uuid import UUID, uuid4
 
 
-class Passenger(Component):
+class Passenger:
     """
     This class represents a passenger that will be on the station or in the train.
+    Passengers are created by the thousand and never log, so they are plain slotted records
+    instead of components: no logger and no attribute dictionary per passenger.
     """
+    __slots__ = ('id', 'speed', 'loading_time', 'weight', 'size', 'max_walk', 'configuration')
 
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, generator: Optional[Generator] = None,
+                 speed: float = None, loading_time: float = None, weight: float = None, max_walk: float = None,
+                 id: Optional[int] = None):
         """
-        Initialize a new passenger component
+        Initialize a new passenger.
+        The attributes that are not provided are drawn from the generator.
+        Args:
+            configuration: The simulation configuration
+            generator: The random generator to draw the passenger attributes from.
+                Must be provided unless all the attributes are provided.
+            speed: Optional speed of the passenger, if it has already been drawn
+            loading_time: Optional loading time of the passenger, if it has already been drawn
+            weight: Optional weight of the passenger, if it has already been drawn
+            max_walk: Optional max walk of the passenger, if it has already been drawn
+            id: Optional sequential id of the passenger, if it has already been reserved
+        Raises:
+            TypeError: Thrown if an attribute has to be drawn and no generator is provided
         """
-        self.id: UUID = uuid4()
-        self.speed = random_between_range(configuration.environment_random_seed, configuration.passenger_speed_range)
-        self.loading_time = random_between_range(configuration.environment_random_seed, configuration.passenger_loading_time_range)
-        self.weight = configuration.passenger_weight_distribution.generate_single()
+        if generator is None and None in (speed, loading_time, weight, max_walk):
+            raise TypeError("You must provide a random generator to draw the passenger attributes that are not given.")
+        self.id: int = int(next_passenger_ids(1)[0]) if id is None else id
+        self.speed = random_between_range(generator, configuration.passenger_speed_range) \
+            if speed is None else speed
+        self.loading_time = random_between_range(generator, configuration.passenger_loading_time_range) \
+            if loading_time is None else loading_time
+        self.weight = configuration.passenger_weight_distribution.generate_single(generator) \
+            if weight is None else weight
         self.size = configuration.passenger_regular_size
-        self.max_walk = random_between_range(configuration.environment_random_seed, configuration.passenger_max_walk_range)
-        super().__init__(configuration)
+        self.max_walk = random_between_range(generator, configuration.passenger_max_walk_range) \
+            if max_walk is None else max_walk
+        self.configuration = configuration
+
+    def __repr__(self):
+        return self.__str__()
 
     def __str__(self):
         return "Passenger (s: {}, lt: {}, w: {}, sz: {}, mw: {})".format(
             self.speed, self.loading_time, self.weight, self.size, self.max_walk)
 
-    def is_compliant(self) -> bool:
-        random.seed(self.configuration.environment_random_seed)
-        return random.random() <= self.configuration.passenger_compliance
+    def is_compliant(self, generator: Generator) -> bool:
+        """
+        Draw whether the passenger complies with the station lights
+        Args:
+            generator: The random generator to draw from (usually the compliance stream)
+        Returns:
+            True if the passenger complies, False if not
+        """
+        return generator.random() <= self.configuration.passenger_compliance
@@ -0,0 +1,204 @@
+from typing import Dict, Iterable, Iterator, List, Union
+
+import numpy as np
+from numpy.random import Generator
+
+from Helpers.Ranges import random_between_range
+from Runtimes.Configuration import Configuration
+
+# The columns stored for every passenger, mapped to their numpy data type
+PASSENGER_COLUMNS: Dict[str, type] = {
+    'id': np.int64,
+    'speed': np.float64,
+    'loading_time': np.float64,
+    'weight': np.float64,
+    'size': np.float64,
+    'max_walk': np.float64,
+}
+
+# The next sequential id handed out to passengers that do not already have an integer id
+_next_passenger_id = 0
+
+
+def next_passenger_ids(amount: int) -> np.ndarray:
+    """
+    Reserve the provided amount of sequential passenger ids
+    Args:
+        amount: The amount of ids to reserve
+    Returns:
+        An array with the reserved ids
+    """
+    global _next_passenger_id
+    ids = np.arange(_next_passenger_id, _next_passenger_id + amount, dtype=np.int64)
+    _next_passenger_id += amount
+    return ids
+
+
+class PassengerRecord:
+    """
+    Lightweight read-only view of a single passenger stored in a PassengerArray.
+    Has the same attributes as the Passenger component.
+    """
+    __slots__ = ('id', 'speed', 'loading_time', 'weight', 'size', 'max_walk')
+
+    def __init__(self, id: int, speed: float, loading_time: float, weight: float, size: float, max_walk: float):
+        self.id = id
+        self.speed = speed
+        self.loading_time = loading_time
+        self.weight = weight
+        self.size = size
+        self.max_walk = max_walk
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return "Passenger (s: {}, lt: {}, w: {}, sz: {}, mw: {})".format(
+            self.speed, self.loading_time, self.weight, self.size, self.max_walk)
+
+
+class PassengerArray:
+    """
+    Columnar batch of passengers. Every passenger attribute is stored in its own numpy array,
+    so aggregate operations over the passengers can be vectorized.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """
+        Initialize a new passenger array
+        Args:
+            columns: A dictionary with a numpy array for each of the PASSENGER_COLUMNS.
+                All the arrays must have the same length.
+        """
+        lengths = {len(columns[name]) for name in PASSENGER_COLUMNS}
+        if len(lengths) > 1:
+            raise ValueError("All the passenger columns must have the same length")
+        self.__columns = {name: columns[name] for name in PASSENGER_COLUMNS}
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return 'PassengerArray ({} passengers)'.format(len(self))
+
+    def __len__(self) -> int:
+        return len(self.__columns['id'])
+
+    def __iter__(self) -> Iterator[PassengerRecord]:
+        return (PassengerRecord(*values) for values in zip(*(self.__columns[n].tolist() for n in PASSENGER_COLUMNS)))
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[PassengerRecord, 'PassengerArray']:
+        """
+        Get a single passenger by index, or a new PassengerArray by slice
+        Args:
+            item: The index or slice
+        Raises:
+            IndexError: Thrown if the index is out of range
+        Returns:
+            A PassengerRecord if an index is provided, otherwise a PassengerArray
+        """
+        if isinstance(item, slice):
+            return PassengerArray({name: column[item] for name, column in self.__columns.items()})
+        return PassengerRecord(*(self.__columns[name][item].item() for name in PASSENGER_COLUMNS))
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get the passenger columns
+        Returns:
+            A dictionary mapping the column name to the numpy array
+        """
+        return self.__columns
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.__columns['id']
+
+    @property
+    def speeds(self) -> np.ndarray:
+        return self.__columns['speed']
+
+    @property
+    def loading_times(self) -> np.ndarray:
+        return self.__columns['loading_time']
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self.__columns['weight']
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self.__columns['size']
+
+    @property
+    def max_walks(self) -> np.ndarray:
+        return self.__columns['max_walk']
+
+    @staticmethod
+    def empty(size: int = 0) -> 'PassengerArray':
+        """
+        Create a passenger array with uninitialized columns
+        Args:
+            size: The amount of passengers in the array
+        Returns:
+            The new passenger array
+        """
+        return PassengerArray({name: np.empty(size, dtype=dtype) for name, dtype in PASSENGER_COLUMNS.items()})
+
+    @staticmethod
+    def from_passengers(passengers: Iterable) -> 'PassengerArray':
+        """
+        Create a passenger array from passenger objects.
+        Passengers that do not have an integer id will be given a new sequential id.
+        Args:
+            passengers: The passengers (Passenger or PassengerRecord objects) to store
+        Returns:
+            The new passenger array
+        """
+        passengers: List = list(passengers)
+        columns = {
+            name: np.fromiter((getattr(p, name) for p in passengers), dtype=dtype, count=len(passengers))
+            for name, dtype in PASSENGER_COLUMNS.items() if name != 'id'
+        }
+        columns['id'] = np.fromiter(
+            (p.id if isinstance(p.id, (int, np.integer)) else next_passenger_ids(1)[0] for p in passengers),
+            dtype=np.int64,
+            count=len(passengers)
+        )
+        return PassengerArray(columns)
+
+    @staticmethod
+    def generate(configuration: Configuration, amount: int, generator: Generator) -> 'PassengerArray':
+        """
+        Draw the attributes for the provided amount of new passengers all at once
+        Args:
+            configuration: The configuration the passengers are spawned with
+            amount: The amount of passengers to spawn
+            generator: The random generator to draw the passenger attributes from
+        Returns:
+            A passenger array with the new passengers
+        """
+        return PassengerArray({
+            'id': next_passenger_ids(amount),
+            'speed': random_between_range(generator, configuration.passenger_speed_range, amount).astype(np.float64),
+            'loading_time': random_between_range(
+                generator, configuration.passenger_loading_time_range, amount).astype(np.float64),
+            'weight': np.asarray(configuration.passenger_weight_distribution.generate_series(amount, generator),
+                                 dtype=np.float64),
+            'size': np.full(amount, configuration.passenger_regular_size, dtype=np.float64),
+            'max_walk': random_between_range(
+                generator, configuration.passenger_max_walk_range, amount).astype(np.float64),
+        })
+
+    @staticmethod
+    def concatenate(arrays: List['PassengerArray']) -> 'PassengerArray':
+        """
+        Concatenate the passenger arrays into a single passenger array
+        Args:
+            arrays: The passenger arrays to concatenate
+        Returns:
+            The concatenated passenger array
+        """
+        if len(arrays) == 0:
+            return PassengerArray.empty()
+        return PassengerArray({name: np.concatenate([a.columns[name] for a in arrays]) for name in PASSENGER_COLUMNS})
@@ -1,19 +1,36 @@
-from typing import List, Union
+from numbers import Integral
+from typing import Callable, List, Optional, Union
 
+from numpy.random import Generator
+
+from Components.ArrayPassengerStore import ArrayPassengerStore
+from Components.ListPassengerStore import ListPassengerStore
 from Components.Passenger import Passenger
+from Components.PassengerArray import PassengerArray, PassengerRecord
+from Components.PassengerStore import PassengerStore
 from Runtimes.Configuration import Configuration
 
 
 class PassengerContainer:
     """
     Class that makes it possible to handle passengers.
+    The passengers are kept in a passenger store, which is chosen by the
+    **passenger_store** option: 'list' for passenger objects or 'array' for numpy columns.
     """
+    STORES = {
+        'list': ListPassengerStore,
+        'array': ArrayPassengerStore,
+    }
 
-    def __init__(self):
+    def __init__(self, configuration: Configuration = None):
         """
         Initialize the passenger container. Defaults to an empty container.
+        Args:
+            configuration: Optional configuration deciding which passenger store to use.
+                Will default to the list store if not provided.
         """
-        self.__passengers = []
+        self.__store: PassengerStore = PassengerContainer.__create_store(configuration)
+        self.__watchers: List[Callable[['PassengerContainer', int, int], None]] = []
 
     def __repr__(self):
         return self.__str__()
@@ -28,58 +45,75 @@ class PassengerContainer:
         Returns:
             The amount of passengers in the container
         """
-        return len(self.__passengers)
+        return self.__store.amount
+
+    @property
+    def passengers(self) -> Union[List[Passenger], PassengerArray]:
+        """
+        Get the passengers that live inside this container
+        Returns:
+            :rtype: list[Passenger] The list of passengers, or a PassengerArray for the array store
+        """
+        return self.__store.passengers
 
     @property
-    def passengers(self) -> List[Passenger]:
+    def store(self) -> PassengerStore:
         """
-        Get the list of passengers that live inside this container
+        Get the passenger store behind this container
         Returns:
-            :rtype: list[Passenger] The list of passengers
+            The passenger store
         """
-        return self.__passengers
+        return self.__store
 
-    def add(self, passengers: Union[int, Passenger, List[Passenger]], configuration: Configuration = None) -> None:
+    def watch(self, callback: Callable[['PassengerContainer', int, int], None]) -> None:
+        """
+        Register a callback that is called whenever the amount of passengers in the container changes.
+        Used by the owners of the containers to keep their counters up to date.
+        Args:
+            callback: Function called with (container, old_amount, new_amount)
+        """
+        self.__watchers.append(callback)
+
+    def add(self, passengers: Union[int, Passenger, List[Passenger], PassengerArray],
+            configuration: Configuration = None, generator: Optional[Generator] = None) -> None:
         """
         Add the provided amount of passengers
         Args:
             passengers: If provided as an integer, the integer will represent the amount of passengers that will be added.
                 If provided as a passenger, the passenger provided will simply be appended to the list.
-                If provided as a list of passengers, the list will be concatenated with the existing list of passengers
-                in the container.
+                If provided as a list of passengers or a PassengerArray, the passengers will be concatenated
+                with the existing passengers in the container.
             configuration: The configuration for which they will be spawned with. Must be provided if the **amount** is
                 an integer.
+            generator: The random generator the spawned passengers are drawn from, usually one of the random streams
+                of the environment. Must be provided if the **amount** is an integer.
         Raises:
-            TypeError: Thrown if you provide invalid arguments. You must provide the configuration if passengers is an
-                integer. Otherwise you provide a Passenger object or a list of Passenger objects.
-        """
-        if isinstance(passengers, int) and configuration is not None:
-            for i in range(passengers):
-                self.__passengers.append(Passenger(configuration))
-        elif isinstance(passengers, Passenger):
-            self.__passengers.append(passengers)
-        elif isinstance(passengers, list):
-            self.__passengers.extend(passengers)
+            TypeError: Thrown if you provide invalid arguments. You must provide the configuration and the generator if
+                passengers is an integer. Otherwise you provide a Passenger object or a list of Passenger objects.
+        """
+        old_amount = self.__store.amount
+        if isinstance(passengers, Integral) and configuration is not None and generator is not None:
+            self.__store.populate(int(passengers), configuration, generator)
+        elif isinstance(passengers, (Passenger, PassengerRecord)):
+            self.__store.append(passengers)
+        elif isinstance(passengers, (list, PassengerArray)):
+            self.__store.extend(passengers)
         else:
-            raise TypeError("You must provide valid passengers and configuration arguments.")
+            raise TypeError("You must provide valid passengers, or an amount with a configuration and a generator.")
+        self.__notify(old_amount)
 
-    def remove(self, amount: int = 1) -> List[Passenger]:
+    def remove(self, amount: int = 1) -> Union[List[Passenger], PassengerArray]:
         """
         Pop the provided amount from the passenger container.
         You can not remove more than there are in the container.
         Args:
             amount: The amount to pop from the container
-        Returns: A list of the passengers that was removed
-        """
-        passengers = []
-        try:
-            for i in range(amount):
-                passenger = self.passengers.pop(0)
-                passengers.append(passenger)
-        except IndexError:
-            pass
-        finally:
-            return passengers
+        Returns: The passengers that was removed
+        """
+        old_amount = self.__store.amount
+        removed = self.__store.remove(amount)
+        self.__notify(old_amount)
+        return removed
 
     def remove_passenger(self, passenger_to_remove: Passenger) -> None:
         """
@@ -87,10 +121,20 @@ class PassengerContainer:
         Args:
             passenger_to_remove: The passenger object to remove
         """
-        for i in range(len(self.passengers)):
-            if passenger_to_remove is self.passengers[i]:
-                self.passengers.pop(i)
-                break
+        old_amount = self.__store.amount
+        self.__store.remove_passenger(passenger_to_remove)
+        self.__notify(old_amount)
+
+    def copy_from(self, container: 'PassengerContainer') -> None:
+        """
+        Replace the passengers in this container with a copy of the passengers in the provided container.
+        The copy uses the same passenger store type as the provided container.
+        Args:
+            container: The container to copy the passengers from
+        """
+        old_amount = self.__store.amount
+        self.__store = container.store.copy()
+        self.__notify(old_amount)
 
     def empty(self) -> bool:
         """
@@ -99,3 +143,30 @@ class PassengerContainer:
             True if empty, False if not
         """
         return self.amount == 0
+
+    def __notify(self, old_amount: int) -> None:
+        """
+        Notify the watchers if the amount of passengers has changed
+        Args:
+            old_amount: The amount of passengers before the change
+        """
+        if len(self.__watchers) == 0:
+            return
+        new_amount = self.__store.amount
+        if new_amount != old_amount:
+            for callback in self.__watchers:
+                callback(self, old_amount, new_amount)
+
+    @staticmethod
+    def __create_store(configuration: Configuration = None) -> PassengerStore:
+        """
+        Create the passenger store chosen by the configuration.
+        The configuration already rejects unknown passenger stores when it is created.
+        Args:
+            configuration: The simulation configuration
+        Returns:
+            The new passenger store
+        """
+        name = 'list' if configuration is None or configuration.passenger_store is None \
+            else configuration.passenger_store
+        return PassengerContainer.STORES[name]()
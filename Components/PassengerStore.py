@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from numpy.random import Generator
+
+from Runtimes.Configuration import Configuration
+
+
+class PassengerStore(ABC):
+    """
+    Abstract class that all passenger stores must inherit from.
+    A passenger store is the storage behind a PassengerContainer.
+    """
+
+    @property
+    @abstractmethod
+    def amount(self) -> int:
+        """
+        Get the amount of passengers in the store
+        Returns:
+            The amount of passengers
+        """
+        raise NotImplementedError("amount property not implemented in " + self.__class__.__name__)
+
+    @property
+    @abstractmethod
+    def passengers(self) -> Iterable:
+        """
+        Get the passengers in the store in the order they were added
+        Returns:
+            An iterable with the passengers
+        """
+        raise NotImplementedError("passengers property not implemented in " + self.__class__.__name__)
+
+    @property
+    @abstractmethod
+    def weight(self) -> float:
+        """
+        Get the total weight of the passengers in the store
+        Returns:
+            The summed weight of the passengers
+        """
+        raise NotImplementedError("weight property not implemented in " + self.__class__.__name__)
+
+    @abstractmethod
+    def populate(self, amount: int, configuration: Configuration, generator: Generator) -> None:
+        """
+        Spawn the provided amount of new passengers at the back of the store
+        Args:
+            amount: The amount of passengers to spawn
+            configuration: The configuration the passengers are spawned with
+            generator: The random generator to draw the passenger attributes from
+        """
+        raise NotImplementedError("populate method not implemented in " + self.__class__.__name__)
+
+    @abstractmethod
+    def append(self, passenger) -> None:
+        """
+        Add a single passenger at the back of the store
+        Args:
+            passenger: The passenger to add
+        """
+        raise NotImplementedError("append method not implemented in " + self.__class__.__name__)
+
+    @abstractmethod
+    def extend(self, passengers: Iterable) -> None:
+        """
+        Add the passengers at the back of the store
+        Args:
+            passengers: The passengers to add
+        """
+        raise NotImplementedError("extend method not implemented in " + self.__class__.__name__)
+
+    @abstractmethod
+    def remove(self, amount: int) -> Iterable:
+        """
+        Remove the provided amount of passengers from the front of the store.
+        Args:
+            amount: The amount of passengers to remove. If there are fewer in the store, all of them are removed.
+        Returns:
+            The removed passengers
+        """
+        raise NotImplementedError("remove method not implemented in " + self.__class__.__name__)
+
+    @abstractmethod
+    def copy(self) -> 'PassengerStore':
+        """
+        Create a copy of the store. Changing the copy does not change this store, and the other way around.
+        Returns:
+            A new store of the same type with the same passengers in the same order
+        """
+        raise NotImplementedError("copy method not implemented in " + self.__class__.__name__)
+
+    @abstractmethod
+    def remove_passenger(self, passenger) -> None:
+        """
+        Remove a specific passenger from the store
+        Args:
+            passenger: The passenger to remove
+        """
+        raise NotImplementedError("remove_passenger method not implemented in " + self.__class__.__name__)
@@ -1,4 +1,7 @@
 from abc import abstractmethod
+from typing import Optional
+
+from numpy.random import Generator
 
 from Components.Component import Component
 from Runtimes.Configuration import Configuration
@@ -10,13 +13,31 @@ class PopulatableComponent(Component):
     like trains and stations
     """
 
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, generator: Optional[Generator] = None, populate: bool = True):
         """
         Initialize the populatable component. Will run the populate method.
+        Args:
+            configuration: The simulation configuration
+            generator: The random generator used for populating the component, usually one of the random streams
+                of the environment. Must be provided if the component is populated.
+            populate: Whether to populate the component. Is False when the component will be copied into.
+        Raises:
+            TypeError: Thrown if the component is populated without a generator
         """
         super().__init__(configuration)
-        self.populate()
+        if populate and generator is None:
+            raise TypeError("You must provide a random generator to populate the {}.".format(self.__class__.__name__))
+        self.__random = generator
+        if populate:
+            self.populate()
 
+    @property
+    def random(self) -> Optional[Generator]:
+        """
+        Get the random generator used for populating the component
+        Returns: The random generator, or None if the component was not populated
+        """
+        return self.__random
 
     @abstractmethod
     def populate(self) -> None:
@@ -1,9 +1,13 @@
 from math import floor
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+from numpy.random import Generator
 
 from Components.PopulatableComponent import PopulatableComponent
 from Components.StationSector import StationSector
+from Components.Train import Train
 from Helpers.Ranges import random_between_percentage
+from Helpers.SectorIndex import SectorIndex
 from Runtimes.Configuration import Configuration
 
 
@@ -12,15 +16,23 @@ class Station(PopulatableComponent):
     Class representing the station component containing the station sectors
     """
 
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, generator: Optional[Generator] = None, populate: bool = True):
         """
         Initialize a new station
         Args:
             configuration: The configuration to create the station with
+            generator: The random generator used for populating the station
+            populate: Whether to populate the station sectors with passengers
         """
         self.__sectors = Station.__create_sectors(configuration)
         self.__passenger_init = 0
-        super().__init__(configuration)
+        # Counters kept up to date by the sectors whenever passengers are added or removed
+        self.__non_empty_sectors = 0
+        self.__passenger_amount = 0
+        for sector in self.__sectors:
+            sector.watch(self.__on_sector_changed)
+        self.__distance_index: Optional[SectorIndex] = None
+        super().__init__(configuration, generator, populate)
 
     def __str__(self):
         return 'Station ({})'.format(', '.join([str(x) for x in self.sectors]))
@@ -45,7 +57,7 @@ class Station(PopulatableComponent):
             # Calculate the amount of people in this sector based on the parameters above
             amount = floor(
                 random_between_percentage(
-                    self.configuration.environment_random_seed,
+                    self.random,
                     rang,
                     cap
                 ) - ld_distance * stair_factor
@@ -54,10 +66,10 @@ class Station(PopulatableComponent):
             if amount < 0:
                 amount = 0
             # Add the amount to the sector
-            sector.add(amount, self.configuration)
+            sector.add(amount, self.configuration, self.random)
             total_waiting += amount
-            self.logger.info("There are {} passengers waiting in sector {}".format(amount, sector.sector_index))
-        self.logger.info("There in total {} passengers waiting on the station".format(total_waiting))
+            self.logger.info("There are %s passengers waiting in sector %s", amount, sector.sector_index)
+        self.logger.info("There in total %s passengers waiting on the station", total_waiting)
         self.__passenger_init = total_waiting
 
     @property
@@ -68,6 +80,52 @@ class Station(PopulatableComponent):
         """
         return self.__sectors
 
+    @property
+    def distance_index(self) -> SectorIndex:
+        """
+        Get the shared index for querying sectors by light status and distance.
+        Is built on first use, and must be updated when the light statuses change.
+        Returns: The sector distance index
+        """
+        if self.__distance_index is None:
+            self.update_distance_index()
+        return self.__distance_index
+
+    def update_distance_index(self) -> None:
+        """
+        Rebuild the sector distance index from the current light statuses
+        """
+        self.__distance_index = SectorIndex(self.sectors)
+
+    def __on_sector_changed(self, sector: StationSector, old_amount: int, new_amount: int) -> None:
+        """
+        Update the occupancy counters when the amount of passengers in a sector changes
+        Args:
+            sector: The sector that changed
+            old_amount: The amount of passengers in the sector before the change
+            new_amount: The amount of passengers in the sector after the change
+        """
+        self.__passenger_amount += new_amount - old_amount
+        self.__non_empty_sectors += (new_amount > 0) - (old_amount > 0)
+
+    def copy_from(self, station: 'Station', train: Train) -> None:
+        """
+        Copy the state and the passengers of the provided station into this station.
+        The stations must have the same amount of sectors.
+        Args:
+            station: The station to copy
+            train: The train of this station. The train cars parked at the sectors are taken from this train.
+        """
+        if len(station.sectors) != len(self.__sectors):
+            raise ValueError("Cannot copy a station with {} sectors into a station with {} sectors".format(
+                len(station.sectors), len(self.__sectors)))
+        for sector, source in zip(self.__sectors, station.sectors):
+            sector.copy_from(source)
+            sector.train_car = train[source.train_car.car_index] if source.has_train_car() else None
+        self.__passenger_init = station.initial_passenger_amount
+        # The index refers to the sectors, so it is rebuilt for this station when it is needed
+        self.__distance_index = None
+
     @staticmethod
     def __calculate_distances(sector_index: int, stair_placements: List[int]) -> List[Tuple[int, int]]:
         """
@@ -100,10 +158,7 @@ class Station(PopulatableComponent):
         Returns:
             True if the station is empty, False if there is > 0 passengers in any sector.
         """
-        for s in self.sectors:
-            if not s.empty():
-                return False
-        return True
+        return self.__non_empty_sectors == 0
 
     @property
     def initial_passenger_amount(self) -> int:
@@ -119,4 +174,4 @@ class Station(PopulatableComponent):
         Get the amount of passengers in this object after the simulation is finished.
         Returns: amount of passengers
         """
-        return sum([s.amount for s in self.sectors])
\ No newline at end of file
+        return self.__passenger_amount
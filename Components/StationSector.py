@@ -19,7 +19,7 @@ class StationSector(PassengerContainer, Component):
         self.__index = index
         self.__light = Light(configuration)
         self.__train_car: Optional[TrainCar] = None
-        PassengerContainer.__init__(self)
+        PassengerContainer.__init__(self, configuration)
         Component.__init__(self, configuration)
 
     def __str__(self):
@@ -47,6 +47,16 @@ class StationSector(PassengerContainer, Component):
         """
         self.__train_car = train_car
 
+    def copy_from(self, sector: 'StationSector') -> None:
+        """
+        Copy the passengers and light status of the provided sector.
+        The parked train car is not copied, since it belongs to another train.
+        Args:
+            sector: The sector to copy
+        """
+        PassengerContainer.copy_from(self, sector)
+        self.__light = Light(self.configuration, sector.light.status)
+
     def has_train_car(self) -> bool:
         """
         Get whether this station sector has a train car parked
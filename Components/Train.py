@@ -1,5 +1,7 @@
 from math import floor
-from typing import List
+from typing import List, Optional
+
+from numpy.random import Generator
 
 from Components.PopulatableComponent import PopulatableComponent
 from Components.TrainCar import TrainCar
@@ -13,17 +15,28 @@ class Train(PopulatableComponent):
     This class represents the full train including the train sets and train cars.
     """
 
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, generator: Optional[Generator] = None, populate: bool = True):
         """
         Initialize a new train component
+        Args:
+            configuration: The simulation configuration
+            generator: The random generator used for populating the train
+            populate: Whether to populate the train cars with passengers
         """
         self.__train_sets = Train.__create_train_sets(configuration)
+        # Flat list of all the cars, indexed by their car index
+        self.__cars = [car for train_set in self.__train_sets for car in train_set.cars]
+        # Counters kept up to date by the cars whenever passengers are added or removed
+        self.__capacity = configuration.train_capacity
+        self.__non_full_cars = 0 if self.__capacity == 0 else len(self.__cars)
+        self.__passenger_amount = 0
+        for car in self.__cars:
+            car.watch(self.__on_car_changed)
         self.__stopped = True
         self.__parked_at = None
-        self.__weight = 0
-        self.__train_length = None
+        self.__doors_opened = False
         self.__passenger_init = 0
-        super().__init__(configuration)
+        super().__init__(configuration, generator, populate)
 
     def __str__(self):
         return 'Train (w: {}, s: {}, p: {}, l: {})'.format(
@@ -39,11 +52,7 @@ class Train(PopulatableComponent):
         Returns:
             True if full, False if not
         """
-        for train_set in self.train_sets:
-            for train_car in train_set.cars:
-                if not train_car.is_full():
-                    return False
-        return True
+        return self.__non_full_cars == 0
 
     @property
     def parked_at(self) -> int:
@@ -64,15 +73,30 @@ class Train(PopulatableComponent):
         """
         self.__parked_at = sector_index
 
+    @property
+    def doors_opened(self) -> bool:
+        """
+        Get whether the train doors have been opened at the current stop
+        Returns: True if the doors have been opened, False if not
+        """
+        return self.__doors_opened
+
+    @doors_opened.setter
+    def doors_opened(self, opened: bool):
+        """
+        Set whether the train doors have been opened at the current stop
+        Args:
+            opened: Whether the doors have been opened
+        """
+        self.__doors_opened = opened
+
     @property
     def train_car_length(self) -> int:
         """
         Get the amount of cars this train carries
         Returns: The total amount of train cars
         """
-        if self.__train_length is None:
-            self.__train_length = self.configuration.train_set_setup * self.configuration.train_amount_of_sets
-        return self.__train_length
+        return self.configuration.train_length
 
     @property
     def train_sets(self) -> List[TrainSet]:
@@ -83,31 +107,20 @@ class Train(PopulatableComponent):
         return self.__train_sets
 
     @property
-    def weight(self) -> float:
-        """
-        Get the weight of the train
-        Returns: The weight as a float
+    def cars(self) -> List[TrainCar]:
         """
-        return self.__weight
-
-    @weight.setter
-    def weight(self, weight: float):
-        """
-        Set the weight of the train
-        Args:
-            weight: The new weight of the train
+        Get all the train cars of the train, ordered by their car index
+        Returns: A list with the train cars
         """
-        # Let us not allow a minus weight
-        if weight < 0:
-            weight = 0  # Set it to zero instead
-        self.__weight = weight
+        return self.__cars
 
-    @weight.deleter
-    def weight(self):
+    @property
+    def weight(self) -> float:
         """
-        Reset/Delete the weight by setting it to zero
+        Get the weight of the train, the sum of the weights of its train cars
+        Returns: The weight as a float
         """
-        self.__weight = 0
+        return sum(car.weight for car in self.__cars)
 
     def is_stopped(self) -> bool:
         """
@@ -141,14 +154,31 @@ class Train(PopulatableComponent):
                 # Then we generate a random percentage of the maximum capacity
                 # and then fill the train car with that random amount
                 if isinstance(self.configuration.train_fullness, range):
-                    amount = floor(random_between_percentage(self.configuration.environment_random_seed, rang, cap))
+                    amount = floor(random_between_percentage(self.random, rang, cap))
                 else:
                     amount = self.configuration.train_fullness[index]
-                car.add(amount, self.configuration)
+                car.add(amount, self.configuration, self.random)
                 t_amount += amount
                 index += 1
         self.__passenger_init = t_amount
 
+    def copy_from(self, train: 'Train') -> None:
+        """
+        Copy the state and the passengers of the provided train into this train.
+        The trains must have the same setup.
+        Args:
+            train: The train to copy
+        """
+        if len(train.cars) != len(self.__cars):
+            raise ValueError("Cannot copy a train with {} cars into a train with {} cars".format(
+                len(train.cars), len(self.__cars)))
+        for car, source in zip(self.__cars, train.cars):
+            car.copy_from(source)
+        self.__stopped = train.is_stopped()
+        self.__parked_at = train.parked_at
+        self.__doors_opened = train.doors_opened
+        self.__passenger_init = train.initial_passenger_amount
+
     def __getitem__(self, item: int) -> TrainCar:
         """
         Overriden the square bracket index getter so that we can get the
@@ -161,14 +191,21 @@ class Train(PopulatableComponent):
         Raises:
             IndexError: Thrown if you provide an invalid index
         """
-        i = 0
-        for train_set in self.train_sets:
-            for train_car in train_set.cars:
-                if i == item:
-                    return train_car
-                i += 1
+        if 0 <= item < len(self.__cars):
+            return self.__cars[item]
         raise IndexError('Could not find a train car with index {}'.format(item))
 
+    def __on_car_changed(self, car: TrainCar, old_amount: int, new_amount: int) -> None:
+        """
+        Update the occupancy counters when the amount of passengers in a car changes
+        Args:
+            car: The train car that changed
+            old_amount: The amount of passengers in the car before the change
+            new_amount: The amount of passengers in the car after the change
+        """
+        self.__passenger_amount += new_amount - old_amount
+        self.__non_full_cars += (old_amount == self.__capacity) - (new_amount == self.__capacity)
+
     @staticmethod
     def __create_train_sets(configuration: Configuration) -> List[TrainSet]:
         """
@@ -204,4 +241,5 @@ class Train(PopulatableComponent):
         Get the amount of passengers in this object after the simulation is finished.
         Returns: amount of passengers
         """
-        return sum([car.amount for t_set in self.train_sets for car in t_set.cars])
+        return self.__passenger_amount
+
@@ -15,8 +15,7 @@ class TrainCar(PassengerContainer, Component):
             configuration: The configuration for which to be used for configuring the train car initialization
         """
         Component.__init__(self, configuration)
-        PassengerContainer.__init__(self)
-        self.__weight = 0
+        PassengerContainer.__init__(self, configuration)
         self.__opened = False
         self.__train_set = None
         self.__index = index
@@ -51,25 +50,20 @@ class TrainCar(PassengerContainer, Component):
     def weight(self) -> float:
         """
         Get the weight of the train car.
+        The passenger store keeps the weight up to date as passengers board and alight,
+        so weighing the car does not go over its passengers.
         Returns: The train car weight
         """
-        return self.__weight
+        return self.store.weight
 
-    @weight.setter
-    def weight(self, value: float):
+    def copy_from(self, car: 'TrainCar') -> None:
         """
-        Set the weight to provided value
+        Copy the passengers and door status of the provided train car
         Args:
-            value: The new weight
+            car: The train car to copy
         """
-        self.__weight = value
-
-    @weight.deleter
-    def weight(self):
-        """
-        Reset/Delete the weight by resetting it to zero
-        """
-        self.__weight = 0
+        PassengerContainer.copy_from(self, car)
+        self.__opened = car.is_open()
 
     def is_open(self) -> bool:
         """
@@ -96,4 +90,4 @@ class TrainCar(PassengerContainer, Component):
         Returns:
             True if the train car is full, false if it is not.
         """
-        return len(self.passengers) == self.configuration.train_capacity
+        return self.amount == self.configuration.train_capacity
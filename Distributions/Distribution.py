@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
+
+from numpy.random import Generator
 
 
 class Distribution(ABC):
@@ -7,6 +9,20 @@ class Distribution(ABC):
     Abstract class that all distributions must inherit from
     """
 
+    def __repr__(self):
+        return '{}({})'.format(
+            self.__class__.__name__, ', '.join('{}={}'.format(k, v) for k, v in self.parameters.items()))
+
+    @property
+    @abstractmethod
+    def parameters(self) -> Dict[str, float]:
+        """
+        Get the parameters of the distribution
+        Returns:
+            A dictionary mapping the parameter name to its value
+        """
+        raise NotImplementedError("parameters property not implemented in " + self.__class__.__name__)
+
     def fill(self, size: int = None, arr: list = None) -> List[float]:
         """
         Fill a list of the provided size or fill a list with the sampled distribution.
@@ -34,22 +50,25 @@ class Distribution(ABC):
         return arr
 
     @abstractmethod
-    def generate_single(self) -> float:
+    def generate_single(self, generator: Optional[Generator] = None) -> float:
         """
         Generate a single sample from the distribution
+        Args:
+            generator: Optional random generator to draw from. Uses the global numpy random state if not provided.
         Returns:
             A sample from the distribution
         """
         raise NotImplementedError("generate_single method not implemented in " + self.__class__.__name__)
 
     @abstractmethod
-    def generate_series(self, size: int) -> List[float]:
+    def generate_series(self, size: int, generator: Optional[Generator] = None) -> List[float]:
         """
         Generate a series of the provided size from the distribution.
         Provides the same functionality as fill with the size provided
         Args:
             size:
                 The size of the series to produce
+            generator: Optional random generator to draw from. Uses the global numpy random state if not provided.
         Returns:
             A series from the distribution
         """
@@ -1,6 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional
 
-from numpy.random import lognormal
+from numpy.random import Generator, lognormal
 
 from Distributions.Distribution import Distribution
 
@@ -20,9 +20,16 @@ class LogNormDistribution(Distribution):
         self.__mean = mean
         self.__sigma = sigma
 
-    def generate_single(self) -> float:
-        return lognormal(self.__mean, self.__sigma, 1)
+    @property
+    def parameters(self) -> Dict[str, float]:
+        return {'mean': self.__mean, 'sigma': self.__sigma}
 
-    def generate_series(self, size: int) -> List[float]:
-        return lognormal(self.__mean, self.__sigma, size)
+    def generate_single(self, generator: Optional[Generator] = None) -> float:
+        if generator is None:
+            return lognormal(self.__mean, self.__sigma)
+        return generator.lognormal(self.__mean, self.__sigma)
 
+    def generate_series(self, size: int, generator: Optional[Generator] = None) -> List[float]:
+        if generator is None:
+            return lognormal(self.__mean, self.__sigma, size)
+        return generator.lognormal(self.__mean, self.__sigma, size)
@@ -1,6 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional
 
-from numpy.random import normal
+from numpy.random import Generator, normal
 
 from Distributions.Distribution import Distribution
 
@@ -20,8 +20,16 @@ class NormalDistribution(Distribution):
         self.__mean = mean
         self.__scale = scale
 
-    def generate_single(self) -> float:
-        return normal(self.__mean, self.__scale)
+    @property
+    def parameters(self) -> Dict[str, float]:
+        return {'mean': self.__mean, 'scale': self.__scale}
 
-    def generate_series(self, size) -> List[float]:
-        return normal(self.__mean, self.__scale, size)
+    def generate_single(self, generator: Optional[Generator] = None) -> float:
+        if generator is None:
+            return normal(self.__mean, self.__scale)
+        return generator.normal(self.__mean, self.__scale)
+
+    def generate_series(self, size, generator: Optional[Generator] = None) -> List[float]:
+        if generator is None:
+            return normal(self.__mean, self.__scale, size)
+        return generator.normal(self.__mean, self.__scale, size)
@@ -1,11 +1,10 @@
 from __future__ import annotations  # To fix Event unresolved reference bug
 
-from logging import getLogger
+from copy import copy
+from logging import INFO, getLogger
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
-from Helpers.DateTime import add_seconds
 from Runtimes.Configuration import Configuration
 from Runtimes.Environment import Environment
 
@@ -15,10 +14,18 @@ class Event(ABC):
     Abstract class that all events must inherit from
     """
 
-    def __init__(self, timestamp: datetime, configuration: Configuration):
+    def __init__(self, timestamp: float, configuration: Configuration):
+        """
+        Initialize the event
+        Args:
+            timestamp: The simulation time of the event in seconds since the simulation epoch
+            configuration: The simulation configuration
+        """
         self.configuration = configuration
         self.timestamp = timestamp
         self.logger = getLogger(self.__class__.__name__)
+        # The tracer of the environment while the event is fired, if the environment is traced
+        self.tracer = None
 
     @abstractmethod
     def fire(self, environment: Environment) -> List[Event]:
@@ -31,6 +38,21 @@ class Event(ABC):
         """
         raise NotImplementedError("fire method not implemented in {}".format(self.__class__.__name__))
 
+    def rebind(self, configuration: Configuration, environment: Environment) -> Event:
+        """
+        Create a copy of the event for another (forked) environment.
+        Events referring to components of the environment must override this method
+        to look the same components up in the provided environment.
+        Args:
+            configuration: The configuration of the copied event
+            environment: The environment the copied event will be fired in
+        Returns:
+            The copied event
+        """
+        event = copy(self)
+        event.configuration = configuration
+        return event
+
     def __call__(self, environment: Environment) -> List[Event]:
         """
         Run the event with the provided environment
@@ -39,26 +61,57 @@ class Event(ABC):
         Returns:
             A list with the next events
         """
+        tracer = environment.tracer
+        if tracer is None:
+            events = self.fire(environment)
+            self.log_event()
+            return events
+
+        self.tracer = tracer
+        start = self.timestamp
         events = self.fire(environment)
+        tracer.record_event(self, start, self.timestamp)
+        self.tracer = None
         self.log_event()
         return events
 
-    def do_action(self, time: float, description: str = "") -> None:
+    def log_fields(self) -> Dict[str, Any]:
+        """
+        Get the fields added to the log records of the event, so structured logs can be filtered on them.
+        Events referring to components of the environment must override this method to add them.
+        Returns:
+            A dictionary with the event name and the simulated time
+        """
+        return {'event': self.__class__.__name__, 'sim_time': self.timestamp}
+
+    def do_action(self, time: float, description: str = "", *args) -> None:
         """
         Perform an action that takes some time
         Args:
             time: The time it takes to perform the action
             description: Optional description for the action performed. Used mostly for logging.
+                Can be a %-format string, which is only formatted with the args if it is logged or traced.
+            *args: The arguments of the description
         """
-        # Format message a little bit
-        action_descriptor = ": {}".format(description) if description != "" else description
-        # Log the action
-        self.logger.info("{} - {} seconds: {} ".format(self.timestamp, time, action_descriptor))
+        logged = self.logger.isEnabledFor(INFO)
+        if logged or self.tracer is not None:
+            if args:
+                description = description % args
+            # Format message a little bit
+            action_descriptor = ": {}".format(description) if description != "" else description
+            # Log the action
+            if logged:
+                self.logger.info("%s - %s seconds: %s ", self.timestamp, time, action_descriptor,
+                                 extra=dict(self.log_fields(), duration=time))
+            if self.tracer is not None:
+                self.tracer.record_action(self, self.timestamp, time, description)
         # Add the time to the timestamp
-        self.timestamp = add_seconds(self.timestamp, time)
+        self.timestamp += time
 
     def log_event(self) -> None:
         """
         Log the event has been run. Is called in self.run()
         """
-        self.logger.info("{} - Finished event: {}".format(self.timestamp, self.__class__.__name__))
+        if self.logger.isEnabledFor(INFO):
+            self.logger.info("%s - Finished event: %s", self.timestamp, self.__class__.__name__,
+                             extra=self.log_fields())
@@ -1,5 +1,4 @@
-from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
 from Components.StationSector import StationSector
 from Events.Event import Event
@@ -16,11 +15,19 @@ class LoadPassengerEvent(Event):
     """
     HIGHEST = None
 
-    def __init__(self, sector: StationSector, amount: int, timestamp: datetime, configuration: Configuration):
+    def __init__(self, sector: StationSector, amount: int, timestamp: float, configuration: Configuration):
         self.sector: StationSector = sector
         self.amount = amount
         super().__init__(timestamp, configuration)
 
+    def rebind(self, configuration: Configuration, environment: Environment) -> Event:
+        event = super().rebind(configuration, environment)
+        event.sector = environment.station.sectors[self.sector.sector_index]
+        return event
+
+    def log_fields(self) -> Dict[str, Any]:
+        return dict(super().log_fields(), sector=self.sector.sector_index)
+
     def fire(self, environment: Environment) -> List[Event]:
         # If this is a sector where there is no train parked,
         # but there are waiting passengers then we must move
@@ -28,7 +35,7 @@ class LoadPassengerEvent(Event):
         # Or we also want to move passengers wanting
         # to board the train but the train car is full.
         if self.sector.has_train_car() and self.sector.train_car.is_full():
-            self.logger.info("Train in sector {} is full. Moving passenger instead.".format(self.sector.sector_index))
+            self.logger.info("Train in sector %s is full. Moving passenger instead.", self.sector.sector_index)
             return [MovePassengerEvent(self.sector, self.sector.amount, self.timestamp, self.configuration)]
 
         # Get the train car parked at the current sector
@@ -37,7 +44,7 @@ class LoadPassengerEvent(Event):
         passengers = self.sector.remove(self.amount)
         # Security check so that we do not accidentally get an IndexError
         if len(passengers) == 0:
-            self.logger.warning("Removed zero passengers from sector {}".format(self.sector.sector_index))
+            self.logger.warning("Removed zero passengers from sector %s", self.sector.sector_index)
 
         total_speed = 0
         amount_to_move = 0
@@ -59,11 +66,8 @@ class LoadPassengerEvent(Event):
             # For house keeping, we keep track of how many we load
             amount_loaded += 1
         # Add the time it takes to load this passenger
-        self.do_action(total_speed,
-                       "Loading {} passenger into car {} in set {} at sector {}".format(amount_loaded,
-                                                                                        train_car.index,
-                                                                                        train_car.train_set.index,
-                                                                                        self.sector.sector_index))
+        self.do_action(total_speed, "Loading %s passenger into car %s in set %s at sector %s",
+                       amount_loaded, train_car.index, train_car.train_set.index, self.sector.sector_index)
 
         if amount_to_move > 0:
             return [MovePassengerEvent(self.sector, amount_to_move, self.timestamp, self.configuration)]
@@ -1,5 +1,4 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from Components.StationSector import StationSector
 from Events.Event import Event
@@ -15,7 +14,7 @@ class MovePassengerEvent(Event):
     **Assumes that the train is parked.**
     """
 
-    def __init__(self, sector: StationSector, amount: int, timestamp: datetime, configuration: Configuration):
+    def __init__(self, sector: StationSector, amount: int, timestamp: float, configuration: Configuration):
         """
         Initialize a new Move Passenger Event
         Args:
@@ -27,6 +26,14 @@ class MovePassengerEvent(Event):
         self.amount = amount
         super().__init__(timestamp, configuration)
 
+    def rebind(self, configuration: Configuration, environment: Environment) -> Event:
+        event = super().rebind(configuration, environment)
+        event.sector = environment.station.sectors[self.sector.sector_index]
+        return event
+
+    def log_fields(self) -> Dict[str, Any]:
+        return dict(super().log_fields(), sector=self.sector.sector_index)
+
     def fire(self, environment: Environment) -> List[Event]:
         # Get the nearest sector with least people
         free_sector = self.__get_nearby_free_sector(environment)
@@ -48,12 +55,11 @@ class MovePassengerEvent(Event):
                 # Compute how long it takes to walk that distance
                 speed = compute_walking_speed(removed_passengers[0], walking_distance) + amount_removed * 0.4
                 # Now perform the action
-                self.do_action(speed, "Moved {} passengers from sector {} to {}".format(amount_removed,
-                                                                                        self.sector.sector_index,
-                                                                                        free_sector.sector_index))
+                self.do_action(speed, "Moved %s passengers from sector %s to %s",
+                               amount_removed, self.sector.sector_index, free_sector.sector_index)
             except IndexError:
-                self.logger.warning("We removed zero passengers during move in sector {} with {} passengers".format(
-                    self.sector.sector_index, self.sector.amount))
+                self.logger.warning("We removed zero passengers during move in sector %s with %s passengers",
+                                    self.sector.sector_index, self.sector.amount)
             # Actually move the passengers
             free_sector.add(removed_passengers)
         else:
@@ -83,15 +89,7 @@ class MovePassengerEvent(Event):
             The nearest StationSector with the least people.
             Return None in cases where we could not find a station sector. Should never be the case.
         """
-        least_sector = None
-        least_distance = self.configuration.station_sector_count
-        for sector in environment.station.sectors:
-            if sector.has_train_car() and not sector.train_car.is_full():
-                dist = sector_distance(self.sector, sector)
-                if dist < least_distance and dist != 0:
-                    if dist == least_distance:
-                        least_sector = least_sector if least_sector.amount <= sector.amount else sector
-                    else:
-                        least_sector = sector
-                        least_distance = dist
-        return least_sector
+        return environment.station.distance_index.get_nearest_with(
+            self.sector,
+            lambda sector: sector.has_train_car() and not sector.train_car.is_full()
+        )
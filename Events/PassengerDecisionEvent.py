@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List
 
 from Components.LightStatus import LightStatus
@@ -6,7 +5,7 @@ from Components.StationSector import StationSector
 from Events.Event import Event
 from Helpers.Distances import sector_distance
 from Helpers.Ranges import random_between_range, random_choice
-from Helpers.SectorDistance import SectorDistance
+from Helpers.SectorIndex import SectorIndex
 from Runtimes import Configuration
 from Runtimes.Environment import Environment
 
@@ -19,27 +18,27 @@ class PassengerDecisionEvent(Event):
     based on their decisions.
     """
 
-    def __init__(self, timestamp: datetime, train_arrives: datetime, configuration: Configuration):
+    def __init__(self, timestamp: float, train_arrives: float, configuration: Configuration):
         super().__init__(timestamp, configuration)
         self.__train_arrives = train_arrives
-        self.__time_to_move = (train_arrives - timestamp).total_seconds()
+        self.__time_to_move = train_arrives - timestamp
 
     def fire(self, environment: Environment) -> List[Event]:
+        index = environment.station.distance_index
         for sector in environment.station.sectors:
-            matrix = SectorDistance(sector, environment, self.configuration)
             light_status = sector.light.status
             # The passengers stay if they are in a green sector
             if light_status == LightStatus.GREEN:
-                self.__handle_green_light(matrix, sector, environment)
+                self.__handle_green_light(index, sector, environment)
             elif light_status == LightStatus.YELLOW:
-                self.__handle_yellow_light(matrix, sector, environment)
+                self.__handle_yellow_light(index, sector, environment)
             elif light_status is None:
-                self.__handle_none_light(matrix, sector, environment)
+                self.__handle_none_light(index, sector, environment)
             else:
-                self.__handle_red_light(matrix, sector, environment)
+                self.__handle_red_light(index, sector, environment)
         return []
 
-    def __handle_none_light(self, matrix: SectorDistance, sector: StationSector, environment: Environment) -> None:
+    def __handle_none_light(self, index: SectorIndex, sector: StationSector, environment: Environment) -> None:
         for i in range(sector.amount):
             # Remove the passenger from the current sector
             passenger = sector.remove(1)[0]
@@ -54,9 +53,9 @@ class PassengerDecisionEvent(Event):
                 able_distance = willing_distance
             # Now we can find all the available sectors that the passenger can move to
             available_sectors = []
-            available_sectors.extend(matrix.get_sectors_within_distance(able_distance, LightStatus.GREEN))
-            available_sectors.extend(matrix.get_sectors_within_distance(able_distance, LightStatus.YELLOW))
-            available_sectors.extend(matrix.get_sectors_within_distance(able_distance, LightStatus.RED))
+            available_sectors.extend(index.get_sectors_within_distance(sector, able_distance, LightStatus.GREEN))
+            available_sectors.extend(index.get_sectors_within_distance(sector, able_distance, LightStatus.YELLOW))
+            available_sectors.extend(index.get_sectors_within_distance(sector, able_distance, LightStatus.RED))
 
             if len(available_sectors) > 0:
                 chosen_sector = available_sectors[0]
@@ -66,21 +65,21 @@ class PassengerDecisionEvent(Event):
             else:
                 self.logger.warning("Chosen to move to a sector without lights")
                 chosen_sector = sector
-            self.logger.info("Moved passenger from {} to {} due to no light".format(sector.sector_index,
-                                                                                    chosen_sector.sector_index))
+            self.logger.info("Moved passenger from %s to %s due to no light",
+                             sector.sector_index, chosen_sector.sector_index)
             chosen_sector.add(passenger)
 
-    def __handle_green_light(self, matrix: SectorDistance, sector: StationSector, environment: Environment) -> None:
+    def __handle_green_light(self, index: SectorIndex, sector: StationSector, environment: Environment) -> None:
         """
         This method handles what the passengers in a section with a green light should do
         Args:
-            matrix: The distance matrix from the provided sector
+            index: The shared sector distance index
             sector: The sector with the green light
             environment: The simulation environment
         """
         return None
 
-    def __handle_yellow_light(self, matrix: SectorDistance, sector: StationSector,
+    def __handle_yellow_light(self, index: SectorIndex, sector: StationSector,
                               environment: Environment) -> None:
         """
         This method handles what the passengers in a section with a yellow light should do
@@ -90,13 +89,13 @@ class PassengerDecisionEvent(Event):
         """
         # If there is not a green sector right next to the yellow light,
         # then the passengers don't want to move from the yellow sector.
-        if not matrix.has_sector_within_distance(2, LightStatus.GREEN):
+        if not index.has_sector_within_distance(sector, 2, LightStatus.GREEN):
             return
         # Get the green sector next to the provided sector with the least passengers waiting
-        closest_sector = matrix.get_sector_within_distance(2, LightStatus.GREEN, True)
+        closest_sector = index.get_sector_within_distance(sector, 2, LightStatus.GREEN, True)
 
         move_amount = random_between_range(
-            self.configuration.environment_random_seed,
+            environment.random.decisions,
             range(0, environment.station.sectors[closest_sector.sector_index].amount)
         )
 
@@ -106,12 +105,10 @@ class PassengerDecisionEvent(Event):
         # Add the removed passengers to the other sectors
         closest_sector.add(removed_passengers)
 
-        self.logger.info(
-            "Moved {} passengers from sector {} to sector {} because of yellow light".format(move_amount,
-                                                                                             sector.sector_index,
-                                                                                             closest_sector.sector_index))
+        self.logger.info("Moved %s passengers from sector %s to sector %s because of yellow light",
+                         move_amount, sector.sector_index, closest_sector.sector_index)
 
-    def __handle_red_light(self, matrix: SectorDistance, sector: StationSector, environment: Environment) -> None:
+    def __handle_red_light(self, index: SectorIndex, sector: StationSector, environment: Environment) -> None:
         """
         This method handles what the passengers in a section with a red light should do
         Args:
@@ -122,14 +119,14 @@ class PassengerDecisionEvent(Event):
         for passenger in sector.passengers:
             able_distance = self.__time_to_move / passenger.speed
 
-            closest_green_sector = matrix.get_sector_within_distance(able_distance, LightStatus.GREEN, True)
+            closest_green_sector = index.get_sector_within_distance(sector, able_distance, LightStatus.GREEN, True)
             try:
                 green_distance = sector_distance(sector, closest_green_sector)
                 can_move_to_green_sector = able_distance <= green_distance
             except TypeError:
                 can_move_to_green_sector = False
 
-            closest_yellow_sector = matrix.get_sector_within_distance(able_distance, LightStatus.YELLOW, True)
+            closest_yellow_sector = index.get_sector_within_distance(sector, able_distance, LightStatus.YELLOW, True)
             try:
                 yellow_distance = sector_distance(sector, closest_yellow_sector)
                 can_move_to_yellow_sector = able_distance <= yellow_distance
@@ -145,5 +142,4 @@ class PassengerDecisionEvent(Event):
                 closest_yellow_sector.add(passenger)
                 amount_moved += 1
 
-        self.logger.info("Moved {} passengers from sector {} due to red light".format(amount_moved,
-                                                                                      sector.sector_index))
+        self.logger.info("Moved %s passengers from sector %s due to red light", amount_moved, sector.sector_index)
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List
 
 from Events.Event import Event
@@ -11,7 +10,7 @@ class PrepareTrainEvent(Event):
     Before the train can depart the station, we must prepare it for departure.
     This includes closing the doors and whatever we may think of.
     """
-    def __init__(self, timestamp: datetime, configuration: Configuration):
+    def __init__(self, timestamp: float, configuration: Configuration):
         super().__init__(timestamp, configuration)
 
     def fire(self, environment: Environment) -> List[Event]:
@@ -1,10 +1,8 @@
-from datetime import datetime
 from typing import List
 
 from Components.LightStatus import LightStatus
 from Events.Event import Event
 from Events.PassengerDecisionEvent import PassengerDecisionEvent
-from Helpers.DateTime import add_seconds
 from Helpers.Ranges import random_between_range
 from Runtimes.Configuration import Configuration
 from Runtimes.Environment import Environment
@@ -17,7 +15,7 @@ class ReceiveWeightEvent(Event):
     and then lighting the station lights accordingly.
     """
 
-    def __init__(self, timestamp: datetime, train_arrive: datetime, configuration: Configuration):
+    def __init__(self, timestamp: float, train_arrive: float, configuration: Configuration):
         """
         Initialize the receive weight event.
         Args:
@@ -29,19 +27,14 @@ class ReceiveWeightEvent(Event):
         super().__init__(timestamp, configuration)
 
     def fire(self, environment: Environment) -> List[Event]:
-        # Compute the total weight by max train car capacity times the passenger mean weight
-        max_weight = self.configuration.train_capacity * self.configuration.passenger_mean_weight
-        # Get the light thresholds from the configuration, which we will use
-        # to compute what color the light should be.
-        thresholds = self.configuration.station_light_thresholds
-        # The yellow threshold is below 75% of the max weight
-        yellow_threshold = max_weight * thresholds['yellow']
-        # The green threshold is below 50% of the max weight
-        green_threshold = max_weight * thresholds['green']
+        # The light thresholds are fractions of the max train car weight (capacity times the passenger mean weight),
+        # which the configuration computes once
+        yellow_threshold = self.configuration.yellow_threshold_weight
+        green_threshold = self.configuration.green_threshold_weight
         # Store the sector index where the train is going to be parked
         environment.train.parked_at = self.__decide_where_to_park(environment)
 
-        self.logger.info("Parked train at sector {}".format(environment.train.parked_at))
+        self.logger.info("Parked train at sector %s", environment.train.parked_at)
 
         for i in range(environment.train.train_car_length):
             index = environment.train.parked_at + i
@@ -67,14 +60,16 @@ class ReceiveWeightEvent(Event):
 
             # Light the sector lights accordingly.
             if weight <= green_threshold:
-                self.logger.info("Setting sector {} to green".format(sector.sector_index))
+                self.logger.info("Setting sector %s to green", sector.sector_index)
                 ReceiveWeightEvent.__set_light_status(sector.sector_index, LightStatus.GREEN, environment)
             elif weight <= yellow_threshold:
-                self.logger.info("Setting sector {} to yellow".format(sector.sector_index))
+                self.logger.info("Setting sector %s to yellow", sector.sector_index)
                 ReceiveWeightEvent.__set_light_status(sector.sector_index, LightStatus.YELLOW, environment)
             else:
-                self.logger.info("Setting sector {} to red".format(sector.sector_index))
+                self.logger.info("Setting sector %s to red", sector.sector_index)
                 ReceiveWeightEvent.__set_light_status(sector.sector_index, LightStatus.RED, environment)
+        # The lights have changed, so the passengers must look at the new lights
+        environment.station.update_distance_index()
         return [
             PassengerDecisionEvent(
                 self.timestamp,
@@ -113,7 +108,7 @@ class ReceiveWeightEvent(Event):
         # then we must do that using the configuration.
         if environment.train.train_car_length < self.configuration.station_sector_count:
             train_length_under_station = self.configuration.station_sector_count - environment.train.train_car_length
-            return random_between_range(self.configuration.environment_random_seed, range(0, train_length_under_station))
+            return random_between_range(environment.random.parking, range(0, train_length_under_station))
 
         # If we for some reason have a train that is longer than the amount of sectors on the station,
         # let us get notified so that all the passengers have the ability to get off.
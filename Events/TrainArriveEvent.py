@@ -1,11 +1,9 @@
-from datetime import datetime
 from typing import List, Dict
 
 from Events.Event import Event
 from Events.LoadPassengerEvent import LoadPassengerEvent
 from Events.MovePassengerEvent import MovePassengerEvent
 from Events.UnloadPassengerEvent import UnloadPassengerEvent
-from Helpers.DateTime import add_seconds
 from Helpers.Speed import compute_loading_speed
 from Helpers.Ranges import random_between_percentage
 from Runtimes.Configuration import Configuration
@@ -17,7 +15,7 @@ class TrainArriveEvent(Event):
     Event that represents when the train arrives at the station
     """
 
-    def __init__(self, timestamp: datetime, configuration: Configuration):
+    def __init__(self, timestamp: float, configuration: Configuration):
         """
         Initialize a new TrainArriveEvent
         Args:
@@ -47,14 +45,14 @@ class TrainArriveEvent(Event):
                     events.append(
                         UnloadPassengerEvent(sector.train_car, sector, amount_leaving, self.timestamp,
                                              self.configuration))
-                    self.logger.info("Unloading {} in sector {}".format(amount_leaving, sector.sector_index))
+                    self.logger.info("Unloading %s in sector %s", amount_leaving, sector.sector_index)
                 else:
                     events.append(
                         LoadPassengerEvent(sector, sector.amount, self.timestamp, self.configuration))
-                    self.logger.info("Loading {} in sector {}".format(sector.amount, sector.sector_index))
+                    self.logger.info("Loading %s in sector %s", sector.amount, sector.sector_index)
             elif sector.amount > 0:
                 events.append(MovePassengerEvent(sector, sector.amount, self.timestamp, self.configuration))
-                self.logger.info("Moving {} in sector {}".format(sector.amount, sector.sector_index))
+                self.logger.info("Moving %s in sector %s", sector.amount, sector.sector_index)
         return events
 
     def __decide_unloading_count(self, environment: Environment) -> Dict[int, int]:
@@ -84,7 +82,7 @@ class TrainArriveEvent(Event):
                     # We first randomly choose using the configuration
                     # how many passengers should leave this car
                     nr_leaving = random_between_percentage(
-                        self.configuration.environment_random_seed,
+                        environment.random.unloading,
                         unload_range,
                         passenger_count
                     )
@@ -1,5 +1,4 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from Components.StationSector import StationSector
 from Components.TrainCar import TrainCar
@@ -14,25 +13,38 @@ class UnloadPassengerEvent(Event):
     """
     Event representing a single passenger leaving the train
     """
-    DOORS_OPENED = False
 
-    def __init__(self, train_car: Optional[TrainCar], sector: StationSector, amount: int, timestamp: datetime,
+    def __init__(self, train_car: Optional[TrainCar], sector: StationSector, amount: int, timestamp: float,
                  configuration: Configuration):
         self.amount = amount
         self.train_car: Optional[TrainCar] = train_car
         self.sector: StationSector = sector
         super().__init__(timestamp, configuration)
 
+    def rebind(self, configuration: Configuration, environment: Environment) -> Event:
+        event = super().rebind(configuration, environment)
+        event.sector = environment.station.sectors[self.sector.sector_index]
+        if self.train_car is not None:
+            event.train_car = environment.train[self.train_car.car_index]
+        return event
+
+    def log_fields(self) -> Dict[str, Any]:
+        fields = dict(super().log_fields(), sector=self.sector.sector_index)
+        if self.train_car is not None:
+            fields['car'] = self.train_car.car_index
+        return fields
+
     def fire(self, environment: Environment) -> List[Event]:
         # We must open the door before we can leave
         if not self.train_car.is_open():
             self.train_car.open_door()
-            action_time = self.configuration.time_door_action if not UnloadPassengerEvent.DOORS_OPENED else 0
+            # All the doors are opened at the same time, so only the first door takes time
+            action_time = self.configuration.time_door_action if not environment.train.doors_opened else 0
             self.do_action(
                 action_time,
-                'Opening train car {} door in train set {}'.format(self.train_car.index, self.train_car.train_set.index)
+                'Opening train car %s door in train set %s', self.train_car.index, self.train_car.train_set.index
             )
-            UnloadPassengerEvent.DOORS_OPENED = True
+            environment.train.doors_opened = True
 
         passengers_removed = self.train_car.remove(self.amount)
 
@@ -42,8 +54,9 @@ class UnloadPassengerEvent(Event):
             unloading_speed = compute_loading_speed(passenger, 1)
             speed += unloading_speed
 
-        self.do_action(speed, "Unloaded {} from with car {} in set {} parked in sector {}".format(
-            len(passengers_removed), self.train_car.index, self.train_car.train_set.index, self.sector.sector_index))
+        self.do_action(speed, "Unloaded %s from with car %s in set %s parked in sector %s",
+                       len(passengers_removed), self.train_car.index, self.train_car.train_set.index,
+                       self.sector.sector_index)
 
         # The train is now empty, so now we can
         # start loading passengers into the car.
@@ -11,3 +11,17 @@ def add_seconds(dt: datetime, seconds) -> datetime:
         The dt with the added seconds
     """
     return dt + timedelta(seconds=seconds)
+
+
+def to_datetime(epoch: datetime, seconds: float) -> datetime:
+    """
+    Convert a simulation timestamp to a datetime.
+    The simulation clock counts seconds since the simulation epoch, so this is
+    only needed when reporting the results.
+    Args:
+        epoch: The datetime the simulation clock started at
+        seconds: The simulation timestamp in seconds
+    Returns:
+        The datetime of the simulation timestamp
+    """
+    return add_seconds(epoch, seconds)
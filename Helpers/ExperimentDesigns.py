@@ -0,0 +1,76 @@
+from itertools import product
+from typing import Any, Dict, List
+
+from numpy.random import Generator
+
+from Helpers.Factor import Factor
+
+
+def full_factorial(factors: List[Factor]) -> List[Dict[str, Any]]:
+    """
+    Create every combination of the levels of the factors.
+    The last factor varies fastest.
+    Args:
+        factors: The factors, each must have levels
+    Raises:
+        ValueError: Thrown if a factor only has an interval
+    Returns:
+        A list with the values of the factors for each point
+    """
+    for factor in factors:
+        if not factor.is_discrete:
+            raise ValueError("The factor {} needs levels for a full factorial design".format(factor.name))
+    names = [factor.name for factor in factors]
+    return [dict(zip(names, values)) for values in product(*(factor.levels for factor in factors))]
+
+
+def random_design(factors: List[Factor], samples: int, generator: Generator) -> List[Dict[str, Any]]:
+    """
+    Draw every factor of every point independently and uniformly
+    Args:
+        factors: The factors
+        samples: The amount of points
+        generator: The random generator to draw from
+    Returns:
+        A list with the values of the factors for each point
+    """
+    units = generator.random((samples, len(factors)))
+    return [{factor.name: factor.value(u) for factor, u in zip(factors, row)} for row in units]
+
+
+def latin_hypercube(factors: List[Factor], samples: int, generator: Generator) -> List[Dict[str, Any]]:
+    """
+    Latin hypercube sample: the range of every factor is split into as many strata as there are points,
+    and every stratum is used by exactly one point, so each factor is covered evenly
+    even when there are few points and many factors.
+    Args:
+        factors: The factors
+        samples: The amount of points
+        generator: The random generator to draw from
+    Returns:
+        A list with the values of the factors for each point
+    """
+    columns = [(generator.permutation(samples) + generator.random(samples)) / samples for _ in factors]
+    return [{factor.name: factor.value(column[i]) for factor, column in zip(factors, columns)}
+            for i in range(samples)]
+
+
+def one_at_a_time(factors: List[Factor], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Vary one factor at a time from the baseline.
+    The first point is the baseline itself, followed by every other level of every factor.
+    Args:
+        factors: The factors, each must have levels
+        baseline: The options of the baseline
+    Raises:
+        ValueError: Thrown if a factor only has an interval
+    Returns:
+        A list with the values of the varied factor for each point, the baseline point has no values
+    """
+    for factor in factors:
+        if not factor.is_discrete:
+            raise ValueError("The factor {} needs levels for a one at a time design".format(factor.name))
+    points: List[Dict[str, Any]] = [{}]
+    for factor in factors:
+        points.extend({factor.name: level} for level in factor.levels if level != baseline.get(factor.name))
+    return points
@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+
+class Factor:
+    """
+    A parameter varied in a sweep, either with discrete levels or over a continuous interval.
+    Sampling designs map a number in [0, 1) to a value of the factor,
+    and the full factorial design uses the levels of the factor.
+    """
+
+    def __init__(self, name: str, levels: Optional[List[Any]] = None,
+                 low: Optional[float] = None, high: Optional[float] = None, integer: bool = False):
+        """
+        Initialize a new factor
+        Args:
+            name: The name of the option the factor varies
+            levels: The discrete values of the factor. If provided, the interval is not used.
+            low: The lowest value of the interval
+            high: The highest value of the interval, included for integer factors
+            integer: Whether the values of the interval are integers
+        Raises:
+            ValueError: Thrown if the factor has neither levels nor an interval, or the interval is empty
+        """
+        if levels is None and (low is None or high is None):
+            raise ValueError("The factor {} must have levels or a low and high value".format(name))
+        if levels is not None and len(levels) == 0:
+            raise ValueError("The factor {} must have at least one level".format(name))
+        if levels is None and high < low:
+            raise ValueError("The factor {} has a high value below its low value".format(name))
+        self.name = name
+        self.levels = None if levels is None else list(levels)
+        self.low = low
+        self.high = high
+        self.integer = integer
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        if self.levels is not None:
+            return 'Factor ({}: {})'.format(self.name, self.levels)
+        return 'Factor ({}: [{}, {}]{})'.format(self.name, self.low, self.high, ', integer' if self.integer else '')
+
+    @staticmethod
+    def from_spec(name: str, spec: Union[List, Dict]) -> 'Factor':
+        """
+        Create a factor from its sweep specification.
+        A list gives the levels, and a dictionary gives the interval with "min" and "max",
+        optionally with "integer": true and "levels": n to split the interval into n levels for a grid.
+        Args:
+            name: The name of the option the factor varies
+            spec: The specification of the factor
+        Returns:
+            The factor
+        """
+        if isinstance(spec, list):
+            return Factor(name, levels=spec)
+        if not isinstance(spec, dict) or 'min' not in spec or 'max' not in spec:
+            raise ValueError("The factor {} must be a list of levels or a dictionary with min and max".format(name))
+        integer = bool(spec.get('integer', False))
+        levels = None
+        if 'levels' in spec:
+            values = np.linspace(spec['min'], spec['max'], int(spec['levels']))
+            levels = sorted({int(round(v)) for v in values}) if integer else [float(v) for v in values]
+        return Factor(name, levels, spec['min'], spec['max'], integer)
+
+    @property
+    def is_discrete(self) -> bool:
+        return self.levels is not None
+
+    def value(self, u: float) -> Any:
+        """
+        Map a number in [0, 1) to a value of the factor
+        Args:
+            u: The number in [0, 1)
+        Returns:
+            The level the number falls in, or the value of the interval at the number
+        """
+        if self.levels is not None:
+            return self.levels[min(int(u * len(self.levels)), len(self.levels) - 1)]
+        if self.integer:
+            return int(self.low) + min(int(u * (self.high - self.low + 1)), int(self.high - self.low))
+        return float(self.low + u * (self.high - self.low))
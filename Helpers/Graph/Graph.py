@@ -1,20 +1,48 @@
 from abc import ABC, abstractmethod
 from Runtimes.ApplicationRuntime import ApplicationRunTime
-from typing import List
+from Runtimes.ResultStore import ResultStore
+from typing import Iterator, List, Tuple, Union
 from Helpers.Object import get_deep_attr, has_deep_attr
 from datetime import datetime
-
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-except ImportError as e:
-    raise BaseException('matplotlib could not be imported. Make sure it is properly installed. %s' % e)
+import os
+import sys
+
+
+def is_headless() -> bool:
+    """
+    Check whether there is no display to show the figures on
+    Returns:
+        True if there is no display, False if there is
+    """
+    if sys.platform in ('win32', 'darwin'):
+        return False
+    return not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY')
+
+
+def import_pyplot():
+    """
+    Import matplotlib.pyplot. Matplotlib is only imported when a graph is drawn,
+    so running the simulations does not pay for its import.
+    When there is no display and no backend has been chosen, the non-interactive Agg backend is used.
+    Raises:
+        BaseException: Thrown if matplotlib is not installed
+    Returns:
+        The pyplot module
+    """
+    try:
+        import matplotlib
+        if is_headless() and 'MPLBACKEND' not in os.environ:
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise BaseException('matplotlib could not be imported. Make sure it is properly installed. %s' % e)
+    return plt
 
 
 class Graph(ABC):
     def __init__(
             self,
-            samples: List[ApplicationRunTime],
+            samples: Union[List[ApplicationRunTime], ResultStore],
             x_param: str,
             y_param: str,
             comparison_param: str,
@@ -28,8 +56,9 @@ class Graph(ABC):
         """
 
         Args:
-            samples: Runtime samples
-            x_param: Attribute to be extracted from runtime, i.e: runtime.environment.train.arrival_time
+            samples: Runtime samples, or a result store with the metrics of the runtimes
+            x_param: Attribute to be extracted from runtime, i.e: runtime.environment.train.arrival_time.
+                When a result store is provided, this is the name of the metric.
             y_param: Attribute to be extracted from runtime, i.e: runtime.environment.train.arrival_time
             comparison_param: Attribute to be extracted from runtime, i.e: runtime.environment.train.arrival_time
             *args:
@@ -72,23 +101,7 @@ class SimpleGraph(Graph):
         Prepares the data to be graphed.
         """
 
-        for i, r in enumerate(self.samples):
-            # Get the parameters from the objects
-            if has_deep_attr(r, self.y_param):
-                y_value = get_deep_attr(r, self.y_param)
-            else:
-                raise Exception('y_param attribute does not exist.')
-
-            if has_deep_attr(r, self.x_param):
-                x_value = get_deep_attr(r, self.x_param)
-            else:
-                raise Exception('x_param attribute does not exist.')
-
-            if has_deep_attr(r, self.comparison_param):
-                comparison_value = get_deep_attr(r, self.comparison_param)
-            else:
-                raise Exception('comparison_value attribute does not exist.')
-
+        for x_value, y_value, comparison_value in self.__values():
             # If comparison values have different values across all simulations,
             # two graphs will be plotted together. That is why we have a list of axes (x, y), one
             # for each dictionary key.
@@ -106,10 +119,46 @@ class SimpleGraph(Graph):
                 # Keys do not exist
                 self.axes[key] = [[x_value], [y_value]]
 
+    def __values(self) -> Iterator[Tuple]:
+        """
+        Get the x, y and comparison values of every sample
+        Returns:
+            An iterator of tuples with (x_value, y_value, comparison_value)
+        """
+        if isinstance(self.samples, ResultStore):
+            for param, name in ((self.y_param, 'y_param'), (self.x_param, 'x_param'),
+                                (self.comparison_param, 'comparison_value')):
+                if param not in self.samples:
+                    raise Exception('%s attribute does not exist.' % name)
+            yield from zip(self.samples[self.x_param].tolist(),
+                           self.samples[self.y_param].tolist(),
+                           self.samples[self.comparison_param].tolist())
+            return
+
+        for r in self.samples:
+            # Get the parameters from the objects
+            if has_deep_attr(r, self.y_param):
+                y_value = get_deep_attr(r, self.y_param)
+            else:
+                raise Exception('y_param attribute does not exist.')
+
+            if has_deep_attr(r, self.x_param):
+                x_value = get_deep_attr(r, self.x_param)
+            else:
+                raise Exception('x_param attribute does not exist.')
+
+            if has_deep_attr(r, self.comparison_param):
+                comparison_value = get_deep_attr(r, self.comparison_param)
+            else:
+                raise Exception('comparison_value attribute does not exist.')
+
+            yield x_value, y_value, comparison_value
+
     def draw(self):
         """
         Plots graph.
         """
+        plt = import_pyplot()
         # Gets the data
         self.compile_data()
 
@@ -140,4 +189,6 @@ class SimpleGraph(Graph):
             _stamp,
             self.file_format
         ))
-        plt.show()
+        # There is nothing to show the figure on without a display, it is only saved
+        if not is_headless():
+            plt.show()
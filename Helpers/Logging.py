@@ -0,0 +1,139 @@
+import atexit
+import json
+import logging
+import logging.config
+import os
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional
+
+# The attributes every log record has, anything else has been passed with extra={...}
+RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+# The listener writing the queued records while asynchronous logging is configured
+_listener: Optional[QueueListener] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats the log records as compact JSON lines with the time, level, logger and message,
+    plus the fields passed with extra={...}, so the logs of a sweep can be parsed by tools.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES:
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+        return json.dumps(data, default=str, separators=(',', ':'))
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves the formatting of the records to the listener thread.
+    The default QueueHandler formats the message before the record is queued,
+    which would keep the formatting cost on the simulation thread.
+    The arguments of the records are therefore formatted later, so they should not be changed after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The traceback is bound to the current frames, so it must be rendered right away
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def configure_logging(
+        config_file: str = 'logging.json',
+        silence: bool = False,
+        asynchronous: bool = False,
+        structured: bool = False,
+        level: Optional[str] = None
+) -> None:
+    """
+    Configure the logging from the JSON dictConfig file
+    Args:
+        config_file: The logging configuration file
+        silence: Disable all logging
+        asynchronous: Queue the records and let a listener thread format and write them,
+            so the file I/O does not happen on the simulation thread
+        structured: Format the records of all the handlers as JSON lines
+        level: Optional level of the root logger, overriding the level in the configuration file
+    """
+    global _listener
+    stop_logging()
+    with open(config_file, 'rt') as f:
+        config = json.load(f)
+    if structured:
+        config.setdefault('formatters', {})['structured'] = {'()': StructuredFormatter}
+        for handler in config.get('handlers', {}).values():
+            handler['formatter'] = 'structured'
+    if level is not None:
+        config.setdefault('root', {})['level'] = level
+    logging.config.dictConfig(config)
+
+    # Toggles logging
+    logging.disable(logging.CRITICAL if silence else logging.NOTSET)
+
+    if asynchronous and not silence:
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        for handler in handlers:
+            root.removeHandler(handler)
+        records = SimpleQueue()
+        root.addHandler(DeferredQueueHandler(records))
+        _listener = QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Stop the asynchronous logging, if it is configured.
+    The queued records are written and the handlers are attached to the root logger again.
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    _attach_handlers(listener)
+
+
+def _attach_handlers(listener: QueueListener) -> None:
+    """
+    Replace the queue handlers of the root logger with the handlers of the listener
+    Args:
+        listener: The listener of the queue handlers
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
+
+
+def _after_fork() -> None:
+    """
+    The listener thread does not exist in forked worker processes,
+    so the workers write their records synchronously instead
+    """
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        _attach_handlers(listener)
+
+
+atexit.register(stop_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -1,37 +1,42 @@
-from typing import TypeVar, List
+from typing import TypeVar, List, Optional, Union
 
-from numpy import random
+import numpy as np
+from numpy.random import Generator
 from random import choice
 
 T = TypeVar("T")
 
 
-def random_between_range(seed: int, rang: range) -> int:
+def random_between_range(generator: Generator, rang: range, size: Optional[int] = None) -> Union[int, np.ndarray]:
     """
     Get a random between the provided range object
     Args:
-        seed: The seed to be used (usually passed from the configuration object). If None is passed, we use Python's.
+        generator: The random generator to draw from (usually one of the environment random streams).
         rang: The range object defining the interval
-    Returns: An integer i where rang.start <= i < rang.stop
+        size: If provided, an array with this amount of randoms is drawn at once
+    Returns: An integer i where rang.start <= i < rang.stop, or an array of them if the size is provided
     """
-    random.seed(seed)
     if rang.start >= rang.stop:
-        return rang.start
-    return random.randint(rang.start, rang.stop)
+        return rang.start if size is None else np.full(size, rang.start, dtype=np.int64)
+    if size is None:
+        return int(generator.integers(rang.start, rang.stop))
+    return generator.integers(rang.start, rang.stop, size)
 
 
-def random_between_percentage(seed: int, rang: range, max_cap: int) -> float:
+def random_between_percentage(generator: Generator, rang: range, max_cap: int,
+                              size: Optional[int] = None) -> Union[float, np.ndarray]:
     """
     Compute a random number under the max_cap within the range percentage.
     It is computed as (random_percentage / 100 * max_cap)
     Args:
-        seed: The seed to be used (usually passed from the configuration object). If None is passed, we use Python's.
+        generator: The random generator to draw from (usually one of the environment random streams).
         rang: The range object between should be values 0 and 100
         max_cap: The maximum number to be returned.
             In the case that the random percentage is 100, then max_cap is returned.
-    Returns: The computed random number using the formula above
+        size: If provided, an array with this amount of randoms is drawn at once
+    Returns: The computed random number using the formula above, or an array of them if the size is provided
     """
-    return random_between_range(seed, rang) / 100 * max_cap
+    return random_between_range(generator, rang, size) / 100 * max_cap
 
 
 def random_choice(choices: List[T]) -> T:
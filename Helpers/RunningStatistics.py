@@ -0,0 +1,107 @@
+from math import sqrt
+from typing import Dict, Iterable, Optional, Tuple
+
+from Helpers.Statistics import t_critical_value
+
+
+class RunningStatistics:
+    """
+    Mean and variance of a stream of values, updated one value at a time (Welford's algorithm),
+    with the Student's t confidence interval of the mean.
+    """
+
+    def __init__(self, values: Optional[Iterable[float]] = None):
+        """
+        Initialize the statistics
+        Args:
+            values: Optional values to add right away
+        """
+        self.__count = 0
+        self.__mean = 0.0
+        # Sum of the squared differences from the mean
+        self.__squares = 0.0
+        if values is not None:
+            for value in values:
+                self.add(value)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return 'RunningStatistics (n: {}, mean: {}, variance: {})'.format(self.count, self.mean, self.variance)
+
+    def add(self, value: float) -> None:
+        """
+        Add a value to the statistics
+        Args:
+            value: The new value
+        """
+        self.__count += 1
+        delta = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__squares += delta * (value - self.__mean)
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def mean(self) -> float:
+        """
+        Get the mean of the values
+        Returns: The mean, or nan if there are no values
+        """
+        return self.__mean if self.__count > 0 else float('nan')
+
+    @property
+    def variance(self) -> float:
+        """
+        Get the sample variance of the values
+        Returns: The sample variance, or nan if there are fewer than two values
+        """
+        return self.__squares / (self.__count - 1) if self.__count > 1 else float('nan')
+
+    @property
+    def standard_deviation(self) -> float:
+        return sqrt(self.variance)
+
+    def half_width(self, confidence: float = 0.95) -> float:
+        """
+        Get the half width of the confidence interval of the mean
+        Args:
+            confidence: The confidence level
+        Returns:
+            The half width, or infinity if there are fewer than two values
+        """
+        if self.__count < 2:
+            return float('inf')
+        return t_critical_value(confidence, self.__count - 1) * sqrt(self.variance / self.__count)
+
+    def confidence_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        Get the confidence interval of the mean
+        Args:
+            confidence: The confidence level
+        Returns:
+            A tuple with the (lower, upper) bound of the interval
+        """
+        half_width = self.half_width(confidence)
+        return self.mean - half_width, self.mean + half_width
+
+    def summary(self, confidence: float = 0.95) -> Dict[str, float]:
+        """
+        Get a summary of the statistics
+        Args:
+            confidence: The confidence level of the interval
+        Returns:
+            A dictionary with the count, mean, variance, half width and interval bounds
+        """
+        lower, upper = self.confidence_interval(confidence)
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'variance': self.variance,
+            'half_width': self.half_width(confidence),
+            'lower': lower,
+            'upper': upper,
+        }
@@ -0,0 +1,169 @@
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional
+
+from Components.LightStatus import LightStatus
+from Components.StationSector import StationSector
+
+
+class SectorIndex:
+    """
+    Spatial index over the station sectors, grouped by their light status.
+    The index is built once per light assignment and shared by everyone querying
+    the neighbourhood of a sector, instead of computing a distance matrix per sector.
+
+    A sector is *within* a distance d of another sector if 1 <= |i - j| < int(d),
+    so the sector itself is never part of the result. Sectors at the same distance
+    are ordered left (lower index) before right.
+    """
+
+    def __init__(self, sectors: List[StationSector]):
+        """
+        Build the index from the current light status of the sectors
+        Args:
+            sectors: The station sectors ordered by their sector index
+        """
+        self.__sectors = sectors
+        # Maps each light status to the sorted sector indexes that have that status
+        self.__indexes: Dict[Optional[LightStatus], List[int]] = dict()
+        for sector in sectors:
+            self.__indexes.setdefault(sector.light.status, []).append(sector.sector_index)
+
+    def get_nearest(self, sector: StationSector, status: LightStatus, distance: float = None) -> Optional[StationSector]:
+        """
+        Get the nearest sector with the provided light status in O(log S)
+        Args:
+            sector: The sector to search from
+            status: The light status of the nearest sector
+            distance: Optional distance the nearest sector must be within
+        Returns:
+            The nearest StationSector, or None if there is no sector with the status (within the distance)
+        """
+        nearest = self.__nearest_distance(sector.sector_index, status)
+        if nearest is None or (distance is not None and nearest >= int(distance)):
+            return None
+        return self.__at_distance(sector.sector_index, nearest, status)[0]
+
+    def get_nearest_with(self, sector: StationSector,
+                         predicate: Callable[[StationSector], bool]) -> Optional[StationSector]:
+        """
+        Get the nearest sector that satisfies the predicate, by walking outwards from the sector.
+        Useful for conditions that change while the passengers move, like a train car being full.
+        Args:
+            sector: The sector to search from
+            predicate: Function deciding whether a sector is a match
+        Returns:
+            The nearest StationSector satisfying the predicate, or None if there is none
+        """
+        index = sector.sector_index
+        for distance in range(1, len(self.__sectors)):
+            for i in (index - distance, index + distance):
+                if 0 <= i < len(self.__sectors) and predicate(self.__sectors[i]):
+                    return self.__sectors[i]
+        return None
+
+    def has_sector_within_distance(self, sector: StationSector, distance: float, status: LightStatus) -> bool:
+        """
+        Check if there is a sector within the distance with the provided status in O(log S)
+        Args:
+            sector: The sector to search from
+            distance: The distance from the sector
+            status: The light status
+        Returns:
+            True if there is a StationSector within the distance with the given status
+        """
+        nearest = self.__nearest_distance(sector.sector_index, status)
+        return nearest is not None and nearest < int(distance)
+
+    def get_sector_within_distance(self, sector: StationSector, distance: float, status: LightStatus,
+                                   with_least: bool = False) -> Optional[StationSector]:
+        """
+        Get the nearest sector within the distance with the provided light status in O(log S)
+        Args:
+            sector: The sector to search from
+            distance: The distance of the sector
+            status: The status of the sector
+            with_least: Whether or not to return the sector with least passengers,
+                if there is a sector on both sides at the nearest distance
+        Returns:
+            The StationSector with the status within the distance, or None if there is none
+        """
+        nearest = self.__nearest_distance(sector.sector_index, status)
+        if nearest is None or nearest >= int(distance):
+            return None
+        candidates = self.__at_distance(sector.sector_index, nearest, status)
+        if not with_least:
+            return candidates[0]
+        return min(candidates, key=lambda s: s.amount)
+
+    def get_sectors_within_distance(self, sector: StationSector, distance: float,
+                                    status: LightStatus) -> List[StationSector]:
+        """
+        Get sectors within the provided distance that has the provided light status in O(log S + k)
+        Args:
+            sector: The sector to search from
+            distance: The distance to get sectors within
+            status: The status that the lights should have
+        Returns:
+            A list with sectors that are within reach with the status, ordered by their distance
+        """
+        indexes = self.__indexes.get(status)
+        reach = int(distance) - 1
+        if not indexes or reach < 1:
+            return []
+        index = sector.sector_index
+        window = indexes[bisect_left(indexes, index - reach):bisect_right(indexes, index + reach)]
+        window = sorted((i for i in window if i != index), key=lambda i: (abs(i - index), i))
+        return [self.__sectors[i] for i in window]
+
+    def get_least_populated_within_distance(self, sector: StationSector, distance: float,
+                                            status: LightStatus) -> Optional[StationSector]:
+        """
+        Get the sector with the fewest passengers within the distance with the provided light status
+        Args:
+            sector: The sector to search from
+            distance: The distance to search within
+            status: The status that the light should have
+        Returns:
+            The least populated StationSector, the nearest one if there is a tie, or None if there is none
+        """
+        sectors = self.get_sectors_within_distance(sector, distance, status)
+        return min(sectors, key=lambda s: s.amount) if len(sectors) > 0 else None
+
+    def __nearest_distance(self, index: int, status: LightStatus) -> Optional[int]:
+        """
+        Get the distance to the nearest other sector with the provided status
+        Args:
+            index: The sector index to search from
+            status: The light status
+        Returns:
+            The distance, or None if there is no other sector with the status
+        """
+        indexes = self.__indexes.get(status)
+        if not indexes:
+            return None
+        position = bisect_left(indexes, index)
+        distances = []
+        # The nearest on the left is just before the position
+        if position > 0:
+            distances.append(index - indexes[position - 1])
+        # The nearest on the right is at the position, unless it is the sector itself
+        if position < len(indexes) and indexes[position] == index:
+            position += 1
+        if position < len(indexes):
+            distances.append(indexes[position] - index)
+        return min(distances) if len(distances) > 0 else None
+
+    def __at_distance(self, index: int, distance: int, status: LightStatus) -> List[StationSector]:
+        """
+        Get the sectors at exactly the distance with the provided status, left before right
+        Args:
+            index: The sector index to search from
+            distance: The exact distance
+            status: The light status
+        Returns:
+            A list with at most two sectors
+        """
+        return [
+            self.__sectors[i] for i in (index - distance, index + distance)
+            if 0 <= i < len(self.__sectors) and self.__sectors[i].light.status == status
+        ]
@@ -0,0 +1,54 @@
+from math import atan, cos, pi, sin, sqrt
+
+
+def student_t_probability(t: float, degrees_of_freedom: int) -> float:
+    """
+    Compute the probability that a Student's t distributed variable is within [-t, t].
+    Uses the exact finite series for integer degrees of freedom.
+    Args:
+        t: The (non-negative) bound
+        degrees_of_freedom: The degrees of freedom of the distribution, at least 1
+    Returns:
+        The probability P(|T| < t)
+    """
+    if degrees_of_freedom < 1:
+        raise ValueError("The degrees of freedom must be at least 1")
+    theta = atan(abs(t) / sqrt(degrees_of_freedom))
+    c2 = cos(theta) ** 2
+    if degrees_of_freedom % 2 == 1:
+        # 2 / pi * (theta + sin cos (1 + 2/3 cos^2 + 2*4/(3*5) cos^4 + ...))
+        term, series = 1.0, 1.0 if degrees_of_freedom > 1 else 0.0
+        for k in range(2, degrees_of_freedom - 1, 2):
+            term *= k / (k + 1) * c2
+            series += term
+        return 2 / pi * (theta + sin(theta) * cos(theta) * series)
+    # sin (1 + 1/2 cos^2 + 1*3/(2*4) cos^4 + ...)
+    term, series = 1.0, 1.0
+    for k in range(1, degrees_of_freedom - 2, 2):
+        term *= k / (k + 1) * c2
+        series += term
+    return sin(theta) * series
+
+
+def t_critical_value(confidence: float, degrees_of_freedom: int) -> float:
+    """
+    Compute the two-sided critical value of the Student's t distribution
+    Args:
+        confidence: The confidence level, e.g. 0.95
+        degrees_of_freedom: The degrees of freedom, at least 1
+    Returns:
+        The value t where P(|T| < t) equals the confidence
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("The confidence must be between 0 and 1")
+    low, high = 0.0, 1.0
+    while student_t_probability(high, degrees_of_freedom) < confidence:
+        high *= 2
+    # The probability is monotone in t, so a bisection converges to the critical value
+    for _ in range(100):
+        middle = (low + high) / 2
+        if student_t_probability(middle, degrees_of_freedom) < confidence:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
@@ -1,11 +1,17 @@
 import sys, getopt
-import json
-import logging.config
+from functools import partial
 
 from Distributions.NormalDistribution import NormalDistribution
+from Helpers.Logging import configure_logging
 from Runtimes.ApplicationRuntime import ApplicationRunTime
-from Helpers.Graph.Graph import SimpleGraph
-from Runtimes.Environment import Environment
+from Runtimes.EventProfiler import EventProfiler
+from Runtimes.PairedRunTime import PairedRunTime
+from Runtimes.ResultCache import ResultCache
+from Runtimes.ResultStore import ResultStore
+from Runtimes.ResumableSweepRunTime import ResumableSweepRunTime
+from Runtimes.SweepJournal import SweepJournal
+from Runtimes.SweepRunTime import SweepRunTime, record_simulation
+from Runtimes.SweepSpecification import SweepSpecification
 
 options: dict = {
     "passenger_weight_distribution": NormalDistribution(80, 10),
@@ -15,6 +21,7 @@ options: dict = {
     "passenger_regular_size": 0.5,
     "passenger_max_walk_range": range(16, 16),
     "passenger_compliance": 1,
+    "passenger_store": "list",
     "train_capacity": 100,
     "train_fullness": [30, 40, 25, 33, 52, 30, 25, 60],
     "train_unload_percent": [30, 30, 30, 30, 30, 30, 30, 30],
@@ -36,45 +43,65 @@ options: dict = {
 }
 
 
-def start_simulation(silence=False, plot=False):
+def start_simulation(logging_options, plot=False, workers=1, output=None, cache=None, profile=None, spec=None,
+                     journal=None, resume=False):
     # Create the logger configuration from the json file
-    with open('logging.json', 'rt') as f:
-        config = json.load(f)
-    logging.config.dictConfig(config)
+    configure_logging('logging.json', **logging_options)
 
-    # Toggles logging
-    logging.disable() if silence else None
+    if spec is None:
+        # By default we compare with and without lights for several sector capacities
+        specification = SweepSpecification.from_dict({
+            'parameters': {
+                'station_have_lights': [True, False],
+                'station_sector_passenger_max_count': [30, 50, 55, 60, 65, 70, 80, 85, 90]
+            },
+            'design': 'grid'
+        }, defaults=options)
+    else:
+        # The options of the specification file are added to the default options
+        specification = SweepSpecification.load(spec, defaults=options)
+    points = specification.points()
+    if specification.duplicates > 0:
+        print("Skipping {} duplicate points".format(specification.duplicates))
 
-    # Stores simulation examples
-    samples = []
+    print("Running simulation of {} points...".format(len(points)))
 
-    # Possible combinations for the simulation
-    plots = {
-        'station_have_lights': [True, False]
-    }
+    # Only the metrics of each simulation are kept, the environments are freed as the sweep runs
+    # Points that are already in the result cache are not simulated again
+    task = partial(record_simulation, cache=None if cache is None else ResultCache(cache), profile=profile is not None)
+    if journal is None:
+        sweep = SweepRunTime(points, workers=workers, task=task)
+        records = [record for _, record in sweep.iterate()]
+    else:
+        # Every completed point is written to the journal, so an interrupted sweep can be resumed
+        with SweepJournal(journal, resume=resume) as sweep_journal:
+            sweep = ResumableSweepRunTime(points, sweep_journal, workers=workers, task=task)
+            sweep.run()
+            records = sweep.results
+        if sweep.resumed > 0:
+            print("Resumed {} points from {}".format(sweep.resumed, journal))
 
-    changes = {
-        'station_sector_passenger_max_count': [30, 50, 55, 60, 65, 70, 80, 85, 90]
-    }
+    samples = ResultStore()
+    profiler = EventProfiler.aggregate([])
+    for record in records:
+        samples.append(record)
+        if 'profile' in record:
+            profiler.merge(EventProfiler.from_dict(record['profile']))
 
-    # We run different simulations with the different parameters saved above
-    # Here we modify the options. We plot different values for 'plots' together with 'changes'
-    print("Running simulation...")
+    print("Simulations finished.")
 
-    for k, vls in plots.items():
-        for v in vls:
-            for key, values in changes.items():
-                for value in values:
-                    options[k] = v
-                    options[key] = value
-                    application = ApplicationRunTime(options)
-                    application.run()
-                    samples.append(application)
+    if output is not None:
+        print("Saving results to {}...".format(output))
+        samples.save(output)
 
-    print("Simulations finished.")
+    if profile is not None:
+        print("Saving event profile to {}...".format(profile))
+        profiler.to_json(profile)
 
     if plot:
         print("Plotting graph...")
+        # Matplotlib is only imported when a graph is plotted
+        from Helpers.Graph.Graph import SimpleGraph
         s_graph = SimpleGraph(
             samples,
             # Values in X
@@ -92,6 +119,46 @@ def start_simulation(silence=False, plot=False):
     print("Finished!")
 
 
+def start_trace(logging_options, trace='trace.json'):
+    # Create the logger configuration from the json file
+    configure_logging('logging.json', **logging_options)
+
+    print("Tracing simulation...")
+    application = ApplicationRunTime(dict(options, station_have_lights=True), trace=True)
+    application.run()
+    application.tracer.save(trace)
+    print("Saved the timeline to {}. Open it in chrome://tracing or https://ui.perfetto.dev".format(trace))
+
+
+def start_paired_comparison(logging_options, replications=10, workers=1):
+    # Create the logger configuration from the json file
+    configure_logging('logging.json', **logging_options)
+
+    # The variants are run from the same populated station and train for every replication
+    variants = {
+        'Without lights': {'station_have_lights': False},
+        'With lights': {'station_have_lights': True}
+    }
+
+    changes = {
+        'station_sector_passenger_max_count': [30, 50, 55, 60, 65, 70, 80, 85, 90]
+    }
+
+    print("Running paired comparison with {} replications...".format(replications))
+
+    for key, values in changes.items():
+        for value in values:
+            # The lights are first used when the weight is received, so the events before are only run once
+            paired = PairedRunTime(dict(options, **{key: value}), variants, replications=replications,
+                                   workers=workers, checkpoint_at='ReceiveWeightEvent')
+            paired.run()
+            difference = paired.summary['differences']['With lights']
+            print("{}={}: with lights - without lights = {:.2f} +/- {:.2f}".format(
+                key, value, difference['mean'], difference['half_width']))
+
+    print("Finished!")
+
+
 def introduction():
     PRESENTATION = """
     ###############################################################
@@ -133,26 +200,73 @@ def usage():
     Usage:
              -s, --silence  Toggles logging
              -p, --plot-graph  Draw a graph with the simulation result
+             -w, --workers  Amount of worker processes to run the simulations with
+             -o, --output  Save the simulation results to the file (.csv or .npz)
+             -c, --cache  Directory to cache the simulation results in
+             -r, --paired  Compare with and without lights using this amount of paired replications
+             -P, --profile  Save the event counters of the simulations to the JSON file
+             -t, --trace  Run a single simulation and save its timeline to the Chrome trace JSON file
+             -S, --spec  Run the sweep described by the JSON specification file instead of the default sweep
+             -j, --journal  Write the result of every completed point to the journal file
+             --resume  Skip the points that are already in the journal instead of starting it over
+             --async-logging  Write the logs on a background thread instead of the simulation thread
+             --structured-logging  Write the logs as JSON lines
+             --log-level  The minimum level of the logged messages, for example WARNING
     """
     print(instructions)
 
 
 def main():
     try:
-        opts, args = getopt.getopt(sys.argv[1:], ":hsn", ["help"])
+        opts, args = getopt.getopt(sys.argv[1:], ":hsnw:o:c:r:P:t:S:j:", [
+            "help", "workers=", "output=", "cache=", "paired=", "profile=", "trace=", "spec=", "journal=", "resume",
+            "async-logging", "structured-logging", "log-level="])
     except getopt.GetoptError as err:
         print(err)
         usage()
         sys.exit(2)
 
-    silence = False
+    logging_options = {'silence': False, 'asynchronous': False, 'structured': False, 'level': None}
     plot_graph = True
+    workers = 1
+    output = None
+    cache = None
+    paired = None
+    profile = None
+    trace = None
+    spec = None
+    journal = None
+    resume = False
 
     for o, a in opts:
         if o in ("-s", "--silence"):
-            silence = True
+            logging_options['silence'] = True
+        elif o == "--async-logging":
+            logging_options['asynchronous'] = True
+        elif o == "--structured-logging":
+            logging_options['structured'] = True
+        elif o == "--log-level":
+            logging_options['level'] = a.upper()
         elif o in ("-n", "--no-plotting"):
             plot_graph = False
+        elif o in ("-w", "--workers"):
+            workers = int(a)
+        elif o in ("-o", "--output"):
+            output = a
+        elif o in ("-c", "--cache"):
+            cache = a
+        elif o in ("-r", "--paired"):
+            paired = int(a)
+        elif o in ("-P", "--profile"):
+            profile = a
+        elif o in ("-t", "--trace"):
+            trace = a
+        elif o in ("-S", "--spec"):
+            spec = a
+        elif o in ("-j", "--journal"):
+            journal = a
+        elif o == "--resume":
+            resume = True
         elif o in ("-h", "--help"):
             usage()
             sys.exit()
@@ -161,7 +275,12 @@ def main():
 
     # Starts simulation
     introduction()
-    start_simulation(silence, plot_graph)
+    if trace is not None:
+        start_trace(logging_options, trace)
+    elif paired is not None:
+        start_paired_comparison(logging_options, paired, workers)
+    else:
+        start_simulation(logging_options, plot_graph, workers, output, cache, profile, spec, journal, resume)
     sys.exit()
 
 
@@ -1,8 +1,13 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
 
+from Runtimes.Checkpoint import Checkpoint
 from Runtimes.Configuration import Configuration
 from Runtimes.Environment import Environment
+from Runtimes.EventProfiler import EventProfiler
+from Runtimes.EventTracer import EventTracer
 from Runtimes.EventRunTime import EventRunTime
+from Runtimes.ResultCache import ResultCache
+from Runtimes.ResultStore import DEFAULT_METRICS, extract_record
 from Runtimes.RunTime import RunTime
 import Helpers.Pickle as p
 
@@ -13,13 +18,84 @@ class ApplicationRunTime(RunTime):
     This includes both the GUI and the event chain.
     """
 
-    def __init__(self, options: dict, environment: Optional[Environment] = None):
+    def __init__(self, options: Union[dict, Configuration], environment: Optional[Environment] = None,
+                 cache: Optional[ResultCache] = None, metrics: Optional[List[str]] = None,
+                 checkpoint: Optional[Checkpoint] = None, profile: bool = False, trace: bool = False):
         """
         Initialize a new application runtime
+        Args:
+            options: The simulation options, or a configuration created from them
+            environment: Optional environment to run the simulation in. Is created when first used if not provided.
+            cache: Optional result cache. If the result of the configuration is cached,
+                the simulation is not run and the cached metrics are used instead.
+            metrics: The metrics stored in the cache. Defaults to the DEFAULT_METRICS of the result store.
+            checkpoint: Optional checkpoint to continue the simulation from, instead of running the whole event chain.
+                The environment is then a fork of the checkpoint environment.
+            profile: Whether to collect the event counters of the run in self.profiler
+            trace: Whether to record the timeline of the run in self.tracer
         """
-        self.configuration = Configuration(options)
-        self.environment = Environment(self.configuration) if environment is None else environment
+        self.configuration = options if isinstance(options, Configuration) else Configuration(options)
+        self.cache = cache
+        self.metrics = DEFAULT_METRICS if metrics is None else metrics
+        self.checkpoint = checkpoint
+        self.cached = False
+        self.profiler: Optional[EventProfiler] = EventProfiler() if profile else None
+        self.tracer: Optional[EventTracer] = EventTracer() if trace else None
+        self.__environment = environment
+        self.__record: Optional[Dict[str, Any]] = None
+
+    @property
+    def environment(self) -> Environment:
+        """
+        Get the simulation environment. The environment is only created when it is first used,
+        so a runtime answered by the cache never populates the station and the train.
+        Raises:
+            RuntimeError: Thrown if the run was answered by the cache, since the simulation was never run
+        Returns:
+            The simulation environment
+        """
+        if self.__environment is None:
+            if self.cached:
+                raise RuntimeError("The result was taken from the cache, so there is no simulated environment.")
+            self.__environment = Environment(self.configuration)
+        return self.__environment
 
     def run(self) -> None:
-        event_runtime = EventRunTime(self.configuration, self.environment)
+        if self.cache is not None:
+            key = self.configuration.canonical_hash
+            self.__record = self.cache.get(key, self.metrics)
+            if self.__record is not None:
+                self.cached = True
+                return
+
+        if self.checkpoint is not None:
+            event_runtime = EventRunTime.from_checkpoint(self.checkpoint, self.configuration, self.profiler)
+            self.__environment = event_runtime.environment
+        else:
+            event_runtime = EventRunTime(self.configuration, self.environment, profiler=self.profiler)
+        if self.tracer is not None:
+            event_runtime.environment.tracer = self.tracer
         event_runtime.run()
+
+        if self.cache is not None:
+            self.__record = extract_record(self, self.metrics)
+            self.cache.put(self.configuration.canonical_hash, self.__record)
+
+    def record(self, metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get the metrics of the simulation after it has been run
+        Args:
+            metrics: The metrics to get. Defaults to the metrics of the runtime.
+        Raises:
+            KeyError: Thrown if the result was taken from the cache and a metric is not in the cached record
+        Returns:
+            A dictionary mapping each metric to its value
+        """
+        metrics = self.metrics if metrics is None else metrics
+        if self.__record is not None and all(metric in self.__record for metric in metrics):
+            return {metric: self.__record[metric] for metric in metrics}
+        if self.cached:
+            missing = [metric for metric in metrics if metric not in self.__record]
+            raise KeyError("The metrics {} are not in the cached record. Include them in the metrics of the runtime "
+                           "to have them cached.".format(', '.join(missing)))
+        return extract_record(self, metrics)
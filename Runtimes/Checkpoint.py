@@ -0,0 +1,76 @@
+from typing import Optional, Tuple
+
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+from Runtimes.EventQueue import EventQueue
+
+
+class Checkpoint:
+    """
+    Snapshot of a simulation at an event boundary: the environment and the events still waiting in the queue.
+    Any number of continuations can be resumed from a checkpoint, each with its own configuration,
+    so the events before the checkpoint only have to be run once.
+    """
+
+    def __init__(self, configuration: Configuration, environment: Environment, event_queue: EventQueue,
+                 event_name: Optional[str] = None):
+        """
+        Take a checkpoint. The environment and the queue are copied,
+        so the simulation they come from can continue without changing the checkpoint.
+        Args:
+            configuration: The configuration of the simulation
+            environment: The environment of the simulation
+            event_queue: The queue with the events that have not been fired yet
+            event_name: Optional name of the event the checkpoint was taken before
+        """
+        self.__configuration = configuration
+        self.__event_name = event_name
+        self.__environment, self.__event_queue = Checkpoint.__copy(environment, event_queue, configuration)
+
+    def __str__(self):
+        return 'Checkpoint (before: {}, events: {})'.format(self.__event_name, len(self.__event_queue))
+
+    @property
+    def configuration(self) -> Configuration:
+        """
+        Get the configuration the checkpoint was taken with
+        Returns: The configuration
+        """
+        return self.__configuration
+
+    @property
+    def event_name(self) -> Optional[str]:
+        """
+        Get the name of the event the checkpoint was taken before
+        Returns: The event name
+        """
+        return self.__event_name
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """
+        Get the timestamp of the next event to be fired from the checkpoint
+        Returns: The timestamp, or None if there are no events left
+        """
+        return self.__event_queue.peek().timestamp if len(self.__event_queue) > 0 else None
+
+    def fork(self, configuration: Optional[Configuration] = None) -> Tuple[Environment, EventQueue]:
+        """
+        Create an environment and an event queue to continue the simulation from the checkpoint.
+        The configuration should only change options that are used by the events after the checkpoint.
+        Args:
+            configuration: The configuration of the continuation. Defaults to the configuration of the checkpoint.
+        Returns:
+            A tuple with (environment, event_queue) for the continuation
+        """
+        configuration = self.__configuration if configuration is None else configuration
+        return Checkpoint.__copy(self.__environment, self.__event_queue, configuration)
+
+    @staticmethod
+    def __copy(environment: Environment, event_queue: EventQueue,
+               configuration: Configuration) -> Tuple[Environment, EventQueue]:
+        """
+        Fork the environment and copy the queue with the events bound to the forked environment
+        """
+        forked = environment.fork(configuration)
+        return forked, event_queue.copy(lambda event: event.rebind(configuration, forked))
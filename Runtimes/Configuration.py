@@ -1,53 +1,141 @@
-from typing import Dict, List, Union
+import json
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
 from Distributions.Distribution import Distribution
 
 
 class Configuration:
     """
-    This class represents all the configuration/options for the simulation components and more
+    This class represents all the configuration/options for the simulation components and more.
+    A configuration is immutable: it is validated once when it is created, can be used as a dictionary key,
+    and configurations with the same options are equal. Use derive to create a configuration with other options.
+    The option values themselves (e.g. lists) are shared and must not be changed.
     """
+    # The options read from the options dictionary, in the order they are documented below
+    OPTIONS = (
+        'passenger_weight_distribution', 'passenger_mean_weight', 'passenger_speed_range',
+        'passenger_loading_time_range', 'passenger_regular_size', 'passenger_max_walk_range',
+        'passenger_compliance', 'passenger_store',
+        'station_sector_count', 'station_stairs_placement', 'station_sector_passenger_max_count',
+        'station_sector_fullness', 'station_stair_factor', 'station_light_thresholds', 'station_distance',
+        'station_have_lights',
+        'train_fullness', 'train_unload_percent', 'train_set_setup', 'train_amount_of_sets', 'train_park_at_index',
+        'train_capacity',
+        'time_receive_weight_event', 'time_send_weight_event', 'time_door_action', 'environment_random_seed',
+        'time_weigh_train_event', 'time_arrive_event', 'time_depart_event', 'time_load_passenger_event',
+        'time_unload_passenger_event', 'time_passenger_decision_event',
+    )
+    # The private names are mangled to _Configuration__<name> when the class is created
+    __slots__ = ('__options', '__canonical_hash', '__train_length', '__train_car_max_weight',
+                 '__green_threshold_weight', '__yellow_threshold_weight', '__frozen') \
+        + tuple('__' + name for name in OPTIONS)
 
     def __init__(self, options: Dict):
         """
         Initialize the configuration
         Args:
             options: A dictionary containing all the options
+        Raises:
+            ValueError: Thrown if the options are not valid
         """
-        self.__options = options
+        # Copy the options, so changes to the provided dictionary do not change the configuration
+        self.__options = dict(options)
 
         # Local attribute assignment
-        self.__passenger_weight_distribution = self.__options.get('passenger_weight_distribution', None)
-        self.__passenger_mean_weight = self.__options.get('passenger_mean_weight', None)
-        self.__passenger_speed_range = self.__options.get('passenger_speed_range', None)
-        self.__passenger_loading_time_range = self.__options.get('passenger_loading_time_range', None)
-        self.__passenger_regular_size = self.__options.get('passenger_regular_size', None)
-        self.__passenger_max_walk_range = self.__options.get('passenger_max_walk_range', None)
-        self.__passenger_compliance = self.__options.get('passenger_compliance', None)
-        self.__station_sector_count = self.__options.get('station_sector_count', None)
-        self.__station_stairs_placement = self.__options.get('station_stairs_placement', None)
-        self.__station_sector_passenger_max_count = self.__options.get('station_sector_passenger_max_count', None)
-        self.__station_sector_fullness = self.__options.get('station_sector_fullness', None)
-        self.__station_stair_factor = self.__options.get('station_stair_factor', None)
-        self.__station_light_thresholds = self.__options.get('station_light_thresholds', None)
-        self.__station_distance = self.__options.get('station_distance', None)
-        self.__station_have_lights = self.__options.get('station_have_lights', None)
-        self.__train_fullness = self.__options.get('train_fullness', None)
-        self.__train_unload_percent = self.__options.get('train_unload_percent', None)
-        self.__train_set_setup = self.__options.get('train_set_setup', None)
-        self.__train_amount_of_sets = self.__options.get('train_amount_of_sets', None)
-        self.__train_park_at_index = self.__options.get('train_park_at_index', None)
-        self.__train_capacity = self.__options.get('train_capacity', None)
-        self.__time_receive_weight_event = self.__options.get('time_receive_weight_event', None)
-        self.__time_send_weight_event = self.__options.get('time_send_weight_event', None)
-        self.__time_door_action = self.__options.get('time_door_action', None)
-        self.__environment_random_seed = self.__options.get('environment_random_seed', None)
-        self.__time_weigh_train_event = self.__options.get('time_weigh_train_event', None)
-        self.__time_arrive_event = self.__options.get('time_arrive_event', None)
-        self.__time_depart_event = self.__options.get('time_depart_event', None)
-        self.__time_load_passenger_event = self.__options.get('time_load_passenger_event', None)
-        self.__time_unload_passenger_event = self.__options.get('time_unload_passenger_event', None)
-        self.__time_passenger_decision_event = self.__options.get('time_passenger_decision_event', None)
-
+        for name in Configuration.OPTIONS:
+            object.__setattr__(self, '_Configuration__' + name, self.__options.get(name, None))
+        self.__finish()
+
+    def __finish(self) -> None:
+        """
+        Validate the options, compute the derived constants and freeze the configuration
+        """
+        self.__validate()
+        self.__canonical_hash: Optional[str] = None
+        self.__train_length = None if self.__train_set_setup is None or self.__train_amount_of_sets is None \
+            else self.__train_set_setup * self.__train_amount_of_sets
+        self.__train_car_max_weight = None if self.__train_capacity is None or self.__passenger_mean_weight is None \
+            else self.__train_capacity * self.__passenger_mean_weight
+        thresholds = self.__station_light_thresholds
+        self.__green_threshold_weight = None if self.__train_car_max_weight is None or thresholds is None \
+            else self.__train_car_max_weight * thresholds['green']
+        self.__yellow_threshold_weight = None if self.__train_car_max_weight is None or thresholds is None \
+            else self.__train_car_max_weight * thresholds['yellow']
+        self.__frozen = True
+
+    def __validate(self) -> None:
+        """
+        Validate the options that are provided
+        Raises:
+            ValueError: Thrown if an option is not valid
+        """
+        sectors = self.__station_sector_count
+        if sectors is not None and sectors < 1:
+            raise ValueError("The station must have at least one sector, not {}".format(sectors))
+        for name in ('train_set_setup', 'train_amount_of_sets'):
+            value = self.__options.get(name)
+            if value is not None and value < 1:
+                raise ValueError("The option {} must be at least 1, not {}".format(name, value))
+        for name in ('train_capacity', 'station_sector_passenger_max_count', 'station_distance'):
+            value = self.__options.get(name)
+            if value is not None and value < 0:
+                raise ValueError("The option {} cannot be negative, not {}".format(name, value))
+        if self.__passenger_compliance is not None and not 0 <= self.__passenger_compliance <= 1:
+            raise ValueError("The passenger compliance must be between 0 and 1, not {}".format(
+                self.__passenger_compliance))
+        if self.__passenger_store not in (None, 'list', 'array'):
+            raise ValueError("Unknown passenger store {}, choose from list or array".format(self.__passenger_store))
+
+        thresholds = self.__station_light_thresholds
+        if thresholds is not None:
+            if 'green' not in thresholds or 'yellow' not in thresholds:
+                raise ValueError("The light thresholds must have a green and a yellow threshold")
+            if thresholds['green'] > thresholds['yellow']:
+                raise ValueError("The green light threshold cannot be above the yellow threshold")
+
+        if sectors is not None and self.__station_stairs_placement is not None:
+            for stair in self.__station_stairs_placement:
+                if not 0 <= stair < sectors:
+                    raise ValueError("The stairs at {} are not in one of the {} sectors".format(stair, sectors))
+
+        if self.__train_set_setup is None or self.__train_amount_of_sets is None:
+            return
+        cars = self.__train_set_setup * self.__train_amount_of_sets
+        if sectors is not None and cars > sectors:
+            raise ValueError("A train with {} cars does not fit in {} sectors".format(cars, sectors))
+        park_at = self.__train_park_at_index
+        if park_at is not None and sectors is not None and park_at >= 0 and park_at + cars > sectors:
+            raise ValueError("A train with {} cars parked at sector {} does not fit in {} sectors".format(
+                cars, park_at, sectors))
+        for name in ('train_fullness', 'train_unload_percent'):
+            value = self.__options.get(name)
+            if isinstance(value, list) and len(value) < cars:
+                raise ValueError("The option {} must have a value for each of the {} cars".format(name, cars))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, '_Configuration__frozen', False):
+            raise AttributeError("A configuration cannot be changed, use derive to change the option {}".format(name))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("A configuration cannot be changed")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Configuration):
+            return NotImplemented
+        return self is other or self.canonical_hash == other.canonical_hash
+
+    def __hash__(self) -> int:
+        return hash(self.canonical_hash)
+
+    def __reduce__(self):
+        return Configuration, (self.__options,)
+
+    def __repr__(self):
+        return 'Configuration ({})'.format(self.__options)
 
     def __str__(self):
         """
@@ -57,6 +145,106 @@ class Configuration:
         """
         return str(self.__options)
 
+    def derive(self, **overrides) -> 'Configuration':
+        """
+        Create a configuration with some of the options changed.
+        The options that are not changed are shared with this configuration instead of being read again.
+        Args:
+            **overrides: The options to change
+        Raises:
+            ValueError: Thrown if the changed options are not valid
+        Returns:
+            The derived configuration
+        """
+        configuration = object.__new__(Configuration)
+        for name in Configuration.OPTIONS:
+            slot = '_Configuration__' + name
+            object.__setattr__(configuration, slot, overrides[name] if name in overrides else getattr(self, slot))
+        object.__setattr__(configuration, '_Configuration__options', dict(self.__options, **overrides))
+        configuration.__finish()
+        return configuration
+
+    @property
+    def options(self) -> Dict:
+        """
+        Get the options of the configuration
+        Returns:
+            A copy of the options dictionary
+        """
+        return dict(self.__options)
+
+    @property
+    def canonical_hash(self) -> str:
+        """
+        Get a hash identifying the configuration. Two configurations with the same options,
+        including the distribution parameters and the random seed, have the same hash,
+        regardless of the order of the options. The hash is computed once.
+        Returns:
+            The hexadecimal sha256 digest of the canonical options
+        """
+        if self.__canonical_hash is None:
+            canonical = json.dumps(Configuration.__canonical(self.__options), sort_keys=True, separators=(',', ':'))
+            object.__setattr__(self, '_Configuration__canonical_hash', sha256(canonical.encode('utf-8')).hexdigest())
+        return self.__canonical_hash
+
+    @property
+    def train_length(self) -> Optional[int]:
+        """
+        Get the amount of cars of the train
+        Returns: The amount of train sets times the amount of cars in a set
+        """
+        return self.__train_length
+
+    @property
+    def train_car_max_weight(self) -> Optional[float]:
+        """
+        Get the weight of a full train car, used to decide the light of the sector of the car
+        Returns: The train car capacity times the passenger mean weight
+        """
+        return self.__train_car_max_weight
+
+    @property
+    def green_threshold_weight(self) -> Optional[float]:
+        """
+        Get the train car weight up to which the light of its sector is green
+        Returns: The maximum train car weight times the green light threshold
+        """
+        return self.__green_threshold_weight
+
+    @property
+    def yellow_threshold_weight(self) -> Optional[float]:
+        """
+        Get the train car weight up to which the light of its sector is yellow
+        Returns: The maximum train car weight times the yellow light threshold
+        """
+        return self.__yellow_threshold_weight
+
+    @staticmethod
+    def __canonical(value: Any) -> Any:
+        """
+        Convert an option value to a JSON serializable value that identifies it
+        Args:
+            value: The option value
+        Raises:
+            TypeError: Thrown if the value cannot be converted
+        Returns:
+            The canonical value
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, range):
+            return {'range': [value.start, value.stop, value.step]}
+        if isinstance(value, Distribution):
+            return {'distribution': value.__class__.__name__,
+                    'parameters': Configuration.__canonical(value.parameters)}
+        if isinstance(value, dict):
+            return {str(k): Configuration.__canonical(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return [Configuration.__canonical(v) for v in value]
+        raise TypeError("Cannot create a canonical value of the option {}".format(value))
+
     @property
     def passenger_weight_distribution(self) -> Distribution:
         """
@@ -120,6 +308,16 @@ class Configuration:
         """
         return self.__passenger_compliance
 
+    @property
+    def passenger_store(self) -> str:
+        """
+        Get the name of the store that holds the passengers in the station sectors and train cars.
+        Returns:
+            'list' to store passenger objects, 'array' to store the passengers as numpy columns.
+            None will default to 'list'.
+        """
+        return self.__passenger_store
+
     @property
     def station_sector_count(self) -> int:
         """
@@ -193,10 +391,6 @@ class Configuration:
         """
         return self.__station_have_lights
 
-    @station_have_lights.setter
-    def station_have_lights(self, have_lights: bool):
-        self.__station_have_lights = have_lights
-
     @property
     def train_fullness(self) -> range:
         """
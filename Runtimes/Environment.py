@@ -1,10 +1,13 @@
-from typing import Union
+from copy import copy
+from typing import Optional, Union
 
 from Components.Station import Station
 from Components.StationSector import StationSector
 from Components.Train import Train
 from Components.TrainCar import TrainCar
 from Runtimes.Configuration import Configuration
+from Runtimes.EventTracer import EventTracer
+from Runtimes.RandomStreams import RandomStreams
 from Runtimes.Timing import Timing
 
 
@@ -12,11 +15,40 @@ class Environment:
     """
     Class holding all the components in the environment.
     """
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, random: Optional[RandomStreams] = None, populate: bool = True):
+        """
+        Initialize a new environment
+        Args:
+            configuration: The simulation configuration
+            random: Optional random streams to use. Will default to streams seeded with the environment random seed.
+            populate: Whether to populate the train and the station with passengers
+        """
         self.__configuration: Configuration = configuration
-        self.__train: Train = Train(configuration)
-        self.__station: Station = Station(configuration)
+        self.__random: RandomStreams = RandomStreams(configuration.environment_random_seed) \
+            if random is None else random
+        self.__train: Train = Train(configuration, self.__random.train, populate)
+        self.__station: Station = Station(configuration, self.__random.station, populate)
         self.__timings: Timing = Timing()
+        self.tracer: Optional[EventTracer] = None
+
+    def fork(self, configuration: Optional[Configuration] = None) -> 'Environment':
+        """
+        Create an independent copy of the environment, without populating it again.
+        Only the passenger stores are copied (the passengers themselves are never changed),
+        together with the component state, the timings and the state of the random streams,
+        so the fork continues exactly as this environment would. The fork is not traced.
+        Args:
+            configuration: Optional configuration for the fork, e.g. a variant with other light thresholds.
+                Should not change the setup of the train and the station. Defaults to this configuration.
+        Returns:
+            The forked environment
+        """
+        configuration = self.__configuration if configuration is None else configuration
+        environment = Environment(configuration, self.__random.copy(), populate=False)
+        environment.__train.copy_from(self.__train)
+        environment.__station.copy_from(self.__station, environment.__train)
+        environment.__timings = copy(self.__timings)
+        return environment
 
     @property
     def configuration(self) -> Configuration:
@@ -42,6 +74,14 @@ class Environment:
         """
         return self.__station
 
+    @property
+    def random(self) -> RandomStreams:
+        """
+        Get the random streams of this environment
+        Returns: The random streams
+        """
+        return self.__random
+
     @property
     def timings(self) -> Timing:
         """
@@ -0,0 +1,135 @@
+import json
+from typing import Dict, Iterable, Optional
+
+
+class EventProfiler:
+    """
+    Collects counters per event class while the event chain runs:
+    how many times the events fired, the wall-clock time spent firing them and how many events they produced.
+    Also keeps the peak length of the event queue.
+    Profilers of several runs can be merged to get the totals of a sweep.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty profiler
+        """
+        # Maps the event class name to [fires, seconds, produced]
+        self.__events: Dict[str, list] = dict()
+        self.__peak_queue_length = 0
+        self.__runs = 1
+
+    def __str__(self):
+        return 'EventProfiler ({} event types, {} fires)'.format(
+            len(self.__events), sum(counters[0] for counters in self.__events.values()))
+
+    def record(self, name: str, seconds: float, produced: int) -> None:
+        """
+        Record that an event has fired
+        Args:
+            name: The name of the event class
+            seconds: The wall-clock time it took to fire the event
+            produced: The amount of events the event produced
+        """
+        counters = self.__events.get(name)
+        if counters is None:
+            counters = self.__events[name] = [0, 0.0, 0]
+        counters[0] += 1
+        counters[1] += seconds
+        counters[2] += produced
+
+    def observe_queue(self, length: int) -> None:
+        """
+        Observe the current length of the event queue
+        Args:
+            length: The amount of events in the queue
+        """
+        if length > self.__peak_queue_length:
+            self.__peak_queue_length = length
+
+    @property
+    def peak_queue_length(self) -> int:
+        return self.__peak_queue_length
+
+    @property
+    def runs(self) -> int:
+        """
+        Get the amount of runs the profiler holds the counters of
+        Returns: The amount of merged runs
+        """
+        return self.__runs
+
+    def merge(self, other: 'EventProfiler') -> None:
+        """
+        Add the counters of another profiler to this profiler
+        Args:
+            other: The profiler to merge into this one
+        """
+        for name, (fires, seconds, produced) in other.__events.items():
+            counters = self.__events.setdefault(name, [0, 0.0, 0])
+            counters[0] += fires
+            counters[1] += seconds
+            counters[2] += produced
+        self.__peak_queue_length = max(self.__peak_queue_length, other.__peak_queue_length)
+        self.__runs += other.__runs
+
+    def to_dict(self) -> Dict:
+        """
+        Export the counters
+        Returns:
+            A dictionary with the runs, the peak queue length
+            and the fires, seconds and produced events per event class
+        """
+        return {
+            'runs': self.__runs,
+            'peak_queue_length': self.__peak_queue_length,
+            'events': {
+                name: {'fires': fires, 'seconds': seconds, 'produced': produced}
+                for name, (fires, seconds, produced) in sorted(self.__events.items())
+            }
+        }
+
+    def to_json(self, file_name: Optional[str] = None) -> str:
+        """
+        Export the counters as JSON
+        Args:
+            file_name: Optional file to write the JSON to
+        Returns:
+            The JSON string
+        """
+        data = json.dumps(self.to_dict(), indent=2)
+        if file_name is not None:
+            with open(file_name, 'wt') as f:
+                f.write(data)
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict) -> 'EventProfiler':
+        """
+        Create a profiler from the counters exported with to_dict
+        Args:
+            data: The exported counters
+        Returns:
+            The profiler
+        """
+        profiler = EventProfiler()
+        profiler.__runs = data['runs']
+        profiler.__peak_queue_length = data['peak_queue_length']
+        for name, counters in data['events'].items():
+            profiler.__events[name] = [counters['fires'], counters['seconds'], counters['produced']]
+        return profiler
+
+    @staticmethod
+    def aggregate(profilers: Iterable['EventProfiler']) -> 'EventProfiler':
+        """
+        Merge the profilers of several runs into a new profiler
+        Args:
+            profilers: The profilers to merge
+        Returns:
+            A profiler with the totals of all the runs
+        """
+        total = EventProfiler()
+        total.__runs = 0
+        for profiler in profilers:
+            total.merge(profiler)
+        return total
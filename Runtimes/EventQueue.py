@@ -1,14 +1,108 @@
+from heapq import heappush, heappop
+from itertools import count
+from typing import Callable, Iterable, List, Optional, Tuple
+
 from Events.Event import Event
 
 
 class EventQueue:
     """
-    EventQueue, queue of events currently queued up for execution
+    EventQueue, queue of events currently queued up for execution.
+    The events are kept in a binary heap ordered by their timestamp, so scheduling
+    and popping an event are both O(log n). Events with equal timestamps are
+    returned in the order they were pushed (FIFO), which keeps the event chain reproducible.
     """
 
     def __init__(self):
-        self.events = []
+        # Heap entries are (timestamp, sequence, event). The sequence number is
+        # unique, so the comparison never falls through to the event itself.
+        self.__heap: List[Tuple[object, int, Event]] = []
+        self.__sequence = count()
+
+    def __len__(self) -> int:
+        """
+        Get the amount of events waiting in the queue
+        Returns:
+            The amount of queued events
+        """
+        return len(self.__heap)
+
+    def __bool__(self) -> bool:
+        return len(self.__heap) > 0
+
+    @property
+    def events(self) -> List[Event]:
+        """
+        Get the queued events in the order they will be executed.
+        Returns:
+            A new list with the queued events. Modifying it does not change the queue.
+        """
+        return [entry[2] for entry in sorted(self.__heap)]
+
+    def push(self, event: Event) -> None:
+        """
+        Schedule a single event
+        Args:
+            event: The event to schedule
+        """
+        heappush(self.__heap, (event.timestamp, next(self.__sequence), event))
+
+    def push_all(self, events: Iterable[Event]) -> None:
+        """
+        Schedule all the provided events in the order they are given
+        Args:
+            events: The events to schedule
+        """
+        for event in events:
+            self.push(event)
+
+    def pop(self) -> Event:
+        """
+        Remove and return the event with the earliest timestamp
+        Raises:
+            IndexError: Thrown if the queue is empty
+        Returns:
+            The next event to be executed
+        """
+        if not self.__heap:
+            raise IndexError('Can not pop from an empty event queue')
+        return heappop(self.__heap)[2]
+
+    def peek(self) -> Event:
+        """
+        Get the event with the earliest timestamp without removing it
+        Raises:
+            IndexError: Thrown if the queue is empty
+        Returns:
+            The next event to be executed
+        """
+        if not self.__heap:
+            raise IndexError('Can not peek into an empty event queue')
+        return self.__heap[0][2]
+
+    def copy(self, transform: Optional[Callable[[Event], Event]] = None) -> 'EventQueue':
+        """
+        Create a copy of the queue, keeping the order of the queued events
+        Args:
+            transform: Optional function applied to every queued event, e.g. to rebind it to another environment.
+                Must not change the timestamp of the event.
+        Returns:
+            The copied event queue
+        """
+        queue = EventQueue()
+        queue.__heap = [
+            (timestamp, sequence, event if transform is None else transform(event))
+            for timestamp, sequence, event in self.__heap
+        ]
+        # Events pushed to the copy must still come after the copied events with the same timestamp
+        queue.__sequence = count(next(self.__sequence))
+        return queue
 
     def get_next(self) -> Event:
-        self.events.sort(key=lambda e: e.timestamp)
-        return self.events.pop(0)
+        """
+        Remove and return the event with the earliest timestamp.
+        Kept for backwards compatibility, same as pop().
+        Returns:
+            The next event to be executed
+        """
+        return self.pop()
@@ -1,11 +1,15 @@
-from datetime import datetime
 from logging import getLogger
+from time import perf_counter
+from typing import Optional, Union
 
 from Events.WeighTrainEvent import WeighTrainEvent
+from Runtimes.Checkpoint import Checkpoint
 from Runtimes.Configuration import Configuration
 from Runtimes.Environment import Environment
+from Runtimes.EventProfiler import EventProfiler
 from Runtimes.EventQueue import EventQueue
 from Runtimes.RunTime import RunTime
+from Runtimes.Timing import Timing
 
 
 class EventRunTime(RunTime):
@@ -14,27 +18,93 @@ class EventRunTime(RunTime):
     This means that the whole event chain will be run here.
     """
 
-    def __init__(self, configuration: Configuration, environment: Environment):
+    def __init__(self, configuration: Configuration, environment: Environment,
+                 event_queue: Optional[EventQueue] = None, profiler: Optional[EventProfiler] = None):
         """
         Initialize the event runtime with the provided configuration and environment
         Args:
             configuration: The runtime configuration
             environment: The runtime environment
+            event_queue: Optional queue with the events to continue from, e.g. from a checkpoint.
+                If not provided, the event chain is started from the beginning.
+            profiler: Optional profiler to collect the counters of the fired events in.
+                Nothing is measured if it is not provided.
         """
         self.environment = environment
         self.configuration = configuration
-        self.event_queue = EventQueue()
+        self.event_queue = EventQueue() if event_queue is None else event_queue
+        self.profiler = profiler
+        self.__started = event_queue is not None
         self.logger = getLogger(self.__class__.__name__)
 
+    @staticmethod
+    def from_checkpoint(checkpoint: Checkpoint, configuration: Optional[Configuration] = None,
+                        profiler: Optional[EventProfiler] = None) -> 'EventRunTime':
+        """
+        Create an event runtime that continues from the checkpoint
+        Args:
+            checkpoint: The checkpoint to continue from
+            configuration: The configuration of the continuation. Defaults to the configuration of the checkpoint.
+            profiler: Optional profiler to collect the counters of the fired events in
+        Returns:
+            The event runtime, running in its own fork of the checkpoint environment
+        """
+        configuration = checkpoint.configuration if configuration is None else configuration
+        environment, event_queue = checkpoint.fork(configuration)
+        return EventRunTime(configuration, environment, event_queue, profiler)
+
     def run(self) -> None:
-        # Enqueue starting event
-        self.event_queue.events.append(WeighTrainEvent(datetime.now(), self.configuration))
+        self.__start()
 
         # Execute events until none are left
-        while len(self.event_queue.events) > 0:
-            events = self.event_queue.get_next()(self.environment)
-            self.event_queue.events.extend(events)
+        while len(self.event_queue) > 0:
+            self.__step()
         try:
-            self.logger.info("Concluded with a duration of {} seconds".format(self.environment.timings.turn_around_time))
+            self.logger.info("Concluded with a duration of %s seconds", self.environment.timings.turn_around_time)
         except RuntimeError as e:
             self.logger.critical(e)
+
+    def run_until(self, event: Union[str, type]) -> Checkpoint:
+        """
+        Run the event chain until the next event to fire is of the provided type, and take a checkpoint there.
+        The event itself is not fired, so the runtime can be continued with run() afterwards.
+        Args:
+            event: The event class, or its name, to stop before
+        Raises:
+            RuntimeError: Thrown if the event chain finishes without reaching the event
+        Returns:
+            A checkpoint of the environment and the queued events
+        """
+        name = event if isinstance(event, str) else event.__name__
+        self.__start()
+        while len(self.event_queue) > 0 and self.event_queue.peek().__class__.__name__ != name:
+            self.__step()
+        if len(self.event_queue) == 0:
+            raise RuntimeError("The event chain finished without reaching {}".format(name))
+        return Checkpoint(self.configuration, self.environment, self.event_queue, name)
+
+    def __start(self) -> None:
+        """
+        Enqueue the starting event, unless the event chain has already been started
+        """
+        if not self.__started:
+            self.event_queue.push(WeighTrainEvent(Timing.SIMULATION_START, self.configuration))
+            self.__started = True
+        if self.profiler is not None:
+            self.profiler.observe_queue(len(self.event_queue))
+
+    def __step(self) -> None:
+        """
+        Fire the next event and schedule the events it produces
+        """
+        if self.profiler is None:
+            events = self.event_queue.pop()(self.environment)
+            self.event_queue.push_all(events)
+            return
+
+        event = self.event_queue.pop()
+        start = perf_counter()
+        events = event(self.environment)
+        self.profiler.record(event.__class__.__name__, perf_counter() - start, len(events))
+        self.event_queue.push_all(events)
+        self.profiler.observe_queue(len(self.event_queue))
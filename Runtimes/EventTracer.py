@@ -0,0 +1,113 @@
+import json
+from typing import Dict, List, Optional, Tuple
+
+# The lane of the events that do not belong to a station sector
+TRAIN_LANE = -1
+
+
+class EventTracer:
+    """
+    Records the simulated timeline of the event chain and exports it in the Chrome trace format,
+    which can be opened in chrome://tracing or https://ui.perfetto.dev.
+    Every station sector gets its own lane, so the loading and unloading at each door can be followed,
+    and the events without a sector are put in a train lane.
+    Only primitive values are kept in the buffer, so the traced components can be freed.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        """
+        Initialize an empty tracer
+        Args:
+            capacity: Optional maximum amount of entries to keep. Later entries are counted, but dropped.
+        """
+        self.capacity = capacity
+        self.dropped = 0
+        # Entries of (name, category, start, duration, sector, car, description)
+        self.__entries: List[Tuple[str, str, float, float, int, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __str__(self):
+        return 'EventTracer ({} entries, {} dropped)'.format(len(self.__entries), self.dropped)
+
+    def record_event(self, event, start: float, end: float) -> None:
+        """
+        Record an event that has been fired
+        Args:
+            event: The fired event
+            start: The simulated timestamp the event started at
+            end: The simulated timestamp the event ended at, after its actions
+        """
+        sector, car = EventTracer.__identifiers(event)
+        self.__add((event.__class__.__name__, 'event', start, end - start, sector, car, ''))
+
+    def record_action(self, event, start: float, duration: float, description: str) -> None:
+        """
+        Record an action performed by an event
+        Args:
+            event: The event performing the action
+            start: The simulated timestamp the action started at
+            duration: The time the action takes
+            description: The description of the action
+        """
+        sector, car = EventTracer.__identifiers(event)
+        self.__add((event.__class__.__name__, 'action', start, duration, sector, car, description))
+
+    def to_chrome_trace(self) -> Dict:
+        """
+        Export the timeline in the Chrome trace event format.
+        The simulated seconds are written as trace microseconds.
+        Returns:
+            A dictionary with the trace events
+        """
+        lanes = sorted({entry[4] for entry in self.__entries})
+        trace: List[Dict] = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': 0, 'tid': lane,
+             'args': {'name': 'Train' if lane == TRAIN_LANE else 'Sector {}'.format(lane)}}
+            for lane in lanes
+        ]
+        for name, category, start, duration, sector, car, description in self.__entries:
+            args = {}
+            if sector != TRAIN_LANE:
+                args['sector'] = sector
+            if car >= 0:
+                args['car'] = car
+            if description:
+                args['description'] = description
+            trace.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': 0, 'tid': sector,
+                'ts': start * 1e6, 'dur': duration * 1e6, 'args': args
+            })
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms', 'otherData': {'dropped': self.dropped}}
+
+    def save(self, file_name: str) -> None:
+        """
+        Save the timeline as a Chrome trace JSON file
+        Args:
+            file_name: The name of the file
+        """
+        with open(file_name, 'wt') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def __add(self, entry: Tuple) -> None:
+        if self.capacity is not None and len(self.__entries) >= self.capacity:
+            self.dropped += 1
+            return
+        self.__entries.append(entry)
+
+    @staticmethod
+    def __identifiers(event) -> Tuple[int, int]:
+        """
+        Get the sector and train car of an event
+        Args:
+            event: The event
+        Returns:
+            A tuple with (sector_index, car_index), where each is -1 if the event does not have one
+        """
+        sector = getattr(event, 'sector', None)
+        car = getattr(event, 'train_car', None)
+        if car is None and sector is not None:
+            car = sector.train_car
+        return (TRAIN_LANE if sector is None else sector.sector_index,
+                -1 if car is None else car.car_index)
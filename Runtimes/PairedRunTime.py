@@ -0,0 +1,129 @@
+from functools import partial
+from logging import INFO, getLogger
+from typing import Any, Dict, List, Optional
+
+from Helpers.RunningStatistics import RunningStatistics
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+from Runtimes.EventRunTime import EventRunTime
+from Runtimes.ReplicationRunTime import TURN_AROUND_TIME, replication_seeds
+from Runtimes.RunTime import RunTime
+from Runtimes.SweepRunTime import SweepRunTime
+
+
+def run_paired(options: Dict, variants: Dict[str, Dict], metric: str = TURN_AROUND_TIME,
+               checkpoint_at: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run every variant from the same populated environment.
+    The environment is populated once with the provided options, and each variant runs on a fork of it,
+    including the state of the random streams, so the variants see identical random inputs.
+    Args:
+        options: The options the environment is populated with
+        variants: A dictionary mapping the variant name to the options it overrides.
+            The overrides should not change how the environment is populated.
+        metric: The metric to record for each variant
+        checkpoint_at: Optional name of the first event that depends on the overrides.
+            The events before it are run once, and the variants continue from a checkpoint there.
+    Returns:
+        A dictionary mapping the variant name to the metric of its run
+    """
+    configuration = Configuration(options)
+    base = Environment(configuration)
+    checkpoint = EventRunTime(configuration, base).run_until(checkpoint_at) if checkpoint_at is not None else None
+    results = {}
+    for name, overrides in variants.items():
+        variant = configuration.derive(**overrides)
+        if checkpoint is not None:
+            application = ApplicationRunTime(variant, metrics=[metric], checkpoint=checkpoint)
+        else:
+            application = ApplicationRunTime(variant, environment=base.fork(variant), metrics=[metric])
+        application.run()
+        results[name] = application.record()[metric]
+    return results
+
+
+class PairedRunTime(RunTime):
+    """
+    Class that compares policy variants with common random numbers.
+    For every replication, all the variants are run from the same populated environment,
+    and the differences to the baseline variant are computed per replication.
+    Since the variants share their random inputs, the paired differences have far less variance
+    than the difference of independent runs, so fewer replications are needed for the same precision.
+    """
+
+    def __init__(
+            self,
+            options: Dict,
+            variants: Dict[str, Dict],
+            replications: int = 10,
+            workers: int = 1,
+            metric: str = TURN_AROUND_TIME,
+            confidence: float = 0.95,
+            baseline: Optional[str] = None,
+            checkpoint_at: Optional[str] = None
+    ):
+        """
+        Initialize a new paired runtime
+        Args:
+            options: The options shared by all the variants. The environment_random_seed is the base seed.
+            variants: A dictionary mapping the variant name to the options it overrides,
+                for example {'lights': {'station_have_lights': True}, 'no lights': {'station_have_lights': False}}
+            replications: The amount of replications, each with its own seed
+            workers: The amount of worker processes
+            metric: The metric to compare the variants by. Defaults to the turn around time.
+            confidence: The confidence level of the intervals
+            baseline: The name of the variant the others are compared to. Defaults to the first variant.
+            checkpoint_at: Optional name of the first event that depends on the variant options.
+                The events before it are only run once per replication.
+        """
+        if len(variants) == 0:
+            raise ValueError("There must be at least one variant")
+        self.options = dict(options)
+        self.variants = {name: dict(overrides) for name, overrides in variants.items()}
+        self.baseline = next(iter(self.variants)) if baseline is None else baseline
+        if self.baseline not in self.variants:
+            raise ValueError("The baseline {} is not one of the variants".format(self.baseline))
+        self.replications = replications
+        self.workers = workers
+        self.metric = metric
+        self.confidence = confidence
+        self.checkpoint_at = checkpoint_at
+        self.results: List[Dict[str, Any]] = []
+        self.statistics: Dict[str, RunningStatistics] = {}
+        self.differences: Dict[str, RunningStatistics] = {}
+        self.logger = getLogger(self.__class__.__name__)
+
+    def run(self) -> None:
+        """
+        Run the replications and store the metric of every variant per replication in self.results
+        """
+        seeds = replication_seeds(self.options.get('environment_random_seed'), self.replications)
+        points = [dict(self.options, environment_random_seed=seed) for seed in seeds]
+        task = partial(run_paired, variants=self.variants, metric=self.metric, checkpoint_at=self.checkpoint_at)
+        sweep = SweepRunTime(points, workers=self.workers, task=task)
+        sweep.run()
+        self.results = sweep.results
+
+        self.statistics = {name: RunningStatistics(r[name] for r in self.results) for name in self.variants}
+        self.differences = {
+            name: RunningStatistics(r[name] - r[self.baseline] for r in self.results)
+            for name in self.variants if name != self.baseline
+        }
+        if self.logger.isEnabledFor(INFO):
+            for name, difference in self.differences.items():
+                self.logger.info("%s - %s: %s +/- %s",
+                                 name, self.baseline, difference.mean, difference.half_width(self.confidence))
+
+    @property
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Get the statistics of the variants and of their paired differences to the baseline
+        Returns:
+            A dictionary with 'variants' mapping each variant to its statistics,
+            and 'differences' mapping each other variant to the statistics of (variant - baseline)
+        """
+        return {
+            'variants': {name: s.summary(self.confidence) for name, s in self.statistics.items()},
+            'differences': {name: s.summary(self.confidence) for name, s in self.differences.items()},
+        }
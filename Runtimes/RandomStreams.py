@@ -0,0 +1,97 @@
+from copy import deepcopy
+from typing import Dict, Optional, Tuple
+
+from numpy.random import Generator, SeedSequence, default_rng
+
+
+class RandomStreams:
+    """
+    Class holding the random number generators for a single simulation.
+    A generator tree is spawned from one seed sequence, so each part of the simulation draws
+    from its own independent stream. Changing how many numbers one part draws will therefore
+    not change the numbers drawn by the other parts, and the streams are reproducible
+    no matter which process the simulation runs in.
+    """
+    # The names of the independent streams. New streams must be appended to keep the existing streams the same.
+    STREAMS: Tuple[str, ...] = ('station', 'train', 'unloading', 'compliance', 'decisions', 'parking')
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the random streams
+        Args:
+            seed: The seed for the root seed sequence (usually the environment_random_seed option).
+                If None, fresh entropy is taken from the operating system.
+        """
+        self.__seed_sequence = SeedSequence(seed)
+        children = self.__seed_sequence.spawn(len(RandomStreams.STREAMS))
+        self.__generators: Dict[str, Generator] = {
+            name: default_rng(child) for name, child in zip(RandomStreams.STREAMS, children)
+        }
+
+    def copy(self) -> 'RandomStreams':
+        """
+        Create a copy of the streams. The copied generators continue from the current state,
+        so the copy draws the same numbers as these streams would.
+        Returns:
+            The copied random streams
+        """
+        streams = RandomStreams.__new__(RandomStreams)
+        streams.__seed_sequence = self.__seed_sequence
+        streams.__generators = {name: deepcopy(generator) for name, generator in self.__generators.items()}
+        return streams
+
+    @property
+    def seed_sequence(self) -> SeedSequence:
+        """
+        Get the root seed sequence the streams are spawned from
+        Returns: The root seed sequence
+        """
+        return self.__seed_sequence
+
+    @property
+    def station(self) -> Generator:
+        """
+        Get the generator used for populating the station
+        Returns: The station population generator
+        """
+        return self.__generators['station']
+
+    @property
+    def train(self) -> Generator:
+        """
+        Get the generator used for populating the train
+        Returns: The train population generator
+        """
+        return self.__generators['train']
+
+    @property
+    def unloading(self) -> Generator:
+        """
+        Get the generator used for deciding how many passengers leave the train
+        Returns: The unloading generator
+        """
+        return self.__generators['unloading']
+
+    @property
+    def compliance(self) -> Generator:
+        """
+        Get the generator used for deciding whether passengers comply with the lights
+        Returns: The compliance generator
+        """
+        return self.__generators['compliance']
+
+    @property
+    def decisions(self) -> Generator:
+        """
+        Get the generator used for the passenger decisions on the platform
+        Returns: The decision generator
+        """
+        return self.__generators['decisions']
+
+    @property
+    def parking(self) -> Generator:
+        """
+        Get the generator used for deciding where the train parks
+        Returns: The parking generator
+        """
+        return self.__generators['parking']
@@ -0,0 +1,128 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from logging import INFO, getLogger
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from numpy.random import SeedSequence
+
+from Helpers.RunningStatistics import RunningStatistics
+from Runtimes.ResultCache import ResultCache
+from Runtimes.RunTime import RunTime
+from Runtimes.SweepRunTime import SweepRunTime, record_simulation
+
+TURN_AROUND_TIME = 'environment.timings.turn_around_time'
+
+
+def replication_seeds(seed: Optional[int], amount: int) -> List[int]:
+    """
+    Derive independent seeds for the replications from the base seed
+    Args:
+        seed: The base seed of the configuration
+        amount: The amount of seeds to derive
+    Returns:
+        A list with a seed for each replication
+    """
+    return [int(child.generate_state(1)[0]) for child in SeedSequence(seed).spawn(amount)]
+
+
+class ReplicationRunTime(RunTime):
+    """
+    Class that runs independent replications of a single configuration, each with its own seed,
+    and computes the confidence interval of a metric over the replications.
+    The replications are run in batches on a sweep. If a target half width is provided,
+    no more batches are run once the confidence interval is narrow enough.
+    All the batches share a single pool of worker processes, so the workers are only started once.
+    """
+
+    def __init__(
+            self,
+            options: Dict,
+            replications: int = 30,
+            workers: int = 1,
+            metric: str = TURN_AROUND_TIME,
+            confidence: float = 0.95,
+            target_half_width: Optional[float] = None,
+            min_replications: int = 5,
+            cache: Optional[ResultCache] = None
+    ):
+        """
+        Initialize a new replication runtime
+        Args:
+            options: The options of the configuration to replicate. The environment_random_seed is the base seed.
+            replications: The maximum amount of replications
+            workers: The amount of worker processes
+            metric: The metric to compute the statistics of. Defaults to the turn around time.
+            confidence: The confidence level of the interval
+            target_half_width: Stop once the half width of the confidence interval is at most this.
+                If not provided, all the replications are run.
+            min_replications: The amount of replications to run before the stopping rule is checked
+            cache: Optional result cache for the replications
+        """
+        if replications < 1:
+            raise ValueError("There must be at least one replication")
+        self.options = dict(options)
+        self.replications = replications
+        self.workers = max(workers, 1)
+        self.metric = metric
+        self.confidence = confidence
+        self.target_half_width = target_half_width
+        self.min_replications = min(max(min_replications, 2), replications)
+        self.cache = cache
+        self.seeds = replication_seeds(self.options.get('environment_random_seed'), replications)
+        self.values: List[Optional[float]] = []
+        self.statistics = RunningStatistics()
+        self.logger = getLogger(self.__class__.__name__)
+
+    def run(self) -> None:
+        """
+        Run the replications and store the metric of each replication in self.values, ordered by replication
+        """
+        values: List[Optional[float]] = [None] * self.replications
+        for index, value in self.iterate():
+            values[index] = value
+        self.values = values[:self.statistics.count]
+
+    def iterate(self) -> Iterator[Tuple[int, float]]:
+        """
+        Run the replications and yield the metric of each replication as soon as it is completed
+        Returns:
+            An iterator of tuples with (replication_index, value)
+        """
+        self.statistics = RunningStatistics()
+        task = partial(record_simulation, metrics=[self.metric], cache=self.cache)
+        start = 0
+        with ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else nullcontext() as executor:
+            while start < self.replications and not self.is_precise():
+                # The first batch runs the minimum amount of replications, after that a replication per worker
+                size = self.min_replications if start == 0 else self.workers
+                indexes = range(start, min(start + size, self.replications))
+                points = [dict(self.options, environment_random_seed=self.seeds[i]) for i in indexes]
+                sweep = SweepRunTime(points, workers=self.workers, ordered=False, task=task, executor=executor)
+                for point, record in sweep.iterate():
+                    value = record[self.metric]
+                    self.statistics.add(value)
+                    yield indexes[point], value
+                start = indexes.stop
+                if self.logger.isEnabledFor(INFO):
+                    self.logger.info("Ran %s replications, mean %s +/- %s", self.statistics.count,
+                                     self.statistics.mean, self.statistics.half_width(self.confidence))
+
+    def is_precise(self) -> bool:
+        """
+        Get whether the confidence interval has reached the target half width
+        Returns:
+            True if there is a target and it is reached, False if not
+        """
+        return self.target_half_width is not None \
+            and self.statistics.count >= self.min_replications \
+            and self.statistics.half_width(self.confidence) <= self.target_half_width
+
+    @property
+    def summary(self) -> Dict[str, float]:
+        """
+        Get the statistics of the metric over the completed replications
+        Returns:
+            A dictionary with the count, mean, variance, half_width, lower and upper bound of the interval
+        """
+        return self.statistics.summary(self.confidence)
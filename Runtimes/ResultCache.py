@@ -0,0 +1,163 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class ResultCache:
+    """
+    On-disk cache of simulation results, addressed by the canonical hash of the configuration.
+    Every result is stored in its own JSON file. When the files take up more than the maximum size,
+    the least recently used results are evicted. Using a result updates its modification time.
+    The cache only holds the directory, the size and an estimate of the total size of the files,
+    so it can be sent to the sweep worker processes.
+    The directory is only scanned when the estimate goes over the maximum size, or every RESCAN_EVERY writes
+    to notice the results written by other processes, so writing a result does not stat every cached file.
+    """
+    # Bump this whenever a change to the simulation changes the results, to invalidate old caches
+    VERSION = 1
+    SUFFIX = '.json'
+    # Amount of writes after which the directory is scanned again, even if the estimate is within the maximum size
+    RESCAN_EVERY = 64
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize a new result cache
+        Args:
+            directory: The directory to store the results in. Is created if it does not exist.
+            max_bytes: The maximum total size of the cached results in bytes
+        """
+        if max_bytes < 0:
+            raise ValueError("The maximum size of the cache cannot be negative")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        # Estimated total size of the cached results, None until the directory is first scanned
+        self.__estimated_bytes: Optional[int] = None
+        self.__writes_since_scan = 0
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return 'ResultCache ({}, {} bytes)'.format(self.directory, self.max_bytes)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.isfile(self.__path(key))
+
+    def get(self, key: str, metrics: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result
+        Args:
+            key: The canonical hash of the configuration
+            metrics: If provided, the cached result must contain all of these metrics
+        Returns:
+            The cached record, or None if there is no (complete) cached result
+        """
+        path = self.__path(key)
+        try:
+            with open(path, 'rt') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if metrics is not None and any(metric not in record for metric in metrics):
+            return None
+        # Mark the result as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return record
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        """
+        Store a result in the cache and evict old results if the cache is too large
+        Args:
+            key: The canonical hash of the configuration
+            record: The metrics of the simulation
+        """
+        path = self.__path(key)
+        temporary = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary, 'wt') as f:
+            json.dump(record, f, default=ResultCache.__to_json)
+        written = os.path.getsize(temporary)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        # Replacing is atomic, so other processes never read a half written result
+        os.replace(temporary, path)
+
+        self.__writes_since_scan += 1
+        if self.__estimated_bytes is not None:
+            self.__estimated_bytes += written - replaced
+        if self.__estimated_bytes is None or self.__estimated_bytes > self.max_bytes \
+                or self.__writes_since_scan >= ResultCache.RESCAN_EVERY:
+            self.__evict()
+
+    def clear(self) -> None:
+        """
+        Remove all the cached results
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(ResultCache.SUFFIX):
+                os.remove(os.path.join(self.directory, name))
+        self.__estimated_bytes = 0
+
+    @property
+    def size(self) -> int:
+        """
+        Get the total size of the cached results
+        Returns:
+            The size in bytes
+        """
+        return sum(size for _, _, size in self.__entries())
+
+    def __evict(self) -> None:
+        """
+        Scan the directory and remove the least recently used results until the cache is within the maximum size.
+        The scanned size replaces the estimate.
+        """
+        entries = self.__entries()
+        total = sum(size for _, _, size in entries)
+        if total > self.max_bytes:
+            for path, _, size in sorted(entries, key=lambda e: e[1]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    # Another process might have evicted it already
+                    pass
+                total -= size
+        self.__estimated_bytes = total
+        self.__writes_since_scan = 0
+
+    def __entries(self) -> List[tuple]:
+        """
+        Get the cached result files
+        Returns:
+            A list with tuples of (path, modification_time, size)
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(ResultCache.SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        return entries
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.directory, 'v{}-{}{}'.format(ResultCache.VERSION, key, ResultCache.SUFFIX))
+
+    @staticmethod
+    def __to_json(value: Any) -> Any:
+        """
+        Convert the numpy values in the records to JSON values
+        """
+        if isinstance(value, (np.generic, np.ndarray)):
+            return value.tolist()
+        raise TypeError("Cannot store {} in the result cache".format(type(value).__name__))
@@ -0,0 +1,169 @@
+import csv
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from Helpers.Object import get_deep_attr
+
+# The metrics recorded by default for every simulation.
+# Each metric is the attribute path on the ApplicationRunTime it is read from.
+DEFAULT_METRICS: List[str] = [
+    'environment.timings.turn_around_time',
+    'environment.station.initial_passenger_amount',
+    'environment.station.final_passenger_amount',
+    'environment.train.initial_passenger_amount',
+    'environment.train.final_passenger_amount',
+    'configuration.station_have_lights',
+    'configuration.station_sector_passenger_max_count',
+    'configuration.environment_random_seed',
+]
+
+
+def extract_record(application, metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Extract the metrics from a finished simulation
+    Args:
+        application: The ApplicationRunTime after it has been run
+        metrics: The attribute paths to extract. Defaults to DEFAULT_METRICS.
+    Raises:
+        AttributeError: Thrown if a metric does not exist on the application
+    Returns:
+        A dictionary mapping each metric to its value
+    """
+    metrics = DEFAULT_METRICS if metrics is None else metrics
+    return {metric: get_deep_attr(application, metric) for metric in metrics}
+
+
+class ResultStore:
+    """
+    Columnar store of simulation results. Only the declared metrics of each simulation are kept,
+    so the simulation environments can be freed as soon as the metrics are extracted.
+    """
+
+    def __init__(self, metrics: Optional[List[str]] = None):
+        """
+        Initialize a new empty result store
+        Args:
+            metrics: The metrics (attribute paths) stored for each simulation. Defaults to DEFAULT_METRICS.
+        """
+        self.__metrics: List[str] = list(DEFAULT_METRICS if metrics is None else metrics)
+        self.__values: Dict[str, List[Any]] = {metric: [] for metric in self.__metrics}
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return 'ResultStore ({} results, {} metrics)'.format(len(self), len(self.__metrics))
+
+    def __len__(self) -> int:
+        return len(self.__values[self.__metrics[0]]) if len(self.__metrics) > 0 else 0
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self.__values
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        """
+        Get the column of a metric
+        Args:
+            metric: The metric name
+        Raises:
+            KeyError: Thrown if the metric is not stored
+        Returns:
+            A numpy array with the value of the metric for every result
+        """
+        return np.asarray(self.__values[metric])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (dict(zip(self.__metrics, values)) for values in zip(*(self.__values[m] for m in self.__metrics)))
+
+    @property
+    def metrics(self) -> List[str]:
+        """
+        Get the metrics stored for each simulation
+        Returns:
+            A list with the metric names
+        """
+        return self.__metrics
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get all the columns of the store
+        Returns:
+            A dictionary mapping each metric to its numpy array
+        """
+        return {metric: self[metric] for metric in self.__metrics}
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Add a single result to the store
+        Args:
+            record: A dictionary with a value for each of the metrics
+        Raises:
+            KeyError: Thrown if the record is missing one of the metrics
+        """
+        values = [record[metric] for metric in self.__metrics]
+        for metric, value in zip(self.__metrics, values):
+            self.__values[metric].append(value)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add multiple results to the store
+        Args:
+            records: The records to add
+        """
+        for record in records:
+            self.append(record)
+
+    def add_application(self, application) -> None:
+        """
+        Extract the metrics from a finished simulation and add them to the store
+        Args:
+            application: The ApplicationRunTime after it has been run
+        """
+        self.append(extract_record(application, self.__metrics))
+
+    def save_npz(self, file_name: str) -> None:
+        """
+        Save the columns to a compressed numpy .npz file
+        Args:
+            file_name: The name of the file
+        """
+        np.savez_compressed(file_name, **self.columns)
+
+    def save_csv(self, file_name: str) -> None:
+        """
+        Save the results to a csv file with a column per metric
+        Args:
+            file_name: The name of the file
+        """
+        with open(file_name, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.__metrics)
+            writer.writerows(zip(*(self.__values[m] for m in self.__metrics)))
+
+    def save(self, file_name: str) -> None:
+        """
+        Save the results as csv if the file name ends with .csv, otherwise as .npz
+        Args:
+            file_name: The name of the file
+        """
+        if file_name.endswith('.csv'):
+            self.save_csv(file_name)
+        else:
+            self.save_npz(file_name)
+
+    @staticmethod
+    def load_npz(file_name: str) -> 'ResultStore':
+        """
+        Load a result store saved with save_npz
+        Args:
+            file_name: The name of the file
+        Returns:
+            The loaded result store
+        """
+        with np.load(file_name, allow_pickle=True) as data:
+            store = ResultStore(list(data.files))
+            for metric in data.files:
+                store.__values[metric] = data[metric].tolist()
+        return store
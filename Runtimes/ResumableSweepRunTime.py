@@ -0,0 +1,83 @@
+from logging import getLogger
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from Runtimes.Configuration import Configuration
+from Runtimes.RunTime import RunTime
+from Runtimes.SweepJournal import SweepJournal
+from Runtimes.SweepRunTime import SweepRunTime, record_simulation
+
+
+class ResumableSweepRunTime(RunTime):
+    """
+    Class that runs a sweep and writes the record of every point to a journal as soon as it is completed.
+    The points already in the journal are not run again, so an interrupted sweep continues where it stopped.
+    The points are identified by the canonical hash of their configuration.
+    """
+
+    def __init__(
+            self,
+            points: List[Dict],
+            journal: SweepJournal,
+            workers: Optional[int] = None,
+            chunk_size: int = 1,
+            task: Callable[[Dict], Dict[str, Any]] = record_simulation
+    ):
+        """
+        Initialize a new resumable sweep runtime
+        Args:
+            points: A list with the options for each simulation in the sweep
+            journal: The journal to write the records to and to resume from
+            workers: The amount of worker processes. Defaults to the amount of cpu cores.
+            chunk_size: The amount of points each worker gets at a time
+            task: The function to run for each point. Must return a JSON serializable record.
+        """
+        self.points: List[Dict] = [dict(point) for point in points]
+        self.keys = [Configuration(point).canonical_hash for point in self.points]
+        self.journal = journal
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.task = task
+        self.resumed = 0
+        self.results: List[Dict[str, Any]] = []
+        self.logger = getLogger(self.__class__.__name__)
+
+    def run(self) -> None:
+        """
+        Run the sweep and store the records ordered by point in self.results
+        """
+        results: List[Any] = [None] * len(self.points)
+        for index, record in self.iterate():
+            results[index] = record
+        self.results = results
+
+    def iterate(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield the records of the points in the journal, and then run the other points
+        and yield their records as they are completed
+        Returns:
+            An iterator of tuples with (point_index, record)
+        """
+        pending = []
+        self.resumed = 0
+        for index, key in enumerate(self.keys):
+            record = self.journal.get(key)
+            if record is None:
+                pending.append(index)
+            else:
+                self.resumed += 1
+                yield index, record
+        self.logger.info("Resumed %s points from %s, running %s points", self.resumed, self.journal, len(pending))
+
+        # Duplicate points are only run once
+        groups: Dict[str, List[int]] = dict()
+        for index in pending:
+            groups.setdefault(self.keys[index], []).append(index)
+        to_run = [indexes[0] for indexes in groups.values()]
+        sweep = SweepRunTime([self.points[index] for index in to_run], workers=self.workers,
+                             chunk_size=self.chunk_size, ordered=False, task=self.task)
+        for point, record in sweep.iterate():
+            key = self.keys[to_run[point]]
+            self.journal.append(key, record)
+            for index in groups[key]:
+                yield index, record
+        self.journal.sync()
@@ -0,0 +1,129 @@
+import json
+import os
+from time import monotonic
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from Runtimes.ResultCache import ResultCache
+
+
+class SweepJournal:
+    """
+    Append-only journal of the completed points of a sweep, stored as JSON lines.
+    Every line holds the canonical hash of the configuration of a point and its record.
+    The lines are flushed as they are written, and synced to the disk in batches,
+    so a sweep that is interrupted loses at most the last batch and can be resumed from the journal.
+    """
+
+    def __init__(self, file_name: str, resume: bool = True, sync_every: int = 16, sync_interval: float = 5.0):
+        """
+        Open a journal
+        Args:
+            file_name: The name of the journal file
+            resume: Whether to keep the records already in the journal. If not, the journal is started over.
+            sync_every: Sync the journal to the disk after this amount of records
+            sync_interval: Sync the journal to the disk when this many seconds have passed since the last sync
+        """
+        self.file_name = file_name
+        self.sync_every = max(sync_every, 1)
+        self.sync_interval = sync_interval
+        self.__records: Dict[str, Dict[str, Any]] = dict()
+        valid_bytes = 0
+        if resume and os.path.isfile(file_name):
+            valid_bytes = self.__read()
+        self.__file = open(file_name, 'r+b' if valid_bytes > 0 else 'wb')
+        # A line that was only partially written before an interruption is dropped
+        self.__file.truncate(valid_bytes)
+        self.__file.seek(valid_bytes)
+        self.__pending = 0
+        self.__last_sync = monotonic()
+
+    def __enter__(self) -> 'SweepJournal':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__records
+
+    def __str__(self):
+        return 'SweepJournal ({}, {} records)'.format(self.file_name, len(self.__records))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the record of a completed point
+        Args:
+            key: The canonical hash of the configuration of the point
+        Returns:
+            The record, or None if the point has not been completed
+        """
+        return self.__records.get(key)
+
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        """
+        Write the record of a completed point to the journal
+        Args:
+            key: The canonical hash of the configuration of the point
+            record: The record of the point
+        """
+        line = json.dumps({'version': ResultCache.VERSION, 'key': key, 'record': record},
+                          default=SweepJournal.__to_json, separators=(',', ':'))
+        self.__file.write(line.encode('utf-8') + b'\n')
+        self.__file.flush()
+        self.__records[key] = record
+        self.__pending += 1
+        if self.__pending >= self.sync_every or monotonic() - self.__last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        Make sure the written records are stored on the disk
+        """
+        if self.__pending > 0:
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__pending = 0
+        self.__last_sync = monotonic()
+
+    def close(self) -> None:
+        """
+        Sync and close the journal
+        """
+        if not self.__file.closed:
+            self.sync()
+            self.__file.close()
+
+    def __read(self) -> int:
+        """
+        Read the records of the journal
+        Returns:
+            The amount of bytes up to the end of the last complete line
+        """
+        valid_bytes = 0
+        with open(self.file_name, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+                # Records of an older version of the simulation are not used
+                if entry.get('version') == ResultCache.VERSION:
+                    self.__records[entry['key']] = entry['record']
+        return valid_bytes
+
+    @staticmethod
+    def __to_json(value: Any) -> Any:
+        """
+        Convert the numpy values in the records to JSON values
+        """
+        if isinstance(value, (np.generic, np.ndarray)):
+            return value.tolist()
+        raise TypeError("Cannot store {} in the sweep journal".format(type(value).__name__))
@@ -0,0 +1,153 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from logging import getLogger
+from os import cpu_count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.ResultCache import ResultCache
+from Runtimes.RunTime import RunTime
+
+
+def run_simulation(options: Dict) -> ApplicationRunTime:
+    """
+    Run a single simulation with the provided options
+    Args:
+        options: The options to run the simulation with
+    Returns:
+        The application runtime after it has been run
+    """
+    application = ApplicationRunTime(options)
+    application.run()
+    return application
+
+
+def record_simulation(options: Dict, metrics: Optional[List[str]] = None,
+                      cache: Optional[ResultCache] = None, profile: bool = False) -> Dict[str, Any]:
+    """
+    Run a single simulation with the provided options and only keep the metrics.
+    The environment is dropped as soon as the metrics are extracted.
+    Args:
+        options: The options to run the simulation with
+        metrics: The metrics to extract. Defaults to the DEFAULT_METRICS of the result store.
+        cache: Optional result cache to look the metrics up in before running the simulation
+        profile: Whether to profile the events. The exported EventProfiler is added to the record as 'profile',
+            unless the result came from the cache.
+    Returns:
+        A dictionary mapping each metric to its value
+    """
+    application = ApplicationRunTime(options, cache=cache, metrics=metrics, profile=profile)
+    application.run()
+    record = application.record()
+    if profile and not application.cached:
+        record['profile'] = application.profiler.to_dict()
+    return record
+
+
+def _run_chunk(task: Callable[[Dict], Any], chunk: List[Tuple[int, Dict]]) -> List[Tuple[int, Any]]:
+    """
+    Run the task for every point in the chunk. This is what the worker processes execute.
+    Args:
+        task: The task to run for each point
+        chunk: A list with tuples of (point_index, options)
+    Returns:
+        A list with tuples of (point_index, result)
+    """
+    return [(index, task(options)) for index, options in chunk]
+
+
+class SweepRunTime(RunTime):
+    """
+    Class that runs a sweep of independent simulations.
+    The points of the sweep are fanned out over a pool of worker processes,
+    where each point gets its own copy of the options.
+    """
+
+    def __init__(
+            self,
+            points: List[Dict],
+            workers: Optional[int] = None,
+            chunk_size: int = 1,
+            ordered: bool = True,
+            task: Callable[[Dict], Any] = run_simulation,
+            executor: Optional[Executor] = None
+    ):
+        """
+        Initialize a new sweep runtime
+        Args:
+            points: A list with the options for each simulation in the sweep
+            workers: The amount of worker processes. Defaults to the amount of cpu cores.
+                If set to 1, the sweep is run in the current process.
+            chunk_size: The amount of points each worker gets at a time
+            ordered: Whether to yield the results in the same order as the points (**True**)
+                or as soon as they are completed (**False**)
+            task: The function to run for each point. Must be picklable, i.e. defined at module level.
+                Defaults to running the simulation and returning the ApplicationRunTime.
+            executor: Optional pool of worker processes to run the points on, for callers that run several sweeps
+                and only want to start the workers once. The caller shuts it down.
+                If not provided, a pool is created for the sweep when there is more than one worker.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1")
+        # Copy the points so changing the provided options later on does not change the sweep
+        self.points: List[Dict] = [dict(point) for point in points]
+        self.workers = cpu_count() if workers is None else workers
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.task = task
+        self.executor = executor
+        self.results: List[Any] = []
+        self.logger = getLogger(self.__class__.__name__)
+
+    def run(self) -> None:
+        """
+        Run all the points in the sweep and store the results ordered by point in self.results
+        """
+        results: List[Any] = [None] * len(self.points)
+        for index, result in self.iterate():
+            results[index] = result
+        self.results = results
+
+    def iterate(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Run the sweep and yield the results as they become available
+        Returns:
+            An iterator of tuples with (point_index, result)
+        """
+        chunks = self.__chunks()
+        self.logger.info("Running %s points in %s chunks with %s workers",
+                         len(self.points), len(chunks), self.workers)
+
+        if self.executor is not None:
+            yield from self.__submit(self.executor, chunks)
+            return
+
+        # There is no reason to pay for a process pool if we only have a single worker
+        if self.workers <= 1:
+            for chunk in chunks:
+                yield from _run_chunk(self.task, chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            yield from self.__submit(executor, chunks)
+
+    def __submit(self, executor: Executor, chunks: List[List[Tuple[int, Dict]]]) -> Iterator[Tuple[int, Any]]:
+        """
+        Run the chunks on the executor and yield the results
+        Args:
+            executor: The pool of worker processes
+            chunks: The chunks of points to run
+        Returns:
+            An iterator of tuples with (point_index, result)
+        """
+        futures = [executor.submit(_run_chunk, self.task, chunk) for chunk in chunks]
+        for future in (futures if self.ordered else as_completed(futures)):
+            yield from future.result()
+
+    def __chunks(self) -> List[List[Tuple[int, Dict]]]:
+        """
+        Split the points into chunks of the chunk size
+        Returns:
+            A list of chunks, each being a list with tuples of (point_index, options)
+        """
+        indexed = list(enumerate(self.points))
+        return [indexed[i:i + self.chunk_size] for i in range(0, len(indexed), self.chunk_size)]
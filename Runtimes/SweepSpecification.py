@@ -0,0 +1,152 @@
+import json
+from typing import Any, Dict, List, Optional
+
+from numpy.random import default_rng
+
+from Distributions.Distribution import Distribution
+from Distributions.LogNormDistribution import LogNormDistribution
+from Distributions.NormalDistribution import NormalDistribution
+from Helpers.ExperimentDesigns import full_factorial, latin_hypercube, one_at_a_time, random_design
+from Helpers.Factor import Factor
+from Runtimes.Configuration import Configuration
+
+# The distributions that can be used in a specification, by class name
+DISTRIBUTIONS = {
+    'NormalDistribution': NormalDistribution,
+    'LogNormDistribution': LogNormDistribution,
+}
+
+# The supported designs
+DESIGNS = ('grid', 'random', 'latin_hypercube', 'one_at_a_time')
+
+
+def decode_option(value: Any) -> Any:
+    """
+    Convert a JSON value to an option value. Written the same way as the canonical options of a configuration:
+    {"range": [start, stop, step]} is a range and {"distribution": name, "parameters": {...}} is a distribution.
+    Args:
+        value: The JSON value
+    Raises:
+        ValueError: Thrown if the distribution is unknown
+    Returns:
+        The option value
+    """
+    if isinstance(value, list):
+        return [decode_option(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if set(value) == {'range'}:
+        return range(*value['range'])
+    if set(value) == {'distribution', 'parameters'}:
+        if value['distribution'] not in DISTRIBUTIONS:
+            raise ValueError("Unknown distribution {}, choose from {}".format(
+                value['distribution'], ', '.join(DISTRIBUTIONS)))
+        distribution: Distribution = DISTRIBUTIONS[value['distribution']](**value['parameters'])
+        return distribution
+    return {k: decode_option(v) for k, v in value.items()}
+
+
+class SweepSpecification:
+    """
+    Declarative description of a sweep: the base options, the factors that are varied and the design
+    that combines them into points. The points are deduplicated, so a point is never simulated twice.
+    Example of a specification file:
+        {
+            "options": {"station_have_lights": true},
+            "parameters": {
+                "station_sector_passenger_max_count": {"min": 30, "max": 90, "integer": true},
+                "passenger_compliance": [0.5, 0.75, 1]
+            },
+            "design": "latin_hypercube",
+            "samples": 20,
+            "seed": 1
+        }
+    """
+
+    def __init__(self, options: Dict, factors: List[Factor], design: str = 'grid',
+                 samples: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Initialize a new sweep specification
+        Args:
+            options: The base options of every point
+            factors: The factors varied over the points
+            design: The design, one of grid, random, latin_hypercube or one_at_a_time
+            samples: The amount of points of the random and latin_hypercube designs
+            seed: The seed of the random and latin_hypercube designs
+        Raises:
+            ValueError: Thrown if the design is unknown, or a sampling design has no amount of samples
+        """
+        if design not in DESIGNS:
+            raise ValueError("Unknown design {}, choose from {}".format(design, ', '.join(DESIGNS)))
+        if design in ('random', 'latin_hypercube') and (samples is None or samples < 1):
+            raise ValueError("The {} design needs a positive amount of samples".format(design))
+        self.options = dict(options)
+        self.factors = list(factors)
+        self.design = design
+        self.samples = samples
+        self.seed = seed
+        self.duplicates = 0
+
+    def __str__(self):
+        return 'SweepSpecification ({}, {})'.format(self.design, ', '.join(str(f) for f in self.factors))
+
+    @staticmethod
+    def from_dict(data: Dict, defaults: Optional[Dict] = None) -> 'SweepSpecification':
+        """
+        Create a specification from its JSON dictionary
+        Args:
+            data: The dictionary with the options, parameters, design, samples and seed
+            defaults: Optional options that the options of the specification are added to
+        Returns:
+            The specification
+        """
+        options = dict(defaults or {}, **decode_option(data.get('options', {})))
+        factors = [Factor.from_spec(name, decode_option(spec)) for name, spec in data.get('parameters', {}).items()]
+        return SweepSpecification(options, factors, data.get('design', 'grid'), data.get('samples'), data.get('seed'))
+
+    @staticmethod
+    def load(file_name: str, defaults: Optional[Dict] = None) -> 'SweepSpecification':
+        """
+        Load a specification from a JSON file
+        Args:
+            file_name: The name of the file
+            defaults: Optional options that the options of the specification are added to
+        Returns:
+            The specification
+        """
+        with open(file_name, 'rt') as f:
+            return SweepSpecification.from_dict(json.load(f), defaults)
+
+    def overrides(self) -> List[Dict[str, Any]]:
+        """
+        Get the values of the factors for each point of the design, before deduplication
+        Returns:
+            A list with the options each point overrides
+        """
+        if self.design == 'grid':
+            return full_factorial(self.factors)
+        if self.design == 'one_at_a_time':
+            return one_at_a_time(self.factors, self.options)
+        generator = default_rng(self.seed)
+        if self.design == 'random':
+            return random_design(self.factors, self.samples, generator)
+        return latin_hypercube(self.factors, self.samples, generator)
+
+    def points(self) -> List[Dict]:
+        """
+        Get the options of every point of the sweep.
+        Points with the same canonical options are only kept once, the amount removed is kept in self.duplicates.
+        Returns:
+            A list with the options of each point, in the order of the design
+        """
+        design = self.overrides()
+        points = []
+        seen = set()
+        for overrides in design:
+            point = dict(self.options, **overrides)
+            key = Configuration(point).canonical_hash
+            if key not in seen:
+                seen.add(key)
+                points.append(point)
+        self.duplicates = len(design) - len(points)
+        return points
@@ -1,15 +1,36 @@
 from datetime import datetime
 from typing import Optional
 
+from Helpers.DateTime import to_datetime
+
 
 class Timing:
     """
-    Class to hold timing data like turn around time
+    Class to hold timing data like turn around time.
+    The times are simulation timestamps in seconds since the simulation epoch.
     """
 
-    def __init__(self):
-        self.__start_time: Optional[datetime] = None
-        self.__stop_time: Optional[datetime] = None
+    # The simulation timestamp that the event chain starts at
+    SIMULATION_START: float = 0.0
+
+    def __init__(self, epoch: Optional[datetime] = None):
+        """
+        Initialize the timings
+        Args:
+            epoch: Optional datetime the simulation clock started at. Only used for reporting.
+                Will default to the time the timings were created if not provided.
+        """
+        self.__epoch: datetime = datetime.now() if epoch is None else epoch
+        self.__start_time: Optional[float] = None
+        self.__stop_time: Optional[float] = None
+
+    @property
+    def epoch(self) -> datetime:
+        """
+        Get the datetime that the simulation clock started at
+        Returns: The simulation epoch
+        """
+        return self.__epoch
 
     @property
     def turn_around_time(self) -> float:
@@ -22,24 +43,38 @@ class Timing:
             raise RuntimeError("You must start the timer before getting the turn around time")
         if self.__stop_time is None:
             raise RuntimeError("You must stop the timer before getting the turn around time")
-        # Get the time difference between the stop and start timers
-        diff = self.__stop_time - self.__start_time
-        # Get the total difference in seconds
-        return diff.total_seconds()
+        # Get the time difference between the stop and start timers in seconds
+        return self.__stop_time - self.__start_time
+
+    @property
+    def start_datetime(self) -> Optional[datetime]:
+        """
+        Get the datetime the turn around timer was started at
+        Returns: The start datetime, or None if the timer has not been started
+        """
+        return None if self.__start_time is None else to_datetime(self.__epoch, self.__start_time)
+
+    @property
+    def stop_datetime(self) -> Optional[datetime]:
+        """
+        Get the datetime the turn around timer was stopped at
+        Returns: The stop datetime, or None if the timer has not been stopped
+        """
+        return None if self.__stop_time is None else to_datetime(self.__epoch, self.__stop_time)
 
-    def start_timer(self, start_time: datetime) -> None:
+    def start_timer(self, start_time: float) -> None:
         """
         Start the turn around timer
         Args:
-            start_time: The time where the turn around starts
+            start_time: The simulation timestamp where the turn around starts
         """
         self.__start_time = start_time
 
-    def stop_timer(self, stop_time: datetime) -> None:
+    def stop_timer(self, stop_time: float) -> None:
         """
         Stop the turn around timer
         Args:
-            stop_time: The time where the simulation stops
+            stop_time: The simulation timestamp where the simulation stops
         """
         if self.__start_time is None:
             raise RuntimeError("You should start the timer before stopping it")
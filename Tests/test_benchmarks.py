@@ -0,0 +1,66 @@
+import logging
+import unittest
+
+from Benchmarks.BenchmarkRunner import BenchmarkRunner
+from Benchmarks.Cases import BENCHMARKS, benchmark_options, grid_cases
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    A class to test the benchmark suite on a tiny grid.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.grid = {
+            'station_sector_count': [8, 16],
+            'train_amount_of_sets': [2, 4],
+            'station_sector_passenger_max_count': [20],
+        }
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def test_grid_skips_trains_longer_than_the_station(self):
+        cases = list(grid_cases(self.grid))
+        self.assertEqual(3, len(cases))
+        self.assertTrue(all(c['train_amount_of_sets'] * 4 <= c['station_sector_count'] for c in cases))
+        with self.assertRaises(ValueError):
+            benchmark_options(8, 4, 20)
+
+    def test_scaled_options(self):
+        options = benchmark_options(32, 4, 50)
+        self.assertEqual(16, len(options['train_fullness']))
+        self.assertEqual(8, options['train_park_at_index'])
+        self.assertEqual([6, 25], options['station_stairs_placement'])
+
+    def test_run_all_benchmarks(self):
+        runner = BenchmarkRunner(grid={key: values[:1] for key, values in self.grid.items()}, repeat=1)
+        results = runner.run()
+        self.assertEqual(set(BENCHMARKS), {r['benchmark'] for r in results})
+        for result in results:
+            self.assertGreater(result['seconds'], 0)
+            self.assertGreater(result['peak_bytes'], 0)
+
+    def test_compare_to_baseline(self):
+        case = {'station_sector_count': 16}
+        baseline = [{'benchmark': 'application', 'case': case, 'seconds': 1.0, 'peak_bytes': 100}]
+        results = [
+            {'benchmark': 'application', 'case': case, 'seconds': 1.1, 'peak_bytes': 200},
+            {'benchmark': 'event_queue', 'case': case, 'seconds': 1.0, 'peak_bytes': 100},
+        ]
+        comparisons = BenchmarkRunner.compare(results, baseline, tolerance=0.25)
+        self.assertEqual(1, len(comparisons))
+        self.assertAlmostEqual(1.1, comparisons[0]['time_ratio'])
+        self.assertEqual(2, comparisons[0]['memory_ratio'])
+        self.assertTrue(comparisons[0]['regressed'])
+
+        self.assertFalse(BenchmarkRunner.compare(results, baseline, tolerance=1.5)[0]['regressed'])
+
+    def test_unknown_benchmark(self):
+        with self.assertRaises(ValueError):
+            BenchmarkRunner(['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
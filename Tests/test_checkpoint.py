@@ -0,0 +1,78 @@
+import logging
+import unittest
+
+import Main
+from Events.ReceiveWeightEvent import ReceiveWeightEvent
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+from Runtimes.EventRunTime import EventRunTime
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    A class to test checkpointing the event chain and resuming from the checkpoint.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None, station_have_lights=True)
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def run_to_end(self, options: dict) -> float:
+        application = ApplicationRunTime(options)
+        application.run()
+        return application.environment.timings.turn_around_time
+
+    def test_resume_matches_full_run(self):
+        """
+        Resuming from a checkpoint must give the same result as running the whole chain,
+        also for checkpoints before events that refer to sectors and train cars.
+        """
+        expected = self.run_to_end(self.options)
+        for event in [ReceiveWeightEvent, 'TrainArriveEvent', 'UnloadPassengerEvent', 'LoadPassengerEvent']:
+            with self.subTest(event=event):
+                configuration = Configuration(self.options)
+                checkpoint = EventRunTime(configuration, Environment(configuration)).run_until(event)
+                runtime = EventRunTime.from_checkpoint(checkpoint)
+                runtime.run()
+                self.assertEqual(expected, runtime.environment.timings.turn_around_time)
+
+    def test_checkpoint_is_not_changed_by_continuations(self):
+        """
+        Every continuation must start from the same state.
+        """
+        configuration = Configuration(self.options)
+        checkpoint = EventRunTime(configuration, Environment(configuration)).run_until('ReceiveWeightEvent')
+        results = []
+        for _ in range(2):
+            application = ApplicationRunTime(self.options, checkpoint=checkpoint)
+            application.run()
+            results.append(application.environment.timings.turn_around_time)
+        self.assertEqual(results[0], results[1])
+
+    def test_divergent_continuations(self):
+        """
+        A continuation with another late-stage configuration must match running that configuration from scratch.
+        """
+        configuration = Configuration(self.options)
+        checkpoint = EventRunTime(configuration, Environment(configuration)).run_until('ReceiveWeightEvent')
+        for thresholds in [{'green': .3, 'yellow': .6}, {'green': .6, 'yellow': .9}]:
+            options = dict(self.options, station_light_thresholds=thresholds)
+            application = ApplicationRunTime(options, checkpoint=checkpoint)
+            application.run()
+            self.assertEqual(self.run_to_end(options), application.environment.timings.turn_around_time)
+
+    def test_missing_event(self):
+        """
+        Running until an event that never happens must raise an error.
+        """
+        configuration = Configuration(self.options)
+        runtime = EventRunTime(configuration, Environment(configuration))
+        self.assertRaises(RuntimeError, runtime.run_until, 'UnknownEvent')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import pickle
+import unittest
+
+import Main
+from Runtimes.Configuration import Configuration
+
+
+class TestConfiguration(unittest.TestCase):
+    """
+    A class to test the immutable configuration.
+    """
+
+    def setUp(self) -> None:
+        self.options = dict(Main.options)
+        self.configuration = Configuration(self.options)
+
+    def test_configuration_is_frozen(self):
+        with self.assertRaises(AttributeError):
+            self.configuration.station_have_lights = True
+        with self.assertRaises(AttributeError):
+            self.configuration.new_attribute = 1
+        # Changing the provided options does not change the configuration
+        self.options['station_sector_count'] = 30
+        self.assertEqual(Main.options['station_sector_count'], self.configuration.station_sector_count)
+
+    def test_equality_and_hash(self):
+        same = Configuration(dict(reversed(list(Main.options.items()))))
+        other = Configuration(dict(Main.options, environment_random_seed=1))
+        self.assertEqual(self.configuration, same)
+        self.assertEqual(hash(self.configuration), hash(same))
+        self.assertNotEqual(self.configuration, other)
+        self.assertEqual({self.configuration: 1, same: 2, other: 3}, {self.configuration: 2, other: 3})
+
+    def test_derive(self):
+        derived = self.configuration.derive(station_have_lights=True, station_sector_passenger_max_count=60)
+        self.assertTrue(derived.station_have_lights)
+        self.assertEqual(60, derived.station_sector_passenger_max_count)
+        self.assertFalse(self.configuration.station_have_lights)
+        # Unchanged options are shared
+        self.assertIs(self.configuration.train_fullness, derived.train_fullness)
+        self.assertEqual(Configuration(dict(Main.options, station_have_lights=True,
+                                            station_sector_passenger_max_count=60)), derived)
+        self.assertEqual(self.configuration, derived.derive(station_have_lights=False,
+                                                            station_sector_passenger_max_count=100))
+
+    def test_derived_constants(self):
+        self.assertEqual(8, self.configuration.train_length)
+        self.assertEqual(8000, self.configuration.train_car_max_weight)
+        self.assertEqual(4000, self.configuration.green_threshold_weight)
+        self.assertEqual(6000, self.configuration.yellow_threshold_weight)
+        derived = self.configuration.derive(train_capacity=50)
+        self.assertEqual(2000, derived.green_threshold_weight)
+        self.assertEqual(8000, self.configuration.train_car_max_weight)
+
+    def test_validation(self):
+        invalid = [
+            {'station_sector_count': 0},
+            {'train_amount_of_sets': 5},
+            {'train_park_at_index': 10},
+            {'station_stairs_placement': [3, 16]},
+            {'passenger_compliance': 1.5},
+            {'passenger_store': 'tree'},
+            {'station_light_thresholds': {'green': .8, 'yellow': .5}},
+            {'train_fullness': [30, 40]},
+        ]
+        for overrides in invalid:
+            with self.subTest(overrides=overrides):
+                with self.assertRaises(ValueError):
+                    Configuration(dict(Main.options, **overrides))
+                with self.assertRaises(ValueError):
+                    self.configuration.derive(**overrides)
+        # Options that are not provided are not validated
+        Configuration({'station_sector_count': 4})
+
+    def test_pickle(self):
+        copied = pickle.loads(pickle.dumps(self.configuration))
+        self.assertEqual(self.configuration, copied)
+        self.assertEqual(self.configuration.green_threshold_weight, copied.green_threshold_weight)
+
+
+if __name__ == '__main__':
+    unittest.main()
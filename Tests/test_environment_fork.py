@@ -0,0 +1,74 @@
+import logging
+import unittest
+
+import Main
+from Components.PassengerContainer import PassengerContainer
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+
+
+class TestEnvironmentFork(unittest.TestCase):
+    """
+    A class to test forking a populated environment.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None)
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def test_fork_has_the_same_passengers(self):
+        """
+        The fork must start with the same passengers in every sector and car.
+        """
+        for store in PassengerContainer.STORES:
+            with self.subTest(store=store):
+                environment = Environment(Configuration(dict(self.options, passenger_store=store)))
+                fork = environment.fork()
+                for sector, forked in zip(environment.station.sectors, fork.station.sectors):
+                    self.assertEqual([p.id for p in sector.passengers], [p.id for p in forked.passengers])
+                for car, forked in zip(environment.train.cars, fork.train.cars):
+                    self.assertEqual([p.id for p in car.passengers], [p.id for p in forked.passengers])
+                self.assertEqual(environment.station.final_passenger_amount, fork.station.final_passenger_amount)
+                self.assertEqual(environment.train.initial_passenger_amount, fork.train.initial_passenger_amount)
+
+    def test_fork_is_independent(self):
+        """
+        Running the simulation on the fork must not change the original environment.
+        """
+        environment = Environment(Configuration(self.options))
+        waiting = environment.station.final_passenger_amount
+        ApplicationRunTime(self.options, environment=environment.fork()).run()
+        self.assertEqual(waiting, environment.station.final_passenger_amount)
+        self.assertFalse(environment.station.is_empty())
+
+    def test_fork_runs_like_the_original(self):
+        """
+        The fork and the original environment must give the same results,
+        since the random streams are copied with their state.
+        """
+        environment = Environment(Configuration(self.options))
+        fork = environment.fork()
+        original = ApplicationRunTime(self.options, environment=environment)
+        forked = ApplicationRunTime(self.options, environment=fork)
+        forked.run()
+        original.run()
+        self.assertEqual(original.record(), forked.record())
+
+    def test_fork_with_other_configuration(self):
+        """
+        The fork must use the provided configuration.
+        """
+        environment = Environment(Configuration(self.options))
+        configuration = Configuration(dict(self.options, station_have_lights=True))
+        fork = environment.fork(configuration)
+        self.assertIs(configuration, fork.configuration)
+        self.assertIs(configuration, fork.station.sectors[0].configuration)
+        self.assertIs(configuration, fork.train.cars[0].configuration)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import logging
+import unittest
+
+import Main
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.EventProfiler import EventProfiler
+
+
+class TestEventProfiler(unittest.TestCase):
+    """
+    A class to test the event profiler.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None, station_have_lights=True)
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def profile(self) -> EventProfiler:
+        application = ApplicationRunTime(self.options, profile=True)
+        application.run()
+        return application.profiler
+
+    def test_counters(self):
+        """
+        Every event except the starting event is produced by another event, and all of them are fired.
+        """
+        events = self.profile().to_dict()['events']
+        fires = sum(counters['fires'] for counters in events.values())
+        produced = sum(counters['produced'] for counters in events.values())
+        self.assertEqual(fires, produced + 1)
+        self.assertEqual(1, events['WeighTrainEvent']['fires'])
+        self.assertTrue(all(counters['seconds'] >= 0 for counters in events.values()))
+
+    def test_disabled_by_default(self):
+        application = ApplicationRunTime(self.options)
+        application.run()
+        self.assertIsNone(application.profiler)
+
+    def test_merge_and_export(self):
+        """
+        Merging must add up the counters, and the export must round trip through JSON.
+        """
+        first, second = self.profile(), self.profile()
+        total = EventProfiler.aggregate([first, second])
+        self.assertEqual(2, total.runs)
+        data = total.to_dict()
+        self.assertEqual(2 * first.to_dict()['events']['WeighTrainEvent']['fires'],
+                         data['events']['WeighTrainEvent']['fires'])
+        self.assertEqual(data, EventProfiler.from_dict(json.loads(total.to_json())).to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from typing import List
+
+from Events.Event import Event
+from Runtimes.EventQueue import EventQueue
+
+
+class DummyEvent(Event):
+    """
+    Event that does nothing, used to fill up the queue.
+    """
+
+    def __init__(self, timestamp: float, name: str):
+        super().__init__(timestamp, None)
+        self.name = name
+
+    def fire(self, environment) -> List[Event]:
+        return []
+
+
+class TestEventQueue(unittest.TestCase):
+    """
+    A class to test the event queue.
+    """
+
+    def setUp(self) -> None:
+        self.queue = EventQueue()
+        self.now = 0.0
+
+    def test_pops_in_timestamp_order(self):
+        """
+        Events must be popped with the earliest timestamp first.
+        """
+        for seconds in [5, 1, 3, 2, 4]:
+            self.queue.push(DummyEvent(self.now + seconds, str(seconds)))
+        names = [self.queue.pop().name for _ in range(len(self.queue))]
+        self.assertEqual(['1', '2', '3', '4', '5'], names)
+
+    def test_equal_timestamps_are_fifo(self):
+        """
+        Events with the same timestamp must come out in the order they were pushed.
+        """
+        self.queue.push_all([DummyEvent(self.now, str(i)) for i in range(10)])
+        self.queue.push(DummyEvent(self.now - 1, 'first'))
+        self.assertEqual('first', self.queue.peek().name)
+        names = [self.queue.pop().name for _ in range(len(self.queue))]
+        self.assertEqual(['first'] + [str(i) for i in range(10)], names)
+
+    def test_empty_queue(self):
+        """
+        Popping or peeking an empty queue raises an IndexError.
+        """
+        self.assertEqual(0, len(self.queue))
+        self.assertRaises(IndexError, self.queue.pop)
+        self.assertRaises(IndexError, self.queue.peek)
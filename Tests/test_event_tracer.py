@@ -0,0 +1,65 @@
+import logging
+import unittest
+
+import Main
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.EventTracer import TRAIN_LANE, EventTracer
+
+
+class TestEventTracer(unittest.TestCase):
+    """
+    A class to test the Chrome trace export of the event chain.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None, station_have_lights=True)
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def trace(self) -> ApplicationRunTime:
+        application = ApplicationRunTime(self.options, trace=True)
+        application.run()
+        return application
+
+    def test_timeline(self):
+        """
+        The events must be on the lane of their sector, and the timeline must end when the train is ready.
+        """
+        application = self.trace()
+        trace = application.tracer.to_chrome_trace()['traceEvents']
+        spans = [e for e in trace if e['ph'] == 'X']
+        lanes = {e['tid'] for e in trace if e['ph'] == 'M'}
+        self.assertIn(TRAIN_LANE, lanes)
+        self.assertTrue(all(e['tid'] in lanes for e in spans))
+        for span in spans:
+            if span['tid'] != TRAIN_LANE:
+                self.assertEqual(span['tid'], span['args']['sector'])
+        # Unloading always happens from a train car
+        unloading = [e for e in spans if e['name'] == 'UnloadPassengerEvent']
+        self.assertTrue(len(unloading) > 0)
+        self.assertTrue(all('car' in e['args'] for e in unloading))
+        # The turn around time runs from the arrival of the train to the end of the timeline
+        arrival = next(e['ts'] for e in spans if e['name'] == 'TrainArriveEvent')
+        end = max(e['ts'] + e['dur'] for e in spans)
+        self.assertAlmostEqual(application.environment.timings.turn_around_time, (end - arrival) / 1e6)
+
+    def test_trace_does_not_change_the_result(self):
+        traced = self.trace()
+        application = ApplicationRunTime(self.options)
+        application.run()
+        self.assertIsNone(application.tracer)
+        self.assertEqual(application.record(), traced.record())
+
+    def test_capacity(self):
+        tracer = EventTracer(capacity=0)
+        application = ApplicationRunTime(self.options)
+        application.environment.tracer = tracer
+        application.run()
+        self.assertEqual(0, len(tracer))
+        self.assertTrue(tracer.dropped > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from Runtimes.ResultStore import ResultStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestGraph(unittest.TestCase):
+    """
+    A class to test that matplotlib is only imported when a graph is drawn.
+    """
+
+    def test_cli_does_not_import_matplotlib(self):
+        code = "import sys, Main; print('matplotlib' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, stdout=subprocess.PIPE, check=True)
+        self.assertEqual('False', output.stdout.decode().strip())
+
+    def test_headless_draw_saves_figure(self):
+        metrics = ['x', 'y', 'lights']
+        samples = ResultStore(metrics)
+        for lights in [True, False]:
+            for x in range(3):
+                samples.append({'x': x, 'y': x * 2 + lights, 'lights': lights})
+        with tempfile.TemporaryDirectory() as directory:
+            code = (
+                "from Helpers.Graph.Graph import SimpleGraph\n"
+                "from Runtimes.ResultStore import ResultStore\n"
+                "samples = ResultStore.load_npz({!r})\n"
+                "SimpleGraph(samples, x_param='x', y_param='y', comparison_param='lights',\n"
+                "            file_name={!r}).draw()\n"
+                "import matplotlib\n"
+                "print(matplotlib.get_backend())\n"
+            ).format(os.path.join(directory, 'samples.npz'), os.path.join(directory, 'graph'))
+            samples.save_npz(os.path.join(directory, 'samples.npz'))
+            environment = {k: v for k, v in os.environ.items() if k not in ('DISPLAY', 'WAYLAND_DISPLAY', 'MPLBACKEND')}
+            output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=environment,
+                                    stdout=subprocess.PIPE, check=True)
+            self.assertEqual('agg', output.stdout.decode().strip().lower())
+            self.assertEqual(1, len(glob.glob(os.path.join(directory, 'graph-*.png'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Components.Station import Station
+from Events.LoadPassengerEvent import LoadPassengerEvent
+from Events.PrepareTrainEvent import PrepareTrainEvent
+from Helpers.Logging import StructuredFormatter, configure_logging, stop_logging
+from Runtimes.Configuration import Configuration
+
+
+class Description:
+    """
+    Argument of a log message that counts how many times it has been formatted
+    """
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return 'description'
+
+
+class TestLogging(unittest.TestCase):
+    """
+    A class to test the lazy, asynchronous and structured logging.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, 'test.log')
+        self.config_file = os.path.join(self.directory.name, 'logging.json')
+        with open(self.config_file, 'wt') as f:
+            json.dump({
+                'version': 1,
+                'disable_existing_loggers': False,
+                'formatters': {'simple': {'format': '%(name)s - %(levelname)s - %(message)s'}},
+                'handlers': {
+                    'file': {'class': 'logging.FileHandler', 'level': 'INFO', 'formatter': 'simple',
+                             'filename': self.log_file}
+                },
+                'root': {'level': 'INFO', 'handlers': ['file']}
+            }, f)
+
+    def tearDown(self) -> None:
+        stop_logging()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+            handler.close()
+        root.setLevel(logging.WARNING)
+        logging.disable(logging.NOTSET)
+        self.directory.cleanup()
+
+    def read_log(self):
+        with open(self.log_file, 'rt') as f:
+            return f.read().splitlines()
+
+    def test_asynchronous_logging(self):
+        """
+        The records must be written by the listener, and all be written once the logging is stopped.
+        """
+        configure_logging(self.config_file, asynchronous=True)
+        logger = logging.getLogger('TestLogging')
+        for i in range(100):
+            logger.info("Message %s", i)
+        logger.debug("Not written")
+        stop_logging()
+        lines = self.read_log()
+        self.assertEqual(100, len(lines))
+        self.assertEqual('TestLogging - INFO - Message 99', lines[-1])
+
+    def test_structured_logging(self):
+        """
+        The records must be written as JSON lines with the fields passed as extra.
+        """
+        configure_logging(self.config_file, asynchronous=True, structured=True)
+        logger = logging.getLogger('TestLogging')
+        logger.warning("Sector %s is full", 3, extra={'sector': 3})
+        try:
+            raise ValueError("failed")
+        except ValueError:
+            logger.exception("Caught")
+        stop_logging()
+        first, second = [json.loads(line) for line in self.read_log()]
+        self.assertEqual('Sector 3 is full', first['message'])
+        self.assertEqual('WARNING', first['level'])
+        self.assertEqual('TestLogging', first['logger'])
+        self.assertEqual(3, first['sector'])
+        self.assertIn('ValueError: failed', second['exception'])
+
+    def test_structured_event_fields(self):
+        """
+        The structured records of an event must carry the event, the simulated time and the sector.
+        """
+        configure_logging(self.config_file, structured=True)
+        configuration = Configuration(Main.options)
+        sector = Station(configuration, default_rng(1)).sectors[2]
+        event = LoadPassengerEvent(sector, 1, 10, configuration)
+        event.do_action(4, "Loading")
+        event.log_event()
+        records = [json.loads(line) for line in self.read_log()]
+        action, finished = [record for record in records if record['logger'] == 'LoadPassengerEvent']
+        self.assertEqual({'event': 'LoadPassengerEvent', 'sim_time': 10, 'sector': 2, 'duration': 4},
+                         {key: action[key] for key in ('event', 'sim_time', 'sector', 'duration')})
+        self.assertEqual(14, finished['sim_time'])
+        self.assertEqual(2, finished['sector'])
+        self.assertNotIn('duration', finished)
+
+    def test_structured_formatter(self):
+        record = logging.LogRecord('Event', logging.INFO, __file__, 1, "%s - %s", (1.5, 'done'), None)
+        data = json.loads(StructuredFormatter().format(record))
+        self.assertEqual({'time', 'level', 'logger', 'message'}, set(data))
+        self.assertEqual('1.5 - done', data['message'])
+
+    def test_level(self):
+        configure_logging(self.config_file, level='WARNING')
+        logging.getLogger('TestLogging').info("Not written")
+        logging.getLogger('TestLogging').warning("Written")
+        self.assertEqual(['TestLogging - WARNING - Written'], self.read_log())
+
+    def test_actions_are_formatted_lazily(self):
+        """
+        The description of an action must only be formatted if it is logged.
+        """
+        configure_logging(self.config_file, level='WARNING')
+        event = PrepareTrainEvent(0, Configuration(Main.options))
+        description = Description()
+        event.do_action(4, "Action with %s", description)
+        self.assertEqual(0, description.formatted)
+        self.assertEqual(4, event.timestamp)
+
+        logging.getLogger().setLevel(logging.INFO)
+        event.do_action(4, "Action with %s", description)
+        self.assertEqual(1, description.formatted)
+        self.assertEqual(['PrepareTrainEvent - INFO - 4 - 4 seconds: : Action with description '], self.read_log())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Components.Station import Station
+from Components.Train import Train
+from Runtimes.Configuration import Configuration
+
+
+class TestOccupancyCounters(unittest.TestCase):
+    """
+    A class to test that the train and station occupancy counters follow the passenger containers.
+    """
+
+    def setUp(self) -> None:
+        self.options = dict(Main.options)
+        self.generator = default_rng(1)
+
+    def test_station_counters(self):
+        """
+        The station must be empty exactly when every sector is empty.
+        """
+        station = Station(Configuration(self.options), self.generator)
+        self.assertEqual(sum(s.amount for s in station.sectors), station.final_passenger_amount)
+        for sector in station.sectors:
+            self.assertEqual(any(s.amount > 0 for s in station.sectors), not station.is_empty())
+            sector.remove(sector.amount)
+        self.assertTrue(station.is_empty())
+        # Populating without a generator would draw the same passengers for every new station
+        self.assertRaises(TypeError, Station, Configuration(self.options))
+        self.assertEqual(0, station.final_passenger_amount)
+        passengers = station.sectors[0].remove(1)
+        self.assertEqual([], passengers)
+        station.sectors[-1].add(3, station.configuration, self.generator)
+        self.assertFalse(station.is_empty())
+        self.assertEqual(3, station.final_passenger_amount)
+
+    def test_train_counters(self):
+        """
+        The train must be full exactly when every car is full.
+        """
+        configuration = Configuration(dict(self.options, train_fullness=range(0, 1)))
+        train = Train(configuration, self.generator)
+        capacity = configuration.train_capacity
+        self.assertEqual(0, train.final_passenger_amount)
+        for car in train.cars:
+            self.assertFalse(train.is_full())
+            car.add(capacity, configuration, self.generator)
+        self.assertTrue(train.is_full())
+        self.assertEqual(capacity * len(train.cars), train.final_passenger_amount)
+        passenger = train.cars[0].passengers[0]
+        train.cars[0].remove_passenger(passenger)
+        self.assertFalse(train.is_full())
+        train.cars[0].add(passenger)
+        self.assertTrue(train.is_full())
+
+    def test_train_index(self):
+        """
+        The train cars must be found by their car index.
+        """
+        train = Train(Configuration(self.options), self.generator)
+        for i in range(train.train_car_length):
+            self.assertEqual(i, train[i].car_index)
+        self.assertRaises(IndexError, lambda: train[-1])
+        self.assertRaises(IndexError, lambda: train[train.train_car_length])
+
+
+if __name__ == '__main__':
+    unittest.main()
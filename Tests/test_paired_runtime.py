@@ -0,0 +1,52 @@
+import logging
+import unittest
+
+import Main
+from Runtimes.PairedRunTime import PairedRunTime, run_paired
+from Runtimes.SweepRunTime import run_simulation
+
+
+class TestPairedRunTime(unittest.TestCase):
+    """
+    A class to test the paired comparison of variants with common random numbers.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None)
+        self.variants = {
+            'without': {'station_have_lights': False},
+            'with': {'station_have_lights': True}
+        }
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def test_variants_match_independent_runs(self):
+        """
+        A variant run from the shared environment must give the same result as running it on its own.
+        """
+        results = run_paired(self.options, self.variants)
+        for name, overrides in self.variants.items():
+            application = run_simulation(dict(self.options, **overrides))
+            self.assertEqual(application.environment.timings.turn_around_time, results[name])
+
+    def test_paired_differences(self):
+        """
+        The differences must be computed per replication against the baseline.
+        """
+        paired = PairedRunTime(self.options, self.variants, replications=4)
+        paired.run()
+        self.assertEqual(4, len(paired.results))
+        differences = [r['with'] - r['without'] for r in paired.results]
+        summary = paired.summary
+        self.assertAlmostEqual(sum(differences) / 4, summary['differences']['with']['mean'])
+        self.assertNotIn('without', summary['differences'])
+        self.assertEqual(4, summary['variants']['without']['count'])
+
+    def test_unknown_baseline(self):
+        self.assertRaises(ValueError, PairedRunTime, self.options, self.variants, baseline='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Components.Passenger import Passenger
+from Components.PassengerContainer import PassengerContainer
+from Runtimes.Configuration import Configuration
+
+
+class TestPassenger(unittest.TestCase):
+    """
+    A class to test the slim passenger records.
+    """
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(Main.options)
+
+    def test_passengers_have_no_attribute_dictionary(self):
+        passenger = Passenger(self.configuration, default_rng(1))
+        self.assertFalse(hasattr(passenger, '__dict__'))
+        self.assertFalse(hasattr(passenger, 'logger'))
+        with self.assertRaises(AttributeError):
+            passenger.unknown = 1
+
+    def test_sequential_ids(self):
+        first = Passenger(self.configuration, default_rng(1))
+        second = Passenger(self.configuration, default_rng(1))
+        self.assertIsInstance(first.id, int)
+        self.assertGreater(second.id, first.id)
+        self.assertEqual(5, Passenger(self.configuration, speed=1, loading_time=1, weight=80, max_walk=1, id=5).id)
+
+        container = PassengerContainer(self.configuration)
+        container.add(10, self.configuration, default_rng(1))
+        ids = [p.id for p in container.passengers]
+        self.assertTrue(all(isinstance(i, int) for i in ids))
+        self.assertEqual(list(range(ids[0], ids[0] + 10)), ids)
+
+    def test_drawing_needs_a_generator(self):
+        self.assertRaises(TypeError, Passenger, self.configuration)
+        self.assertRaises(TypeError, Passenger, self.configuration, speed=5, loading_time=4, weight=80.5)
+
+    def test_attributes(self):
+        passenger = Passenger(self.configuration, speed=5, loading_time=4, weight=80.5, max_walk=16)
+        self.assertEqual((5, 4, 80.5, 16), (passenger.speed, passenger.loading_time, passenger.weight,
+                                            passenger.max_walk))
+        self.assertEqual(self.configuration.passenger_regular_size, passenger.size)
+        self.assertIs(self.configuration, passenger.configuration)
+
+    def test_is_compliant(self):
+        never = Passenger(self.configuration.derive(passenger_compliance=0), default_rng(1))
+        always = Passenger(self.configuration.derive(passenger_compliance=1), default_rng(1))
+        generator = default_rng(2)
+        self.assertFalse(any(never.is_compliant(generator) for _ in range(100)))
+        self.assertTrue(all(always.is_compliant(generator) for _ in range(100)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Components.PassengerArray import PassengerArray
+from Components.PassengerContainer import PassengerContainer
+from Runtimes.Configuration import Configuration
+
+
+class TestPassengerContainer(unittest.TestCase):
+    """
+    A class to test the passenger container with every passenger store.
+    """
+
+    def setUp(self) -> None:
+        self.options = dict(Main.options)
+        self.generator = default_rng(1)
+
+    def create_containers(self):
+        """
+        Create an empty container for each of the passenger stores
+        """
+        for store in PassengerContainer.STORES:
+            configuration = Configuration(dict(self.options, passenger_store=store))
+            yield configuration, PassengerContainer(configuration)
+
+    def test_add_and_remove_from_front(self):
+        """
+        Passengers must be removed in the order they were added.
+        """
+        for configuration, container in self.create_containers():
+            with self.subTest(store=configuration.passenger_store):
+                container.add(10, configuration, self.generator)
+                self.assertEqual(10, container.amount)
+                ids = [p.id for p in container.passengers]
+                removed = container.remove(4)
+                self.assertEqual(ids[:4], [p.id for p in removed])
+                self.assertEqual(6, container.amount)
+                # Removing more than there are only removes the rest
+                self.assertEqual(6, len(container.remove(100)))
+                self.assertTrue(container.empty())
+
+    def test_move_between_containers(self):
+        """
+        Removed passengers can be added to another container and keep their attributes.
+        """
+        for configuration, container in self.create_containers():
+            with self.subTest(store=configuration.passenger_store):
+                other = PassengerContainer(configuration)
+                container.add(5, configuration, self.generator)
+                weights = [p.weight for p in container.passengers]
+                other.add(container.remove(3))
+                other.add(container.remove(1)[0])
+                self.assertEqual(4, other.amount)
+                self.assertEqual(1, container.amount)
+                self.assertEqual(weights[:4], [p.weight for p in other.passengers])
+
+    def test_remove_passenger(self):
+        """
+        A specific passenger can be removed from the middle of the container.
+        """
+        for configuration, container in self.create_containers():
+            with self.subTest(store=configuration.passenger_store):
+                container.add(5, configuration, self.generator)
+                passengers = list(container.passengers)
+                container.remove_passenger(passengers[2])
+                self.assertEqual([p.id for p in passengers[:2] + passengers[3:]],
+                                 [p.id for p in container.passengers])
+
+    def test_mixed_removals_keep_order(self):
+        """
+        Removing from the front and from the middle in any order must keep the remaining passengers in order.
+        """
+        for configuration, container in self.create_containers():
+            with self.subTest(store=configuration.passenger_store):
+                container.add(200, configuration, self.generator)
+                expected = [p.id for p in container.passengers]
+                for passenger in list(container.passengers)[10:150:3]:
+                    container.remove_passenger(passenger)
+                    expected.remove(passenger.id)
+                    # Removing the same passenger twice does nothing
+                    container.remove_passenger(passenger)
+                removed = container.remove(50)
+                self.assertEqual(expected[:50], [p.id for p in removed])
+                self.assertEqual(expected[50:], [p.id for p in container.passengers])
+                self.assertEqual(len(expected) - 50, container.amount)
+
+    def test_stores_draw_the_same_passengers(self):
+        """
+        Populating with the same generator must give the same passengers no matter the store.
+        """
+        self.options['passenger_speed_range'] = range(2, 9)
+        drawn = []
+        for configuration, container in self.create_containers():
+            container.add(500, configuration, default_rng(7))
+            drawn.append([(p.speed, p.loading_time, p.weight, p.max_walk) for p in container.passengers])
+        self.assertEqual(drawn[0], drawn[1])
+        self.assertGreater(len({values[0] for values in drawn[0]}), 1)
+
+    def test_array_store_returns_columns(self):
+        """
+        The array store must give the passengers as numpy columns.
+        """
+        configuration = Configuration(dict(self.options, passenger_store='array'))
+        container = PassengerContainer(configuration)
+        container.add(100, configuration, self.generator)
+        passengers = container.passengers
+        self.assertIsInstance(passengers, PassengerArray)
+        self.assertEqual(100, len(passengers.weights))
+        self.assertAlmostEqual(sum(p.weight for p in passengers), passengers.weights.sum())
+
+    def test_consecutive_adds_draw_new_passengers(self):
+        """
+        Adding twice from the same generator must not draw the same passengers again.
+        """
+        for configuration, container in self.create_containers():
+            with self.subTest(store=configuration.passenger_store):
+                container.add(5, configuration, self.generator)
+                container.add(5, configuration, self.generator)
+                weights = [p.weight for p in container.passengers]
+                self.assertNotEqual(weights[:5], weights[5:])
+
+    def test_invalid_arguments(self):
+        """
+        Adding an amount without configuration or generator, or an unknown store must fail.
+        """
+        self.assertRaises(TypeError, PassengerContainer().add, 5)
+        configuration = Configuration(self.options)
+        self.assertRaises(TypeError, PassengerContainer(configuration).add, 5, configuration)
+        # Unknown stores are already rejected when the configuration is created
+        self.assertRaises(ValueError, Configuration, dict(self.options, passenger_store='tree'))
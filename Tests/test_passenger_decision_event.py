@@ -12,7 +12,7 @@ class TestPassengerDecisionEvent(unittest.TestCase):
     """
 
     def setUp(self) -> None:
-        self.options = Main.options
+        self.options = dict(Main.options)
         self.runtime = ApplicationRuntime.ApplicationRunTime(self.options)
 
     def test_passenger_move_upon_red_light(self):
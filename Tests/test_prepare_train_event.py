@@ -9,7 +9,7 @@ class TestPrepareTrainEvent(unittest.TestCase):
     """
 
     def setUp(self) -> None:
-        self.options = Main.options
+        self.options = dict(Main.options)
         self.runtime = ApplicationRuntime.ApplicationRunTime(self.options)
 
     def test_train_leaves_full(self):
@@ -39,6 +39,8 @@ class TestPrepareTrainEvent(unittest.TestCase):
         """
         self.options['environment_random_seed'] = 10
         self.options['station_sector_count'] = 2
+        self.options['station_stairs_placement'] = [0, 1]
+        self.options['train_park_at_index'] = 0
         self.options['station_sector_fullness'] = range(100, 100)
         self.options['station_sector_passenger_max_count'] = 10
         self.options['train_capacity'] = 10
@@ -48,13 +50,12 @@ class TestPrepareTrainEvent(unittest.TestCase):
         self.options['train_unload_percent'] = range(100, 100)
         self.runtime = ApplicationRuntime.ApplicationRunTime(self.options)
 
-        self.assertTrue(
-            self.runtime.environment.station.initial_passenger_amount == 12,
-            self.runtime.environment.train.initial_passenger_amount == 20
-        )
+        environment = self.runtime.environment
+        self.assertEqual(20, environment.station.initial_passenger_amount)
+        self.assertEqual(20, environment.train.initial_passenger_amount)
+        station_ids = {p.id for sector in environment.station.sectors for p in sector.passengers}
         self.runtime.run()
-        # Amount of passengers in each instance must have been switched
-        self.assertTrue(
-            self.runtime.environment.station.initial_passenger_amount == 20,
-            self.runtime.environment.train.initial_passenger_amount == 12
-        )
+        # Every passenger has left the train, and every passenger on the platform has boarded it
+        self.assertEqual(0, environment.station.final_passenger_amount)
+        self.assertEqual(20, environment.train.final_passenger_amount)
+        self.assertEqual(station_ids, {p.id for car in environment.train.cars for p in car.passengers})
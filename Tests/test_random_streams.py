@@ -0,0 +1,42 @@
+import unittest
+
+import Main
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+from Runtimes.RandomStreams import RandomStreams
+
+
+class TestRandomStreams(unittest.TestCase):
+    """
+    A class to test the environment random streams.
+    """
+
+    def setUp(self) -> None:
+        self.options = dict(Main.options)
+
+    def test_same_seed_gives_same_streams(self):
+        """
+        Two stream trees with the same seed must draw the same numbers.
+        """
+        first, second = RandomStreams(42), RandomStreams(42)
+        for name in RandomStreams.STREAMS:
+            self.assertEqual(list(getattr(first, name).random(5)), list(getattr(second, name).random(5)))
+
+    def test_streams_are_independent(self):
+        """
+        Drawing from one stream must not change the numbers drawn from another.
+        """
+        first, second = RandomStreams(42), RandomStreams(42)
+        first.station.random(1000)
+        self.assertEqual(list(first.unloading.random(5)), list(second.unloading.random(5)))
+        self.assertNotEqual(list(first.train.random(5)), list(first.decisions.random(5)))
+
+    def test_passengers_get_different_values(self):
+        """
+        Passengers must no longer get identical values from a reseeded global state,
+        but the same seed must populate the same environment.
+        """
+        configuration = Configuration(self.options)
+        weights = [p.weight for s in Environment(configuration).station.sectors for p in s.passengers]
+        self.assertGreater(len(set(weights)), 1)
+        self.assertEqual(weights, [p.weight for s in Environment(configuration).station.sectors for p in s.passengers])
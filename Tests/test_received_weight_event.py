@@ -9,7 +9,7 @@ class TestReceivedWeightEvent(unittest.TestCase):
     """
 
     def setUp(self) -> None:
-        self.options = Main.options
+        self.options = dict(Main.options)
         self.runtime = ApplicationRuntime.ApplicationRunTime(self.options)
 
     def test_station_lights(self):
@@ -0,0 +1,84 @@
+import logging
+import unittest
+
+import numpy as np
+
+import Main
+from Helpers.RunningStatistics import RunningStatistics
+from Helpers.Statistics import t_critical_value
+from Runtimes.ReplicationRunTime import ReplicationRunTime, replication_seeds
+
+
+class TestReplicationRunTime(unittest.TestCase):
+    """
+    A class to test the replication runtime and its statistics.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None)
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def test_t_critical_value(self):
+        """
+        The critical values must match the Student's t table.
+        """
+        for degrees_of_freedom, expected in [(1, 12.706), (4, 2.776), (10, 2.228), (30, 2.042)]:
+            self.assertAlmostEqual(expected, t_critical_value(0.95, degrees_of_freedom), places=3)
+
+    def test_running_statistics(self):
+        """
+        The running statistics must match the statistics of all the values at once.
+        """
+        values = np.random.default_rng(1).normal(10, 2, 50)
+        statistics = RunningStatistics(values)
+        self.assertAlmostEqual(values.mean(), statistics.mean)
+        self.assertAlmostEqual(values.var(ddof=1), statistics.variance)
+        lower, upper = statistics.confidence_interval()
+        self.assertLess(lower, statistics.mean)
+        self.assertAlmostEqual(statistics.mean - lower, upper - statistics.mean)
+
+    def test_seeds_are_reproducible(self):
+        """
+        The seeds of the replications must only depend on the base seed.
+        """
+        self.assertEqual(replication_seeds(30, 5), replication_seeds(30, 5))
+        self.assertEqual(replication_seeds(30, 5), replication_seeds(30, 8)[:5])
+        self.assertEqual(5, len(set(replication_seeds(30, 5))))
+
+    def test_all_replications_are_run(self):
+        """
+        Without a target, every replication must be run.
+        """
+        runtime = ReplicationRunTime(self.options, replications=6)
+        runtime.run()
+        self.assertEqual(6, len(runtime.values))
+        self.assertEqual(6, runtime.summary['count'])
+        self.assertAlmostEqual(float(np.mean(runtime.values)), runtime.summary['mean'])
+
+    def test_adaptive_stopping(self):
+        """
+        With a target that is met right away, only the minimum amount of replications must be run.
+        """
+        runtime = ReplicationRunTime(self.options, replications=20, target_half_width=1e9, min_replications=3)
+        runtime.run()
+        self.assertEqual(3, len(runtime.values))
+        self.assertTrue(runtime.is_precise())
+
+    def test_batches_share_the_workers(self):
+        """
+        Running the batches on a shared pool of workers must give the same values as running them in this process.
+        """
+        single = ReplicationRunTime(self.options, replications=6, target_half_width=1e-9, min_replications=3)
+        single.run()
+        shared = ReplicationRunTime(self.options, replications=6, workers=2, target_half_width=1e-9,
+                                    min_replications=3)
+        shared.run()
+        self.assertEqual(6, len(shared.values))
+        self.assertEqual(single.values, shared.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import logging
+import os
+import tempfile
+import unittest
+
+import Main
+from Distributions.NormalDistribution import NormalDistribution
+from Runtimes.ApplicationRuntime import ApplicationRunTime
+from Runtimes.Configuration import Configuration
+from Runtimes.ResultCache import ResultCache
+from Runtimes.SweepRunTime import record_simulation
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    A class to test the configuration hash and the result cache.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.options = dict(Main.options, train_park_at_index=None)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def result_path(self, key: str) -> str:
+        """
+        Get the path of the file of a cached result
+        Args:
+            key: The key of the result
+        """
+        names = [n for n in os.listdir(self.directory.name) if n.endswith('-{}{}'.format(key, ResultCache.SUFFIX))]
+        self.assertEqual(1, len(names))
+        return os.path.join(self.directory.name, names[0])
+
+    def test_canonical_hash(self):
+        """
+        The hash must only depend on the option values.
+        """
+        configuration = Configuration(self.options)
+        reordered = Configuration(dict(reversed(list(self.options.items()))))
+        self.assertEqual(configuration.canonical_hash, reordered.canonical_hash)
+        # Equal distributions give the same hash, other parameters do not
+        same = Configuration(dict(self.options, passenger_weight_distribution=NormalDistribution(80, 10)))
+        other = Configuration(dict(self.options, passenger_weight_distribution=NormalDistribution(80, 11)))
+        self.assertEqual(configuration.canonical_hash, same.canonical_hash)
+        self.assertNotEqual(configuration.canonical_hash, other.canonical_hash)
+        seed = Configuration(dict(self.options, environment_random_seed=31))
+        self.assertNotEqual(configuration.canonical_hash, seed.canonical_hash)
+
+    def test_cached_run_is_not_simulated(self):
+        """
+        The second run of the same configuration must come from the cache with the same metrics.
+        """
+        cache = ResultCache(self.directory.name)
+        first = ApplicationRunTime(self.options, cache=cache)
+        first.run()
+        self.assertFalse(first.cached)
+
+        second = ApplicationRunTime(dict(self.options), cache=cache)
+        second.run()
+        self.assertTrue(second.cached)
+        self.assertEqual(first.record(), second.record())
+        self.assertEqual(first.record(), record_simulation(self.options, cache=cache))
+
+    def test_cached_run_has_no_environment(self):
+        """
+        A run answered by the cache must not simulate a fresh environment for metrics that are not cached.
+        """
+        cache = ResultCache(self.directory.name)
+        metrics = ['environment.timings.turn_around_time']
+        ApplicationRunTime(self.options, cache=cache, metrics=metrics).run()
+        cached = ApplicationRunTime(self.options, cache=cache, metrics=metrics)
+        cached.run()
+        self.assertTrue(cached.cached)
+        with self.assertRaises(KeyError):
+            cached.record(metrics + ['environment.station.final_passenger_amount'])
+        with self.assertRaises(RuntimeError):
+            _ = cached.environment
+
+    def test_least_recently_used_are_evicted(self):
+        """
+        When the cache grows too large, the least recently used results must be removed first.
+        """
+        cache = ResultCache(self.directory.name)
+        record = {'value': 1.0}
+        for second, key in enumerate(['a', 'b', 'c'], start=1):
+            cache.put(key, record)
+            # Explicit modification times, so the order does not depend on the timestamp resolution
+            os.utime(self.result_path(key), ns=(second * 10 ** 9, second * 10 ** 9))
+        # Use the oldest result, so 'b' becomes the least recently used
+        self.assertEqual(record, cache.get('a'))
+        cache.max_bytes = cache.size - 1
+        cache.put('c', record)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_size_stays_within_maximum(self):
+        """
+        Writing many results to a full cache must keep it within the maximum size.
+        """
+        cache = ResultCache(self.directory.name)
+        cache.put('a', {'value': 1.0})
+        cache.max_bytes = 3 * cache.size
+        for index in range(20):
+            cache.put(str(index), {'value': float(index)})
+            self.assertLessEqual(cache.size, cache.max_bytes)
+        self.assertIn('19', cache)
+
+    def test_incomplete_record_is_a_miss(self):
+        """
+        A cached result without all the requested metrics must not be used.
+        """
+        cache = ResultCache(self.directory.name)
+        cache.put('a', {'value': 1})
+        self.assertIsNone(cache.get('a', ['value', 'other']))
+        self.assertEqual(0, len([n for n in os.listdir(self.directory.name) if n.endswith('.tmp')]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import logging
+import os
+import tempfile
+import unittest
+
+import Main
+from Runtimes.ResultStore import DEFAULT_METRICS, ResultStore
+from Runtimes.SweepRunTime import SweepRunTime, record_simulation, run_simulation
+
+
+class TestResultStore(unittest.TestCase):
+    """
+    A class to test the columnar result store.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.points = [
+            dict(Main.options, station_have_lights=lights, train_park_at_index=None)
+            for lights in [True, False]
+        ]
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    def test_records_match_the_application(self):
+        """
+        The recorded metrics must be the same values as found on the runtime.
+        """
+        application = run_simulation(self.points[0])
+        store = ResultStore()
+        store.add_application(application)
+        self.assertEqual(1, len(store))
+        self.assertEqual(application.environment.timings.turn_around_time,
+                         store['environment.timings.turn_around_time'][0])
+        self.assertEqual(application.environment.train.final_passenger_amount,
+                         store['environment.train.final_passenger_amount'][0])
+
+    def test_sweep_records(self):
+        """
+        The store must have a row per point in the order of the points.
+        """
+        store = ResultStore()
+        store.extend(record for _, record in SweepRunTime(self.points, workers=1, task=record_simulation).iterate())
+        self.assertEqual(len(self.points), len(store))
+        self.assertEqual([True, False], store['configuration.station_have_lights'].tolist())
+
+    def test_save_and_load(self):
+        """
+        Saving the store must keep every column.
+        """
+        store = ResultStore()
+        store.extend(record_simulation(point) for point in self.points)
+        with tempfile.TemporaryDirectory() as directory:
+            npz = os.path.join(directory, 'results.npz')
+            store.save(npz)
+            loaded = ResultStore.load_npz(npz)
+            self.assertEqual(DEFAULT_METRICS, loaded.metrics)
+            self.assertEqual(list(store), list(loaded))
+
+            csv = os.path.join(directory, 'results.csv')
+            store.save(csv)
+            with open(csv) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(','.join(DEFAULT_METRICS), lines[0])
+            self.assertEqual(len(self.points) + 1, len(lines))
+
+    def test_missing_metric(self):
+        """
+        A record without all the metrics must be rejected without changing the store.
+        """
+        store = ResultStore(['a', 'b'])
+        self.assertRaises(KeyError, store.append, {'a': 1})
+        self.assertEqual(0, len(store))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import logging
+import os
+import tempfile
+import unittest
+
+import Main
+from Runtimes.ResumableSweepRunTime import ResumableSweepRunTime
+from Runtimes.SweepJournal import SweepJournal
+from Runtimes.SweepRunTime import record_simulation
+
+# The points run by the counting task in this process
+RUN = []
+
+
+def counting_task(options: dict) -> dict:
+    """
+    Sweep task that records which points have been run
+    """
+    RUN.append(options['station_sector_passenger_max_count'])
+    return record_simulation(options, metrics=['environment.timings.turn_around_time'])
+
+
+class TestResumableSweep(unittest.TestCase):
+    """
+    A class to test the sweep journal and resuming interrupted sweeps.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        RUN.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, 'sweep.jsonl')
+        self.points = [dict(Main.options, station_sector_passenger_max_count=count) for count in [30, 60, 90]]
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
+        self.directory.cleanup()
+
+    def run_sweep(self, points, resume=True) -> ResumableSweepRunTime:
+        with SweepJournal(self.file_name, resume=resume) as journal:
+            sweep = ResumableSweepRunTime(points, journal, workers=1, task=counting_task)
+            sweep.run()
+        return sweep
+
+    def test_resume_skips_completed_points(self):
+        first = self.run_sweep(self.points[:2])
+        self.assertEqual([30, 60], RUN)
+        RUN.clear()
+
+        second = self.run_sweep(self.points)
+        self.assertEqual([90], RUN)
+        self.assertEqual(2, second.resumed)
+        self.assertEqual(first.results, second.results[:2])
+        self.assertEqual(3, len(second.results))
+
+    def test_start_over(self):
+        self.run_sweep(self.points[:1])
+        RUN.clear()
+        self.run_sweep(self.points[:1], resume=False)
+        self.assertEqual([30], RUN)
+        with SweepJournal(self.file_name) as journal:
+            self.assertEqual(1, len(journal))
+
+    def test_partial_line_is_dropped(self):
+        self.run_sweep(self.points[:2])
+        # Simulate an interruption in the middle of writing a line
+        with open(self.file_name, 'ab') as f:
+            f.write(b'{"version":1,"key":"abc","rec')
+        RUN.clear()
+        sweep = self.run_sweep(self.points)
+        self.assertEqual([90], RUN)
+        with open(self.file_name, 'rb') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertTrue(all(record is not None for record in sweep.results))
+
+    def test_duplicate_points_run_once(self):
+        sweep = self.run_sweep([self.points[0], self.points[1], dict(self.points[0])])
+        self.assertEqual([30, 60], RUN)
+        self.assertEqual(sweep.results[0], sweep.results[2])
+
+    def test_records_are_synced_in_batches(self):
+        with SweepJournal(self.file_name, sync_every=2, sync_interval=3600) as journal:
+            journal.append('a', {'value': 1})
+            journal.append('b', {'value': 2})
+            journal.append('c', {'value': 3})
+            # Every record is flushed as soon as it is written, even before it is synced
+            with open(self.file_name, 'rb') as f:
+                self.assertEqual(3, len(f.read().splitlines()))
+        with SweepJournal(self.file_name) as journal:
+            self.assertEqual({'value': 3}, journal.get('c'))
+            self.assertIn('a', journal)
+
+
+if __name__ == '__main__':
+    unittest.main()
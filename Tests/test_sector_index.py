@@ -0,0 +1,67 @@
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Components.LightStatus import LightStatus
+from Components.Station import Station
+from Runtimes.Configuration import Configuration
+
+
+class TestSectorIndex(unittest.TestCase):
+    """
+    A class to test the shared sector distance index.
+    """
+
+    def setUp(self) -> None:
+        self.station = Station(Configuration(dict(Main.options)), default_rng(1))
+        self.sectors = self.station.sectors
+        statuses = [None, LightStatus.RED, LightStatus.YELLOW, LightStatus.GREEN]
+        generator = default_rng(3)
+        for sector in self.sectors:
+            sector.light.status = statuses[generator.integers(0, len(statuses))]
+        self.station.update_distance_index()
+        self.index = self.station.distance_index
+
+    def brute_force(self, sector, distance, status):
+        """
+        The sectors within the distance with the status, ordered by distance and left before right
+        """
+        found = [
+            s for s in self.sectors
+            if s.light.status == status and 1 <= abs(s.sector_index - sector.sector_index) < int(distance)
+        ]
+        return sorted(found, key=lambda s: (abs(s.sector_index - sector.sector_index), s.sector_index))
+
+    def test_queries_match_brute_force(self):
+        """
+        All the queries must give the same answer as looking at every sector.
+        """
+        for sector in self.sectors:
+            for distance in [0, 1, 2, 3.5, 7, 20]:
+                for status in [LightStatus.RED, LightStatus.YELLOW, LightStatus.GREEN]:
+                    expected = self.brute_force(sector, distance, status)
+                    self.assertEqual(expected, self.index.get_sectors_within_distance(sector, distance, status))
+                    self.assertEqual(len(expected) > 0, self.index.has_sector_within_distance(sector, distance, status))
+                    self.assertIs(expected[0] if expected else None,
+                                  self.index.get_sector_within_distance(sector, distance, status))
+
+    def test_both_statuses_at_same_distance(self):
+        """
+        Two sectors with different statuses at the same distance must both be found.
+        """
+        for sector, status in zip(self.sectors[0:3], [LightStatus.GREEN, LightStatus.RED, LightStatus.YELLOW]):
+            sector.light.status = status
+        self.station.update_distance_index()
+        index = self.station.distance_index
+        self.assertIs(self.sectors[0], index.get_sector_within_distance(self.sectors[1], 2, LightStatus.GREEN))
+        self.assertIs(self.sectors[2], index.get_sector_within_distance(self.sectors[1], 2, LightStatus.YELLOW))
+
+    def test_nearest_with_predicate(self):
+        """
+        The nearest sector matching a predicate is found, preferring the left one on a tie.
+        """
+        target = self.sectors[8]
+        found = self.index.get_nearest_with(target, lambda s: s.sector_index in (6, 10, 11))
+        self.assertIs(self.sectors[6], found)
+        self.assertIsNone(self.index.get_nearest_with(target, lambda s: False))
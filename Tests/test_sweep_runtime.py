@@ -0,0 +1,57 @@
+import logging
+import unittest
+
+import Main
+from Runtimes.SweepRunTime import SweepRunTime
+
+
+def turn_around_time(options: dict) -> float:
+    """
+    Sweep task that only returns the turn around time of the simulation
+    """
+    from Runtimes.SweepRunTime import run_simulation
+    return run_simulation(options).environment.timings.turn_around_time
+
+
+class TestSweepRunTime(unittest.TestCase):
+    """
+    A class to test the sweep runtime.
+    """
+
+    def setUp(self) -> None:
+        logging.disable()
+        self.points = [
+            dict(Main.options, station_have_lights=lights, station_sector_passenger_max_count=count)
+            for lights in [True, False] for count in [30, 60, 90]
+        ]
+
+    def test_serial_sweep_keeps_point_order(self):
+        """
+        The results of the sweep must be ordered as the points.
+        """
+        sweep = SweepRunTime(self.points, workers=1)
+        sweep.run()
+        self.assertEqual(len(self.points), len(sweep.results))
+        for point, result in zip(self.points, sweep.results):
+            self.assertEqual(point['station_have_lights'], result.configuration.station_have_lights)
+
+    def test_parallel_sweep_matches_serial_sweep(self):
+        """
+        Running the sweep in worker processes must give the same results as running it serially.
+        """
+        serial = SweepRunTime(self.points, workers=1, task=turn_around_time)
+        serial.run()
+        parallel = SweepRunTime(self.points, workers=2, chunk_size=2, ordered=False, task=turn_around_time)
+        parallel.run()
+        self.assertEqual(serial.results, parallel.results)
+
+    def test_points_are_copied(self):
+        """
+        Changing the options after creating the sweep must not change the sweep.
+        """
+        sweep = SweepRunTime(self.points, workers=1)
+        self.points[0]['station_have_lights'] = 'changed'
+        self.assertTrue(sweep.points[0]['station_have_lights'])
+
+    def tearDown(self) -> None:
+        logging.disable(logging.NOTSET)
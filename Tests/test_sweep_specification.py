@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Distributions.NormalDistribution import NormalDistribution
+from Helpers.ExperimentDesigns import latin_hypercube
+from Helpers.Factor import Factor
+from Runtimes.SweepSpecification import SweepSpecification, decode_option
+
+
+class TestSweepSpecification(unittest.TestCase):
+    """
+    A class to test the sweep specification files and their designs.
+    """
+
+    def test_grid_matches_nested_loops(self):
+        specification = SweepSpecification.from_dict({
+            'parameters': {'station_have_lights': [True, False], 'station_sector_passenger_max_count': [30, 60, 90]}
+        }, defaults=Main.options)
+        points = specification.points()
+        expected = [(lights, count) for lights in [True, False] for count in [30, 60, 90]]
+        self.assertEqual(expected, [(p['station_have_lights'], p['station_sector_passenger_max_count']) for p in points])
+        self.assertEqual(Main.options['train_fullness'], points[0]['train_fullness'])
+
+    def test_duplicate_points_are_removed(self):
+        specification = SweepSpecification.from_dict({
+            'parameters': {'station_sector_passenger_max_count': [30, 60, 30], 'station_stair_factor': [1.5, 1.5]}
+        }, defaults=Main.options)
+        self.assertEqual(2, len(specification.points()))
+        self.assertEqual(4, specification.duplicates)
+
+    def test_latin_hypercube_covers_every_stratum(self):
+        factors = [Factor('a', low=0, high=10), Factor('b', levels=list(range(10)))]
+        points = latin_hypercube(factors, 10, default_rng(1))
+        self.assertEqual(list(range(10)), sorted(int(p['a']) for p in points))
+        self.assertEqual(list(range(10)), sorted(p['b'] for p in points))
+
+    def test_sampling_designs_are_reproducible(self):
+        for design in ['random', 'latin_hypercube']:
+            data = {
+                'parameters': {'station_sector_passenger_max_count': {'min': 30, 'max': 90, 'integer': True},
+                               'passenger_compliance': {'min': 0.5, 'max': 1}},
+                'design': design, 'samples': 8, 'seed': 3
+            }
+            first = SweepSpecification.from_dict(data, Main.options).points()
+            second = SweepSpecification.from_dict(data, Main.options).points()
+            self.assertEqual(first, second)
+            for point in first:
+                self.assertIsInstance(point['station_sector_passenger_max_count'], int)
+                self.assertTrue(30 <= point['station_sector_passenger_max_count'] <= 90)
+                self.assertTrue(0.5 <= point['passenger_compliance'] < 1)
+
+    def test_one_at_a_time(self):
+        specification = SweepSpecification.from_dict({
+            'parameters': {'station_sector_passenger_max_count': [50, 100], 'station_have_lights': [True, False]},
+            'design': 'one_at_a_time'
+        }, defaults=Main.options)
+        points = specification.points()
+        # The baseline, the other capacity and the lights
+        self.assertEqual(3, len(points))
+        self.assertEqual(Main.options['station_sector_passenger_max_count'], points[0]['station_sector_passenger_max_count'])
+        changed = [{k for k in p if p[k] != Main.options[k]} for p in points]
+        self.assertEqual([set(), {'station_sector_passenger_max_count'}, {'station_have_lights'}], changed)
+
+    def test_grid_needs_levels(self):
+        specification = SweepSpecification.from_dict({'parameters': {'passenger_compliance': {'min': 0, 'max': 1}}})
+        with self.assertRaises(ValueError):
+            specification.points()
+        levels = Factor.from_spec('station_sector_passenger_max_count', {'min': 30, 'max': 90, 'integer': True, 'levels': 4})
+        self.assertEqual([30, 50, 70, 90], levels.levels)
+
+    def test_invalid_specifications(self):
+        with self.assertRaises(ValueError):
+            SweepSpecification({}, [], design='unknown')
+        with self.assertRaises(ValueError):
+            SweepSpecification({}, [], design='random')
+        with self.assertRaises(ValueError):
+            Factor.from_spec('a', {'min': 1})
+
+    def test_decode_options(self):
+        distribution = decode_option({'distribution': 'NormalDistribution', 'parameters': {'mean': 80, 'scale': 10}})
+        self.assertIsInstance(distribution, NormalDistribution)
+        self.assertEqual({'mean': 80, 'scale': 10}, distribution.parameters)
+        self.assertEqual(range(20, 30), decode_option({'range': [20, 30, 1]}))
+        self.assertEqual({'green': .5, 'yellow': .75}, decode_option({'green': .5, 'yellow': .75}))
+
+    def test_load_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'sweep.json')
+            with open(file_name, 'wt') as f:
+                json.dump({
+                    'options': {'station_sector_fullness': {'range': [40, 50, 1]}},
+                    'parameters': {'environment_random_seed': [1, 2]}
+                }, f)
+            points = SweepSpecification.load(file_name, Main.options).points()
+        self.assertEqual(2, len(points))
+        self.assertEqual(range(40, 50), points[0]['station_sector_fullness'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from datetime import datetime, timedelta
+
+from Runtimes.Timing import Timing
+
+
+class TestTiming(unittest.TestCase):
+    """
+    A class to test the simulation timings.
+    """
+
+    def setUp(self) -> None:
+        self.epoch = datetime(2019, 11, 1, 8, 0, 0)
+        self.timings = Timing(self.epoch)
+
+    def test_turn_around_time_in_seconds(self):
+        """
+        The turn around time is the difference between the float timestamps.
+        """
+        self.timings.start_timer(10.5)
+        self.timings.stop_timer(112.5)
+        self.assertEqual(102.0, self.timings.turn_around_time)
+
+    def test_datetimes_are_relative_to_epoch(self):
+        """
+        The datetimes are only computed when reporting, relative to the epoch.
+        """
+        self.assertIsNone(self.timings.start_datetime)
+        self.timings.start_timer(60)
+        self.assertEqual(self.epoch + timedelta(minutes=1), self.timings.start_datetime)
+
+    def test_turn_around_time_requires_timers(self):
+        """
+        Getting the turn around time before the timers are set must fail.
+        """
+        with self.assertRaises(RuntimeError):
+            _ = self.timings.turn_around_time
+        self.assertRaises(RuntimeError, self.timings.stop_timer, 1.0)
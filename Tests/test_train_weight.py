@@ -0,0 +1,87 @@
+import unittest
+
+from numpy.random import default_rng
+
+import Main
+from Components.PassengerContainer import PassengerContainer
+from Events.WeighTrainEvent import WeighTrainEvent
+from Runtimes.Configuration import Configuration
+from Runtimes.Environment import Environment
+
+
+class TestTrainWeight(unittest.TestCase):
+    """
+    A class to test that the train car weights are kept up to date with every passenger store.
+    """
+
+    def setUp(self) -> None:
+        self.options = dict(Main.options)
+
+    def create_environments(self):
+        """
+        Create an environment for each of the passenger stores
+        """
+        for store in PassengerContainer.STORES:
+            configuration = Configuration(dict(self.options, passenger_store=store))
+            yield configuration, Environment(configuration)
+
+    def assert_weights(self, train) -> None:
+        """
+        Assert that the car weights match the weights of their passengers, and the train weight the car weights
+        """
+        for car in train.cars:
+            self.assertAlmostEqual(sum(p.weight for p in car.passengers), car.weight)
+        self.assertAlmostEqual(sum(car.weight for car in train.cars), train.weight)
+
+    def test_populated_weight(self):
+        """
+        The weight of the populated train is the weight of its passengers.
+        """
+        for configuration, environment in self.create_environments():
+            with self.subTest(store=configuration.passenger_store):
+                self.assertGreater(environment.train.weight, 0)
+                self.assert_weights(environment.train)
+
+    def test_weight_follows_passengers(self):
+        """
+        Adding and removing passengers changes the weight of the car.
+        """
+        for configuration, environment in self.create_environments():
+            with self.subTest(store=configuration.passenger_store):
+                car = environment.train.cars[0]
+                removed = car.remove(3)
+                self.assert_weights(environment.train)
+                car.add(removed)
+                car.add(5, configuration, default_rng(1))
+                self.assert_weights(environment.train)
+                car.remove_passenger(next(iter(car.passengers)))
+                self.assert_weights(environment.train)
+                car.remove(car.amount)
+                self.assertEqual(0, car.weight)
+
+    def test_weigh_twice(self):
+        """
+        Weighing the train again does not count the passengers twice.
+        """
+        for configuration, environment in self.create_environments():
+            with self.subTest(store=configuration.passenger_store):
+                weights = [car.weight for car in environment.train.cars]
+                WeighTrainEvent(0, configuration)(environment)
+                WeighTrainEvent(0, configuration, is_final=True)(environment)
+                self.assertEqual(weights, [car.weight for car in environment.train.cars])
+                self.assert_weights(environment.train)
+
+    def test_copied_weight(self):
+        """
+        A copied train has the weight of the original train.
+        """
+        for configuration, environment in self.create_environments():
+            with self.subTest(store=configuration.passenger_store):
+                copy = Environment(configuration)
+                copy.train.cars[0].remove(copy.train.cars[0].amount)
+                copy.train.copy_from(environment.train)
+                self.assertEqual(environment.train.weight, copy.train.weight)
+
+
+if __name__ == '__main__':
+    unittest.main()